@@ -56,10 +56,14 @@ ac_table = {
             '--identity',
             '--workspace-id',
             '--static-routing-table',
+            '--compact-routing-table',
+            '--balance-grpc-replicas',
+            '--grpc-channels',
             '--routing-table',
             '--zmq-identity',
             '--port-ctrl',
             '--ctrl-with-ipc',
+            '--shared-memory',
             '--timeout-ctrl',
             '--ssh-server',
             '--ssh-keyfile',
@@ -68,6 +72,7 @@ ac_table = {
             '--uses-with',
             '--uses-metas',
             '--uses-requests',
+            '--uses-dynamic-batching',
             '--py-modules',
             '--port-in',
             '--port-out',
@@ -77,6 +82,8 @@ ac_table = {
             '--socket-in',
             '--socket-out',
             '--memory-hwm',
+            '--max-inflight',
+            '--threads',
             '--on-error-strategy',
             '--native',
             '--num-part',
@@ -115,6 +122,9 @@ ac_table = {
             '--quiet-error',
             '--workspace-id',
             '--static-routing-table',
+            '--compact-routing-table',
+            '--balance-grpc-replicas',
+            '--grpc-channels',
             '--routing-table',
             '--uses',
             '--env',
@@ -132,10 +142,14 @@ ac_table = {
             '--identity',
             '--workspace-id',
             '--static-routing-table',
+            '--compact-routing-table',
+            '--balance-grpc-replicas',
+            '--grpc-channels',
             '--routing-table',
             '--zmq-identity',
             '--port-ctrl',
             '--ctrl-with-ipc',
+            '--shared-memory',
             '--timeout-ctrl',
             '--ssh-server',
             '--ssh-keyfile',
@@ -144,6 +158,7 @@ ac_table = {
             '--uses-with',
             '--uses-metas',
             '--uses-requests',
+            '--uses-dynamic-batching',
             '--py-modules',
             '--port-in',
             '--port-out',
@@ -153,6 +168,8 @@ ac_table = {
             '--socket-in',
             '--socket-out',
             '--memory-hwm',
+            '--max-inflight',
+            '--threads',
             '--on-error-strategy',
             '--native',
             '--num-part',
@@ -163,6 +180,9 @@ ac_table = {
             '--dump-path',
             '--prefetch',
             '--prefetch-on-recv',
+            '--adaptive-prefetch',
+            '--response-cache',
+            '--response-cache-bytes',
             '--title',
             '--description',
             '--cors',
@@ -214,10 +234,14 @@ ac_table = {
             '--identity',
             '--workspace-id',
             '--static-routing-table',
+            '--compact-routing-table',
+            '--balance-grpc-replicas',
+            '--grpc-channels',
             '--routing-table',
             '--zmq-identity',
             '--port-ctrl',
             '--ctrl-with-ipc',
+            '--shared-memory',
             '--timeout-ctrl',
             '--ssh-server',
             '--ssh-keyfile',
@@ -226,6 +250,7 @@ ac_table = {
             '--uses-with',
             '--uses-metas',
             '--uses-requests',
+            '--uses-dynamic-batching',
             '--py-modules',
             '--port-in',
             '--port-out',
@@ -235,6 +260,8 @@ ac_table = {
             '--socket-in',
             '--socket-out',
             '--memory-hwm',
+            '--max-inflight',
+            '--threads',
             '--on-error-strategy',
             '--native',
             '--num-part',
@@ -274,10 +301,14 @@ ac_table = {
             '--identity',
             '--workspace-id',
             '--static-routing-table',
+            '--compact-routing-table',
+            '--balance-grpc-replicas',
+            '--grpc-channels',
             '--routing-table',
             '--zmq-identity',
             '--port-ctrl',
             '--ctrl-with-ipc',
+            '--shared-memory',
             '--timeout-ctrl',
             '--ssh-server',
             '--ssh-keyfile',
@@ -286,6 +317,7 @@ ac_table = {
             '--uses-with',
             '--uses-metas',
             '--uses-requests',
+            '--uses-dynamic-batching',
             '--py-modules',
             '--port-in',
             '--port-out',
@@ -295,6 +327,8 @@ ac_table = {
             '--socket-in',
             '--socket-out',
             '--memory-hwm',
+            '--max-inflight',
+            '--threads',
             '--on-error-strategy',
             '--native',
             '--num-part',
@@ -60,7 +60,7 @@ __version__ = '2.0.24'
 
 # do not change this line manually
 # this is managed by proto/build-proto.sh and updated on every execution
-__proto_version__ = '0.0.86'
+__proto_version__ = '0.0.97'
 
 __uptime__ = _datetime.datetime.now().isoformat()
 
@@ -70,6 +70,8 @@ __uptime__ = _datetime.datetime.now().isoformat()
 # 3. copy all lines EXCEPT the first (which is the grep command in the last line)
 __jina_env__ = (
     'JINA_ARRAY_QUANT',
+    'JINA_COMPRESS_BANDWIDTH',
+    'JINA_COMPRESS_DICTIONARY',
     'JINA_CONTROL_PORT',
     'JINA_DEFAULT_HOST',
     'JINA_DISABLE_UVLOOP',
@@ -86,6 +88,9 @@ __jina_env__ = (
     'JINA_POD_NAME',
     'JINA_RANDOM_PORT_MAX',
     'JINA_RANDOM_PORT_MIN',
+    'JINA_REQUEST_QUANT',
+    'JINA_SHM_MIN_BYTES',
+    'JINA_TENSOR_FRAME_MIN_BYTES',
     'JINA_VCS_VERSION',
     'JINA_MP_START_METHOD',
 )
@@ -18,6 +18,7 @@ class PostMixin:
         on_always: CallbackFnType = None,
         parameters: Optional[Dict] = None,
         target_peapod: Optional[str] = None,
+        timeout: Optional[float] = None,
         request_size: int = 100,
         show_progress: bool = False,
         continue_on_error: bool = False,
@@ -33,6 +34,7 @@ class PostMixin:
         :param on_always: the function to be called when the :class:`Request` object is  is either resolved or rejected.
         :param parameters: the kwargs that will be sent to the executor
         :param target_peapod: a regex string. Only matching Executors will process the request.
+        :param timeout: if set, the seconds a request may take from being generated, after which the Flow passes it on without calling any further Executor and rejects it with the status `DEADLINE_EXCEEDED`.
         :param request_size: the number of Documents per request. <=0 means all inputs in one request.
         :param show_progress: if set, client will show a progress bar on receiving every request.
         :param continue_on_error: if set, a Request that causes callback error will be logged only without blocking the further requests.
@@ -65,6 +67,7 @@ class PostMixin:
             on_always=on_always,
             exec_endpoint=on,
             target_peapod=target_peapod,
+            timeout=timeout,
             parameters=parameters,
             request_size=request_size,
             **kwargs,
@@ -89,6 +92,7 @@ class AsyncPostMixin:
         on_always: CallbackFnType = None,
         parameters: Optional[Dict] = None,
         target_peapod: Optional[str] = None,
+        timeout: Optional[float] = None,
         request_size: int = 100,
         show_progress: bool = False,
         continue_on_error: bool = False,
@@ -103,6 +107,7 @@ class AsyncPostMixin:
         :param on_always: the function to be called when the :class:`Request` object is  is either resolved or rejected.
         :param parameters: the kwargs that will be sent to the executor
         :param target_peapod: a regex string. Only matching Executors will process the request.
+        :param timeout: if set, the seconds a request may take from being generated, after which the Flow passes it on without calling any further Executor and rejects it with the status `DEADLINE_EXCEEDED`.
         :param request_size: the number of Documents per request. <=0 means all inputs in one request.
         :param show_progress: if set, client will show a progress bar on receiving every request.
         :param continue_on_error: if set, a Request that causes callback error will be logged only without blocking the further requests.
@@ -119,6 +124,7 @@ class AsyncPostMixin:
             on_always=on_always,
             exec_endpoint=on,
             target_peapod=target_peapod,
+            timeout=timeout,
             parameters=parameters,
             request_size=request_size,
             **kwargs,
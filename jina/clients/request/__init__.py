@@ -29,6 +29,7 @@ def request_generator(
     data_type: DataInputType = DataInputType.AUTO,
     target_peapod: Optional[str] = None,
     parameters: Optional[Dict] = None,
+    timeout: Optional[float] = None,
     **kwargs,  # do not remove this, add on purpose to suppress unknown kwargs
 ) -> Iterator['Request']:
     """Generate a request iterator.
@@ -40,6 +41,8 @@ def request_generator(
             or an iterator over possible Document content (set to text, blob and buffer).
     :param parameters: a dictionary of parameters to be sent to the executor
     :param target_peapod: a regex string. Only matching Executors will process the request.
+    :param timeout: if set, the seconds a request may take from being generated, after which the Flow passes it on
+        without calling any further Executor and returns it with the status `DEADLINE_EXCEEDED`
     :param kwargs: additional arguments
     :yield: request
     """
@@ -50,7 +53,10 @@ def request_generator(
         if data is None:
             # this allows empty inputs, i.e. a data request with only parameters
             yield _new_data_request(
-                endpoint=exec_endpoint, target=target_peapod, parameters=parameters
+                endpoint=exec_endpoint,
+                target=target_peapod,
+                parameters=parameters,
+                timeout=timeout,
             )
         else:
             if not isinstance(data, Iterable):
@@ -63,6 +69,7 @@ def request_generator(
                     endpoint=exec_endpoint,
                     target=target_peapod,
                     parameters=parameters,
+                    timeout=timeout,
                 )
 
     except Exception as ex:
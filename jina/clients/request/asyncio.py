@@ -17,6 +17,7 @@ async def request_generator(
     data_type: DataInputType = DataInputType.AUTO,
     target_peapod: Optional[str] = None,
     parameters: Optional[Dict] = None,
+    timeout: Optional[float] = None,
     **kwargs,  # do not remove this, add on purpose to suppress unknown kwargs
 ) -> AsyncIterator['Request']:
     """An async :function:`request_generator`.
@@ -28,6 +29,8 @@ async def request_generator(
             or an iterator over possible Document content (set to text, blob and buffer).
     :param parameters: the kwargs that will be sent to the executor
     :param target_peapod: a regex string. Only matching Executors will process the request.
+    :param timeout: if set, the seconds a request may take from being generated, after which the Flow passes it on
+        without calling any further Executor and returns it with the status `DEADLINE_EXCEEDED`
     :param kwargs: additional arguments
     :yield: request
     """
@@ -38,7 +41,10 @@ async def request_generator(
         if data is None:
             # this allows empty inputs, i.e. a data request with only parameters
             yield _new_data_request(
-                endpoint=exec_endpoint, target=target_peapod, parameters=parameters
+                endpoint=exec_endpoint,
+                target=target_peapod,
+                parameters=parameters,
+                timeout=timeout,
             )
         else:
             with ImportExtensions(required=True):
@@ -52,6 +58,7 @@ async def request_generator(
                     endpoint=exec_endpoint,
                     target=target_peapod,
                     parameters=parameters,
+                    timeout=timeout,
                 )
     except Exception as ex:
         # must be handled here, as grpc channel wont handle Python exception
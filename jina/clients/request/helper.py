@@ -1,4 +1,5 @@
 """Module for helper functions for clients."""
+import time
 from typing import Tuple
 
 from ...enums import DataInputType
@@ -8,9 +9,9 @@ from ...types.request import Request
 
 
 def _new_data_request_from_batch(
-    _kwargs, batch, data_type, endpoint, target, parameters
+    _kwargs, batch, data_type, endpoint, target, parameters, timeout=None
 ):
-    req = _new_data_request(endpoint, target, parameters)
+    req = _new_data_request(endpoint, target, parameters, timeout)
 
     # add docs, groundtruths fields
     try:
@@ -23,7 +24,7 @@ def _new_data_request_from_batch(
     return req
 
 
-def _new_data_request(endpoint, target, parameters):
+def _new_data_request(endpoint, target, parameters, timeout=None):
     req = Request()
     req = req.as_typed_request('data')
 
@@ -32,6 +33,8 @@ def _new_data_request(endpoint, target, parameters):
         req.header.exec_endpoint = endpoint
     if target:
         req.header.target_peapod = target
+    if timeout:
+        req.header.deadline.FromNanoseconds(time.time_ns() + int(timeout * 1e9))
     # add parameters field
     if parameters:
         req.parameters = parameters
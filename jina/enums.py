@@ -274,6 +274,9 @@ class CompressAlgo(BetterEnum):
     .. note::
         LZ4 requires additional package, to install it use pip install "jina[lz4]"
 
+    .. note::
+        AUTO chooses the algorithm per link from the sampled compression ratio and throughput
+
     .. seealso::
 
         https://docs.python.org/3/library/archiving.html
@@ -285,6 +288,7 @@ class CompressAlgo(BetterEnum):
     GZIP = 3
     BZ2 = 4
     LZMA = 5
+    AUTO = 6
 
 
 class OnErrorStrategy(BetterEnum):
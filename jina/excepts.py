@@ -9,6 +9,10 @@ class ChainedPodException(Exception):
     """Chained exception from the last Pod."""
 
 
+class DeadlineExceeded(Exception):
+    """The deadline of the request passed before it was handled, so it is passed on without calling the Executor."""
+
+
 class MismatchedVersion(SystemError):
     """When the jina version info of the incoming message does not match the local Jina version."""
 
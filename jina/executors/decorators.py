@@ -2,7 +2,14 @@
 
 import functools
 import inspect
+import json
+import os
+import shelve
+import threading
+import weakref
+from collections import OrderedDict
 from functools import wraps
+from hashlib import blake2b
 from typing import (
     Callable,
     Union,
@@ -13,7 +20,8 @@ from typing import (
 )
 
 from .metas import get_default_metas
-from ..helper import convert_tuple_to_list
+from ..helper import convert_tuple_to_list, random_identity
+from ..proto import jina_pb2
 from ..types.arrays import DocumentArray
 
 
@@ -75,6 +83,7 @@ def requests(
     ] = None,
     *,
     on: Optional[Union[str, Sequence[str]]] = None,
+    lock: bool = False,
 ):
     """
     `@requests` defines when a function will be invoked. It has a keyword `on=` to define the endpoint.
@@ -82,8 +91,17 @@ def requests(
     A class method decorated with plan `@requests` (without `on=`) is the default handler for all endpoints.
     That means, it is the fallback handler for endpoints that are not found.
 
+    .. note::
+        With ``--threads`` larger than 1, a Pea calls the same Executor instance from several threads at once. A
+        function that only reads the state of the Executor, e.g. running a model on `docs`, needs no care. A function
+        that modifies the state, e.g. adding `docs` to an index, must protect it itself or set `lock=True`, so that
+        at most one call of it runs at a time. ``async def`` functions always run in the event loop of the Pea and are
+        never called concurrently from several threads.
+
     :param func: the method to decorate
     :param on: the endpoint string, by convention starts with `/`
+    :param lock: if set, calls of the function are serialized by a lock, even if the Pea calls the Executor from
+        several threads
     :return: decorated function
     """
     from .. import __default_endpoint__, __num_args_executor_func__
@@ -98,9 +116,25 @@ def requests(
                     f'please add `**kwargs` to the function signature.'
                 )
 
-            @functools.wraps(fn)
-            def arg_wrapper(*args, **kwargs):
-                return fn(*args, **kwargs)
+            if inspect.iscoroutinefunction(fn):
+                # keep it a coroutine function, so the runtime knows to await it
+                @functools.wraps(fn)
+                async def arg_wrapper(*args, **kwargs):
+                    return await fn(*args, **kwargs)
+
+            elif lock:
+                fn_lock = threading.Lock()
+
+                @functools.wraps(fn)
+                def arg_wrapper(*args, **kwargs):
+                    with fn_lock:
+                        return fn(*args, **kwargs)
+
+            else:
+
+                @functools.wraps(fn)
+                def arg_wrapper(*args, **kwargs):
+                    return fn(*args, **kwargs)
 
             self.fn = arg_wrapper
 
@@ -121,3 +155,199 @@ def requests(
         return FunctionMapper(func)
     else:
         return FunctionMapper
+
+
+class _DocumentCache:
+    """An in-memory LRU of the serialized outputs of Documents, optionally backed by a file on disk.
+
+    :param max_size: the maximum number of outputs kept in memory
+    :param path: the file of the outputs on disk, None to keep them in memory only
+    """
+
+    def __init__(self, max_size: int, path: Optional[str] = None):
+        self.max_size = max_size
+        self._lru = OrderedDict()  # type: Dict[str, bytes]
+        self._lock = threading.Lock()
+        self._db = shelve.open(path) if path else None
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            if key in self._lru:
+                self._lru.move_to_end(key)
+                return self._lru[key]
+            if self._db is not None and key in self._db:
+                self._add(key, self._db[key])
+                return self._lru[key]
+
+    def put(self, outputs: Dict[str, bytes]):
+        with self._lock:
+            for key, value in outputs.items():
+                self._add(key, value)
+                if self._db is not None:
+                    self._db[key] = value
+            if self._db is not None:
+                self._db.sync()
+
+    def close(self):
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def _add(self, key: str, value: bytes):
+        self._lru[key] = value
+        self._lru.move_to_end(key)
+        while len(self._lru) > self.max_size:
+            self._lru.popitem(last=False)
+
+
+def _copy_fields(
+    src: 'jina_pb2.DocumentProto', dst: 'jina_pb2.DocumentProto', fields: Sequence[str]
+):
+    for name in fields:
+        dst.ClearField(name)
+    for field_descriptor, value in src.ListFields():
+        name = field_descriptor.name
+        if name not in fields:
+            continue
+        if field_descriptor.label == field_descriptor.LABEL_REPEATED:
+            getattr(dst, name).MergeFrom(value)
+        elif field_descriptor.type == field_descriptor.TYPE_MESSAGE:
+            getattr(dst, name).CopyFrom(value)
+        else:
+            setattr(dst, name, value)
+
+
+def _renew_chunk_ids(doc: 'jina_pb2.DocumentProto'):
+    # cached chunks still have the ids they got for the Document they were cached from
+    for chunk in doc.chunks:
+        chunk.id = random_identity(use_uuid1=True)
+        chunk.parent_id = doc.id
+        _renew_chunk_ids(chunk)
+
+
+def memoize(
+    func: Optional[Callable] = None,
+    *,
+    fields: Sequence[str] = ('embedding', 'chunks', 'tags'),
+    max_size: int = 10000,
+    persist: bool = True,
+):
+    """
+    `@memoize` caches the outputs of an Executor function per Document, by the content hash of the Document.
+
+    On every call, only the Documents whose outputs are not cached are passed to the function as one smaller
+    `docs`. The cached outputs are written into the other Documents, so all `docs` get their outputs in order. The
+    outputs are the `fields` of a Document after the call, the function must write them into `docs` in place or
+    return one Document per input Document in order. Other changes to `docs` are not cached. Cached chunks get new
+    ids and the id of their Document as `parent_id`.
+
+    The cache key is the :attr:`Document.content_hash` before the call, together with `parameters`. The most recent
+    outputs are kept in memory, and with `persist` all of them are stored in the `workspace` of the Executor, so they
+    survive restarts. Use it below `@requests`:
+
+    .. highlight:: python
+    .. code-block:: python
+
+        class MyEncoder(Executor):
+            @requests(on=['/index', '/search'])
+            @memoize(fields=['embedding'])
+            def encode(self, docs, **kwargs):
+                docs.embeddings = self.model.encode(docs.get_attributes('text'))
+
+    :param func: the method to decorate
+    :param fields: the names of the Document fields written by the function
+    :param max_size: the maximum number of outputs kept in memory
+    :param persist: if set, the outputs are also stored in the `workspace` of the Executor, if it has one
+    :return: decorated function
+    """
+    fields = tuple(fields)
+
+    def decorator(fn):
+        cache_name = f'_memoize_{fn.__name__}'
+        lock = threading.Lock()
+
+        def _get_cache(executor) -> '_DocumentCache':
+            with lock:
+                cache = getattr(executor, cache_name, None)
+                if cache is None:
+                    path = None
+                    if persist and (
+                        executor.metas.workspace
+                        or getattr(executor.runtime_args, 'workspace', None)
+                    ):
+                        path = os.path.join(
+                            executor.workspace, f'{fn.__name__}.memoize'
+                        )
+                    cache = _DocumentCache(max_size, path)
+                    setattr(executor, cache_name, cache)
+                    # the file is closed with the Executor, or at the latest when the process exits
+                    weakref.finalize(executor, cache.close)
+                return cache
+
+        def _lookup(executor, kwargs):
+            docs = kwargs.get('docs')
+            if not docs:
+                return
+            cache = _get_cache(executor)
+            params = blake2b(
+                json.dumps(
+                    kwargs.get('parameters') or {}, sort_keys=True, default=str
+                ).encode(),
+                digest_size=8,
+            ).hexdigest()
+            misses = []
+            for doc in docs:
+                key = f'{doc.content_hash}-{params}'
+                output = cache.get(key)
+                if output is None:
+                    misses.append((key, doc))
+                else:
+                    _copy_fields(
+                        jina_pb2.DocumentProto.FromString(output), doc.proto, fields
+                    )
+                    _renew_chunk_ids(doc.proto)
+            return cache, misses
+
+        def _store(cache, misses, result):
+            if not isinstance(result, DocumentArray) or len(result) != len(misses):
+                result = [doc for _, doc in misses]
+            outputs = {}
+            for (key, doc), out in zip(misses, result):
+                pb = jina_pb2.DocumentProto()
+                _copy_fields(out.proto, pb, fields)
+                if out.proto is not doc.proto:
+                    _copy_fields(pb, doc.proto, fields)
+                outputs[key] = pb.SerializePartialToString()
+            cache.put(outputs)
+
+        if inspect.iscoroutinefunction(fn):
+
+            @functools.wraps(fn)
+            async def arg_wrapper(self, *args, **kwargs):
+                looked_up = _lookup(self, kwargs)
+                if looked_up is None:
+                    return await fn(self, *args, **kwargs)
+                cache, misses = looked_up
+                if misses:
+                    kwargs['docs'] = DocumentArray([doc for _, doc in misses])
+                    _store(cache, misses, await fn(self, *args, **kwargs))
+
+        else:
+
+            @functools.wraps(fn)
+            def arg_wrapper(self, *args, **kwargs):
+                looked_up = _lookup(self, kwargs)
+                if looked_up is None:
+                    return fn(self, *args, **kwargs)
+                cache, misses = looked_up
+                if misses:
+                    kwargs['docs'] = DocumentArray([doc for _, doc in misses])
+                    _store(cache, misses, fn(self, *args, **kwargs))
+
+        return arg_wrapper
+
+    if func:
+        return decorator(func)
+    else:
+        return decorator
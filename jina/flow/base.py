@@ -101,12 +101,16 @@ class Flow(PostMixin, JAMLCompatible, ExitStack, metaclass=FlowType):
     @overload
     def __init__(
         self,
+        balance_grpc_replicas: Optional[bool] = False,
+        compact_routing_table: Optional[bool] = False,
         compress: Optional[str] = 'NONE',
         compress_min_bytes: Optional[int] = 1024,
         compress_min_ratio: Optional[float] = 1.1,
         connect_to_predecessor: Optional[bool] = False,
         cors: Optional[bool] = False,
         ctrl_with_ipc: Optional[bool] = True,
+        grpc_channels: Optional[int] = 1,
+        shared_memory: Optional[bool] = False,
         daemon: Optional[bool] = False,
         default_swagger_ui: Optional[bool] = False,
         description: Optional[str] = None,
@@ -119,6 +123,8 @@ class Flow(PostMixin, JAMLCompatible, ExitStack, metaclass=FlowType):
         hosts_in_connect: Optional[List[str]] = None,
         log_config: Optional[str] = None,
         memory_hwm: Optional[int] = -1,
+        max_inflight: Optional[int] = 16,
+        threads: Optional[int] = 1,
         name: Optional[str] = 'gateway',
         native: Optional[bool] = False,
         no_crud_endpoints: Optional[bool] = False,
@@ -130,6 +136,9 @@ class Flow(PostMixin, JAMLCompatible, ExitStack, metaclass=FlowType):
         port_out: Optional[int] = None,
         prefetch: Optional[int] = 50,
         prefetch_on_recv: Optional[int] = 1,
+        adaptive_prefetch: Optional[bool] = False,
+        response_cache: Optional[dict] = None,
+        response_cache_bytes: Optional[int] = 67108864,
         protocol: Optional[str] = 'GRPC',
         proxy: Optional[bool] = False,
         py_modules: Optional[List[str]] = None,
@@ -150,6 +159,7 @@ class Flow(PostMixin, JAMLCompatible, ExitStack, metaclass=FlowType):
         uses: Optional[Union[str, Type['BaseExecutor'], dict]] = 'BaseExecutor',
         uses_metas: Optional[dict] = None,
         uses_requests: Optional[dict] = None,
+        uses_dynamic_batching: Optional[dict] = None,
         uses_with: Optional[dict] = None,
         workspace: Optional[str] = None,
         zmq_identity: Optional[str] = None,
@@ -157,15 +167,21 @@ class Flow(PostMixin, JAMLCompatible, ExitStack, metaclass=FlowType):
     ):
         """Create a Flow. Flow is how Jina streamlines and scales Executors. This overloaded method provides arguments from `jina gateway` CLI.
 
+        :param balance_grpc_replicas: If set, a Pod that uses gRPC for data requests sends each message to the replica of the next Pod with the lowest latency and load, out of two picked at random. The latency is that of the transport, as a replica acknowledges a message once it receives it, and the load is the number of messages not acknowledged yet plus the queue depth the replica reports. The replicas are the addresses the host of the next Pod resolves to, e.g. behind a headless Kubernetes service.
+        :param compact_routing_table: If set, the routing table is registered with every Pod when the Flow starts, and data requests only carry its id and the active Pod instead of the full table. A Pod not started by the Flow receives the full table with every request over ZMQ, and until it acknowledges one over gRPC.
         :param compress: The compress algorithm used over the entire Flow.
 
               Note that this is not necessarily effective,
-              it depends on the settings of `--compress-min-bytes` and `compress-min-ratio`
+              it depends on the settings of `--compress-min-bytes` and `compress-min-ratio`.
+              AUTO chooses the algorithm per link from the sampled compression ratio and throughput.
+              Dense tensors are not compressed, they are sent as separate frames.
         :param compress_min_bytes: The original message size must be larger than this number to trigger the compress algorithm, -1 means disable compression.
         :param compress_min_ratio: The compression ratio (uncompressed_size/compressed_size) must be higher than this number to trigger the compress algorithm.
         :param connect_to_predecessor: The head Pea of this Pod will connect to the TailPea of the predecessor Pod.
         :param cors: If set, a CORS middleware is added to FastAPI frontend to allow cross-origin access.
         :param ctrl_with_ipc: If set, use ipc protocol for control socket
+        :param grpc_channels: The number of gRPC channels, each with its own connection, a Pod that uses gRPC for data requests opens to every Pod it sends to. The messages are streamed over them round-robin.
+        :param shared_memory: If set, frames of at least `JINA_SHM_MIN_BYTES` bytes are sent to the next Peas via shared memory and only their descriptors via the socket. All Peas must run on the same host, not on Windows and with Python 3.8+
         :param daemon: The Pea attempts to terminate all of its Runtime child processes/threads on existing. setting it to true basically tell the Pea do not wait on the Runtime when closing
         :param default_swagger_ui: If set, the default swagger ui is used for `/docs` endpoint.
         :param description: The description of this HTTP server. It will be used in automatics docs such as Swagger UI.
@@ -178,6 +194,8 @@ class Flow(PostMixin, JAMLCompatible, ExitStack, metaclass=FlowType):
         :param hosts_in_connect: The host address for input, by default it is 0.0.0.0
         :param log_config: The YAML config of the logger used in this object.
         :param memory_hwm: The memory high watermark of this pod in Gigabytes, pod will restart when this is reached. -1 means no restriction
+        :param max_inflight: The maximum number of requests handled concurrently by the `async def` endpoints of the Executor or queued for its threads, further requests wait until one of them completes
+        :param threads: The number of threads calling the Executor concurrently, all of them share one instance of it. See the `lock` argument of `@requests` for endpoints that are not thread-safe
         :param name: The name of this object.
 
           This will be used in the following places:
@@ -206,6 +224,11 @@ class Flow(PostMixin, JAMLCompatible, ExitStack, metaclass=FlowType):
         :param port_out: The port for output data, default a random port between [49152, 65535]
         :param prefetch: The number of pre-fetched requests from the client
         :param prefetch_on_recv: The number of additional requests to fetch on every receive
+        :param adaptive_prefetch: If set, the number of requests in flight starts at `--prefetch` and is then tuned from the response latency, `--prefetch-on-recv` is ignored
+        :param response_cache: Dictionary of the endpoints whose responses are cached by the Gateway, e.g. `{"/search": {"ttl": 60}}`. A
+          request with the same endpoint, parameters and Document contents as a cached one is answered from the cache
+          for `ttl` seconds, without sending it to the Flow
+        :param response_cache_bytes: The maximum size of the cached responses in bytes, the least recently used ones are evicted
         :param protocol: Communication protocol between server and client.
         :param proxy: If set, respect the http_proxy and https_proxy environment variables. otherwise, it will unset these proxy variables before start. gRPC seems to prefer no proxy
         :param py_modules: The customized python modules need to be imported before loading the executor
@@ -240,6 +263,9 @@ class Flow(PostMixin, JAMLCompatible, ExitStack, metaclass=FlowType):
                   - a text file stream has `.read()` interface
         :param uses_metas: Dictionary of keyword arguments that will override the `metas` configuration in `uses`
         :param uses_requests: Dictionary of keyword arguments that will override the `requests` configuration in `uses`
+        :param uses_dynamic_batching: Dictionary of the endpoints whose requests are merged into one call of the Executor, e.g.
+          `{"/encode": {"max_batch_size": 64, "max_wait_ms": 10}}`. A batch is handled once it holds `max_batch_size`
+          Documents or `max_wait_ms` milliseconds after its first request
         :param uses_with: Dictionary of keyword arguments that will override the `with` configuration in `uses`
         :param workspace: The working directory for any IO operations in this object. If not set, then derive from its parent `workspace`.
         :param zmq_identity: The identity of a ZMQRuntime. It is used for unique socket identification towards other ZMQRuntimes.
@@ -254,7 +280,10 @@ class Flow(PostMixin, JAMLCompatible, ExitStack, metaclass=FlowType):
     @overload
     def __init__(
         self,
+        balance_grpc_replicas: Optional[bool] = False,
+        compact_routing_table: Optional[bool] = False,
         env: Optional[dict] = None,
+        grpc_channels: Optional[int] = 1,
         inspect: Optional[str] = 'COLLECT',
         log_config: Optional[str] = None,
         name: Optional[str] = None,
@@ -267,7 +296,10 @@ class Flow(PostMixin, JAMLCompatible, ExitStack, metaclass=FlowType):
     ):
         """Create a Flow. Flow is how Jina streamlines and scales Executors. This overloaded method provides arguments from `jina flow` CLI.
 
+        :param balance_grpc_replicas: If set, a Pod that uses gRPC for data requests sends each message to the replica of the next Pod with the lowest latency and load, out of two picked at random. The latency is that of the transport, as a replica acknowledges a message once it receives it, and the load is the number of messages not acknowledged yet plus the queue depth the replica reports. The replicas are the addresses the host of the next Pod resolves to, e.g. behind a headless Kubernetes service.
+        :param compact_routing_table: If set, the routing table is registered with every Pod when the Flow starts, and data requests only carry its id and the active Pod instead of the full table. A Pod not started by the Flow receives the full table with every request over ZMQ, and until it acknowledges one over gRPC.
         :param env: The map of environment variables that are available inside runtime
+        :param grpc_channels: The number of gRPC channels, each with its own connection, a Pod that uses gRPC for data requests opens to every Pod it sends to. The messages are streamed over them round-robin.
         :param inspect: The strategy on those inspect pods in the flow.
 
               If `REMOVE` is given then all inspect pods are removed when building the flow.
@@ -462,8 +494,12 @@ class Flow(PostMixin, JAMLCompatible, ExitStack, metaclass=FlowType):
     @overload
     def add(
         self,
+        balance_grpc_replicas: Optional[bool] = False,
+        compact_routing_table: Optional[bool] = False,
         connect_to_predecessor: Optional[bool] = False,
         ctrl_with_ipc: Optional[bool] = False,
+        grpc_channels: Optional[int] = 1,
+        shared_memory: Optional[bool] = False,
         daemon: Optional[bool] = False,
         docker_kwargs: Optional[dict] = None,
         entrypoint: Optional[str] = None,
@@ -478,6 +514,8 @@ class Flow(PostMixin, JAMLCompatible, ExitStack, metaclass=FlowType):
         install_requirements: Optional[bool] = False,
         log_config: Optional[str] = None,
         memory_hwm: Optional[int] = -1,
+        max_inflight: Optional[int] = 16,
+        threads: Optional[int] = 1,
         name: Optional[str] = None,
         native: Optional[bool] = False,
         on_error_strategy: Optional[str] = 'IGNORE',
@@ -512,6 +550,7 @@ class Flow(PostMixin, JAMLCompatible, ExitStack, metaclass=FlowType):
         uses_before: Optional[Union[str, Type['BaseExecutor'], dict]] = None,
         uses_metas: Optional[dict] = None,
         uses_requests: Optional[dict] = None,
+        uses_dynamic_batching: Optional[dict] = None,
         uses_with: Optional[dict] = None,
         volumes: Optional[List[str]] = None,
         workspace: Optional[str] = None,
@@ -520,8 +559,12 @@ class Flow(PostMixin, JAMLCompatible, ExitStack, metaclass=FlowType):
     ) -> Union['Flow', 'AsyncFlow']:
         """Add an Executor to the current Flow object.
 
+        :param balance_grpc_replicas: If set, a Pod that uses gRPC for data requests sends each message to the replica of the next Pod with the lowest latency and load, out of two picked at random. The latency is that of the transport, as a replica acknowledges a message once it receives it, and the load is the number of messages not acknowledged yet plus the queue depth the replica reports. The replicas are the addresses the host of the next Pod resolves to, e.g. behind a headless Kubernetes service.
+        :param compact_routing_table: If set, the routing table is registered with every Pod when the Flow starts, and data requests only carry its id and the active Pod instead of the full table. A Pod not started by the Flow receives the full table with every request over ZMQ, and until it acknowledges one over gRPC.
         :param connect_to_predecessor: The head Pea of this Pod will connect to the TailPea of the predecessor Pod.
         :param ctrl_with_ipc: If set, use ipc protocol for control socket
+        :param grpc_channels: The number of gRPC channels, each with its own connection, a Pod that uses gRPC for data requests opens to every Pod it sends to. The messages are streamed over them round-robin.
+        :param shared_memory: If set, frames of at least `JINA_SHM_MIN_BYTES` bytes are sent to the next Peas via shared memory and only their descriptors via the socket. All Peas must run on the same host, not on Windows and with Python 3.8+
         :param daemon: The Pea attempts to terminate all of its Runtime child processes/threads on existing. setting it to true basically tell the Pea do not wait on the Runtime when closing
         :param docker_kwargs: Dictionary of kwargs arguments that will be passed to Docker SDK when starting the docker '
           container.
@@ -546,6 +589,8 @@ class Flow(PostMixin, JAMLCompatible, ExitStack, metaclass=FlowType):
         :param install_requirements: If set, install `requirements.txt` in the Hub Executor bundle
         :param log_config: The YAML config of the logger used in this object.
         :param memory_hwm: The memory high watermark of this pod in Gigabytes, pod will restart when this is reached. -1 means no restriction
+        :param max_inflight: The maximum number of requests handled concurrently by the `async def` endpoints of the Executor or queued for its threads, further requests wait until one of them completes
+        :param threads: The number of threads calling the Executor concurrently, all of them share one instance of it. See the `lock` argument of `@requests` for endpoints that are not thread-safe
         :param name: The name of this object.
 
           This will be used in the following places:
@@ -621,6 +666,9 @@ class Flow(PostMixin, JAMLCompatible, ExitStack, metaclass=FlowType):
         :param uses_before: The executor attached after the Peas described by --uses, typically before sending to all parallels, accepted type follows `--uses`
         :param uses_metas: Dictionary of keyword arguments that will override the `metas` configuration in `uses`
         :param uses_requests: Dictionary of keyword arguments that will override the `requests` configuration in `uses`
+        :param uses_dynamic_batching: Dictionary of the endpoints whose requests are merged into one call of the Executor, e.g.
+          `{"/encode": {"max_batch_size": 64, "max_wait_ms": 10}}`. A batch is handled once it holds `max_batch_size`
+          Documents or `max_wait_ms` milliseconds after its first request
         :param uses_with: Dictionary of keyword arguments that will override the `with` configuration in `uses`
         :param volumes: The path on the host to be mounted inside the container.
 
@@ -860,6 +908,7 @@ class Flow(PostMixin, JAMLCompatible, ExitStack, metaclass=FlowType):
                         deployment['head_port_in'],
                         deployment['tail_port_out'],
                         deployment['head_zmq_identity'],
+                        getattr(pod.args, 'external', False),
                     )
 
         for end, pod in self._pod_nodes.items():
@@ -915,6 +964,14 @@ class Flow(PostMixin, JAMLCompatible, ExitStack, metaclass=FlowType):
             self._pod_nodes[
                 pod
             ].args.static_routing_table = self.args.static_routing_table
+            self._pod_nodes[
+                pod
+            ].args.compact_routing_table = self.args.compact_routing_table
+            if self.args.balance_grpc_replicas:
+                self._pod_nodes[pod].args.balance_grpc_replicas = True
+            # the Flow sets the number of channels of the Pods that do not set their own
+            if self._pod_nodes[pod].args.grpc_channels == 1:
+                self._pod_nodes[pod].args.grpc_channels = self.args.grpc_channels
             # The gateway always needs the routing table to be set
             if pod == GATEWAY_NAME:
                 self._pod_nodes[pod].args.routing_table = routing_table_copy.json()
@@ -923,6 +980,12 @@ class Flow(PostMixin, JAMLCompatible, ExitStack, metaclass=FlowType):
                 routing_table_copy.active_pod = pod
                 self._pod_nodes[pod].args.routing_table = routing_table_copy.json()
                 self._pod_nodes[pod].update_pea_args()
+            # the Pods register the table when they start, so the requests only need to refer to it
+            elif self.args.compact_routing_table:
+                self._pod_nodes[pod].args.routing_table = routing_table_copy.json()
+                self._pod_nodes[pod].update_pea_args()
+            elif self.args.balance_grpc_replicas or self.args.grpc_channels != 1:
+                self._pod_nodes[pod].update_pea_args()
 
     @allowed_levels([FlowBuildLevel.EMPTY])
     def build(self, copy_flow: bool = False) -> 'Flow':
@@ -89,6 +89,34 @@ When not given, then the default naming strategy will apply.
         ' Can not be used in combination with external pods',
     )
 
+    gp.add_argument(
+        '--compact-routing-table',
+        action='store_true',
+        default=False,
+        help='If set, the routing table is registered with every Pod when the Flow starts, and data requests only carry '
+        'its id and the active Pod instead of the full table. A Pod not started by the Flow receives the full table '
+        'with every request over ZMQ, and until it acknowledges one over gRPC.',
+    )
+
+    gp.add_argument(
+        '--balance-grpc-replicas',
+        action='store_true',
+        default=False,
+        help='If set, a Pod that uses gRPC for data requests sends each message to the replica of the next Pod with '
+        'the lowest latency and load, out of two picked at random. The latency is that of the transport, as a replica '
+        'acknowledges a message once it receives it, and the load is the number of messages not acknowledged yet '
+        'plus the queue depth the replica reports. The replicas are the addresses the host of the next Pod resolves '
+        'to, e.g. behind a headless Kubernetes service.',
+    )
+
+    gp.add_argument(
+        '--grpc-channels',
+        type=int,
+        default=1,
+        help='The number of gRPC channels, each with its own connection, a Pod that uses gRPC for data requests opens '
+        'to every Pod it sends to. The messages are streamed over them round-robin.',
+    )
+
     parser.add_argument(
         '--routing-table',
         type=str,
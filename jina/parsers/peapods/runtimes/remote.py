@@ -1,5 +1,5 @@
 """Argparser module for remote runtime"""
-from ...helper import add_arg_group
+from ...helper import add_arg_group, KVAppendAction
 from .... import __default_host__
 from .... import helper
 from ....enums import CompressAlgo
@@ -153,6 +153,30 @@ def mixin_prefetch_parser(parser=None):
         default=1,
         help='The number of additional requests to fetch on every receive',
     )
+    gp.add_argument(
+        '--adaptive-prefetch',
+        action='store_true',
+        default=False,
+        help='If set, the number of requests in flight starts at `--prefetch` and is then tuned from the response '
+        'latency, `--prefetch-on-recv` is ignored',
+    )
+    gp.add_argument(
+        '--response-cache',
+        action=KVAppendAction,
+        metavar='KEY: VALUE',
+        nargs='*',
+        help='''
+        Dictionary of the endpoints whose responses are cached by the Gateway, e.g. `{"/search": {"ttl": 60}}`. A
+        request with the same endpoint, parameters and Document contents as a cached one is answered from the cache
+        for `ttl` seconds, without sending it to the Flow
+        ''',
+    )
+    gp.add_argument(
+        '--response-cache-bytes',
+        type=int,
+        default=64 * 1024 * 1024,
+        help='The maximum size of the cached responses in bytes, the least recently used ones are evicted',
+    )
 
 
 def mixin_compressor_parser(parser=None):
@@ -170,7 +194,9 @@ def mixin_compressor_parser(parser=None):
     The compress algorithm used over the entire Flow.
 
     Note that this is not necessarily effective,
-    it depends on the settings of `--compress-min-bytes` and `compress-min-ratio`''',
+    it depends on the settings of `--compress-min-bytes` and `compress-min-ratio`.
+    AUTO chooses the algorithm per link from the sampled compression ratio and throughput.
+    Dense tensors are not compressed, they are sent as separate frames.''',
     )
 
     gp.add_argument(
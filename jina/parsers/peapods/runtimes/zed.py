@@ -59,6 +59,17 @@ def mixin_zed_runtime_parser(parser):
         Dictionary of keyword arguments that will override the `requests` configuration in `uses`
         ''',
     )
+    gp.add_argument(
+        '--uses-dynamic-batching',
+        action=KVAppendAction,
+        metavar='KEY: VALUE',
+        nargs='*',
+        help='''
+        Dictionary of the endpoints whose requests are merged into one call of the Executor, e.g.
+        `{"/encode": {"max_batch_size": 64, "max_wait_ms": 10}}`. A batch is handled once it holds `max_batch_size`
+        Documents or `max_wait_ms` milliseconds after its first request
+        ''',
+    )
     gp.add_argument(
         '--py-modules',
         type=str,
@@ -127,6 +138,22 @@ which should be structured as a python package. For more details, please see the
         '-1 means no restriction',
     )
 
+    gp.add_argument(
+        '--max-inflight',
+        type=int,
+        default=16,
+        help='The maximum number of requests handled concurrently by the `async def` endpoints of the Executor or '
+        'queued for its threads, further requests wait until one of them completes',
+    )
+
+    gp.add_argument(
+        '--threads',
+        type=int,
+        default=1,
+        help='The number of threads calling the Executor concurrently, all of them share one instance of it. See the '
+        '`lock` argument of `@requests` for endpoints that are not thread-safe',
+    )
+
     gp.add_argument(
         '--on-error-strategy',
         type=OnErrorStrategy.from_string,
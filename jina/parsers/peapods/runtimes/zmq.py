@@ -28,6 +28,13 @@ def mixin_zmq_runtime_parser(parser):
         default=False,
         help='If set, use ipc protocol for control socket',
     )
+    gp.add_argument(
+        '--shared-memory',
+        action='store_true',
+        default=False,
+        help='If set, frames of at least `JINA_SHM_MIN_BYTES` bytes are sent to the next Peas via shared memory and '
+        'only their descriptors via the socket. All Peas must run on the same host, not on Windows and with Python 3.8+',
+    )
     gp.add_argument(
         '--timeout-ctrl',
         type=int,
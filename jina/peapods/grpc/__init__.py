@@ -1,6 +1,9 @@
 import argparse
 import asyncio
-from typing import Optional, Callable
+import itertools
+import os
+import threading
+from typing import Callable, Dict, Optional, Tuple
 
 import grpc
 from google.protobuf import struct_pb2
@@ -10,16 +13,28 @@ from jina.proto import jina_pb2_grpc, jina_pb2
 from jina.types.message import Message
 from jina.types.message.common import ControlMessage
 from jina.types.routing.table import RoutingTable
+from .balancer import ReplicaBalancer
+from .stream import MessageStream
+
+# the acknowledgement of a message that refers to a routing table the receiver does not know
+_ROUTING_TABLE_MISS = 'routing-table-miss'
 
 
 class Grpclet(jina_pb2_grpc.JinaDataRequestRPCServicer):
     """A `Grpclet` object can send/receive Messages via gRPC.
 
+    Messages are sent over streams, spread round-robin over ``--grpc-channels`` channels per receiver.
+
     :param args: the parsed arguments from the CLI
     :param message_callback: the callback to call on received messages
     :param logger: the logger to use
     """
 
+    # the (channel, stub) of the control messages per process and address, as a gRPC channel can not be used by a
+    # forked process
+    _ctrl_stubs = {}  # type: Dict[Tuple[int, str], tuple]
+    _ctrl_stubs_lock = threading.Lock()
+
     def __init__(
         self,
         args: argparse.Namespace,
@@ -27,19 +42,28 @@ class Grpclet(jina_pb2_grpc.JinaDataRequestRPCServicer):
         logger: Optional['JinaLogger'] = None,
     ):
         self.args = args
-        self._stubs = {}
+        # the streams to every receiver, each over its own channel, and the iterator cycling through them
+        self._streams = {}
         self._logger = logger or JinaLogger(self.__class__.__name__)
         self.callback = message_callback
         self.msg_recv = 0
         self.msg_sent = 0
         self._pending_tasks = []
+        # the received messages the callback has not processed yet
+        self._queue_depth = 0
         self._static_routing_table = args.static_routing_table
+        self._compact_routing_table = args.compact_routing_table
+        # the receivers that acknowledged a message with the full routing table, with the id of the table
+        self._routing_table_receivers = set()
+        self._balancer = ReplicaBalancer() if args.balance_grpc_replicas else None
         if args.static_routing_table:
             self._routing_table = RoutingTable(args.routing_table)
             self._next_targets = self._routing_table.get_next_target_addresses()
         else:
             self._routing_table = None
             self._next_targets = None
+            if args.compact_routing_table and args.routing_table:
+                RoutingTable(args.routing_table).register(shared=True)
 
     async def send_message(self, msg: 'Message', **kwargs):
         """
@@ -50,30 +74,76 @@ class Grpclet(jina_pb2_grpc.JinaDataRequestRPCServicer):
 
         if self._next_targets:
             for pod_address in self._next_targets:
-                self._send_message(msg, pod_address)
+                self._send_message(msg, self._choose_replica(pod_address))
         else:
-            routing_table = RoutingTable(msg.envelope.routing_table)
+            routing_table = RoutingTable.from_envelope(msg.envelope)
             next_targets = routing_table.get_next_targets()
             for target, _ in next_targets:
-                self._send_message(
-                    self._add_envelope(msg, target),
-                    target.active_target_pod.full_address,
+                pod_address = self._choose_replica(
+                    target.active_target_pod.full_address
                 )
+                self._send_message(msg, pod_address, target)
 
-    def _send_message(self, msg, pod_address):
-        if pod_address not in self._stubs:
-            self._stubs[pod_address] = Grpclet._create_grpc_stub(pod_address)
+    def _choose_replica(self, pod_address):
+        if self._balancer:
+            return self._balancer.choose(pod_address)
+        return pod_address
+
+    def _get_stream(self, pod_address: str) -> 'MessageStream':
+        if pod_address not in self._streams:
+            num_channels = self.args.grpc_channels
+            streams = [
+                MessageStream(
+                    Grpclet._create_grpc_stub(
+                        pod_address, own_connection=num_channels > 1
+                    )
+                )
+                for _ in range(num_channels)
+            ]
+            self._streams[pod_address] = (streams, itertools.cycle(streams))
+        return next(self._streams[pod_address][1])
+
+    def _send_message(self, msg, pod_address, routing_table=None):
+        stream = self._get_stream(pod_address)
         try:
             self.msg_sent += 1
 
-            # this wraps the awaitable object from grpc as a coroutine so it can be used as a task
-            # the grpc call function is not a coroutine but some _AioCall
-            async def task_wrapper(new_message, pod_address):
-                await self._stubs[pod_address].Call(new_message)
+            async def send(new_message):
+                if self._balancer:
+                    with self._balancer.track(pod_address):
+                        ack = await stream.send(new_message)
+                    self._balancer.report_queue_depth(
+                        pod_address, int(ack.number_value)
+                    )
+                    return ack
+                else:
+                    return await stream.send(new_message)
 
-            self._pending_tasks.append(
-                asyncio.create_task(task_wrapper(msg, pod_address))
-            )
+            with_table = False
+            if routing_table is not None and not self._static_routing_table:
+                with_table = self._needs_routing_table(routing_table, pod_address)
+                new_message = self._add_envelope(
+                    msg, routing_table, pod_address, with_table
+                )
+            else:
+                new_message = msg.for_target(pod_address)
+
+            async def task_wrapper():
+                ack = await send(new_message)
+                if routing_table is None or self._static_routing_table:
+                    return
+                receiver = (pod_address, routing_table.id)
+                if ack.string_value == _ROUTING_TABLE_MISS:
+                    # the receiver does not know the table, e.g. it is restarted, so the message is sent again with it
+                    self._routing_table_receivers.discard(receiver)
+                    await send(
+                        self._add_envelope(msg, routing_table, pod_address, True)
+                    )
+                    self._routing_table_receivers.add(receiver)
+                elif with_table:
+                    self._routing_table_receivers.add(receiver)
+
+            self._pending_tasks.append(asyncio.create_task(task_wrapper()))
             self._update_pending_tasks()
         except grpc.RpcError as ex:
             self._logger.error('Sending data request via grpc failed', ex)
@@ -82,49 +152,85 @@ class Grpclet(jina_pb2_grpc.JinaDataRequestRPCServicer):
     @staticmethod
     def send_ctrl_msg(pod_address: str, command: str, timeout=1.0):
         """
-        Sends a control message via gRPC to pod_address
+        Sends a control message via gRPC to pod_address, over a channel that is reused by the later control
+        messages to the same address from the same process, until the call fails or :meth:`close_ctrl_channels`
         :param pod_address: the pod to send the command to
         :param command: the command to send (TERMINATE/ACTIVATE/...)
         :param timeout: optional timeout for the request in seconds
         :returns: Empty protobuf struct
         """
-        stub = Grpclet._create_grpc_stub(pod_address, is_async=False)
-        response = stub.Call(ControlMessage(command), timeout=timeout)
-        return response
+        key = (os.getpid(), pod_address)
+        with Grpclet._ctrl_stubs_lock:
+            if key not in Grpclet._ctrl_stubs:
+                channel = Grpclet._create_grpc_channel(pod_address, is_async=False)
+                Grpclet._ctrl_stubs[key] = (
+                    channel,
+                    jina_pb2_grpc.JinaDataRequestRPCStub(channel),
+                )
+            stub = Grpclet._ctrl_stubs[key][1]
+        try:
+            return stub.Call(ControlMessage(command), timeout=timeout)
+        except grpc.RpcError:
+            # the channel may be broken, e.g. the Pea is restarted, so the next control message opens a new one
+            Grpclet.close_ctrl_channels(pod_address)
+            raise
 
     @staticmethod
-    def _create_grpc_stub(pod_address, is_async=True):
-        if is_async:
-            channel = grpc.aio.insecure_channel(
-                pod_address,
-                options=[
-                    ('grpc.max_send_message_length', -1),
-                    ('grpc.max_receive_message_length', -1),
-                ],
-            )
-        else:
-            channel = grpc.insecure_channel(
-                pod_address,
-                options=[
-                    ('grpc.max_send_message_length', -1),
-                    ('grpc.max_receive_message_length', -1),
-                ],
-            )
+    def close_ctrl_channels(pod_address: Optional[str] = None):
+        """
+        Closes the channels of the control messages this process sent
+        :param pod_address: only close the channel to this address if given
+        """
+        pid = os.getpid()
+        with Grpclet._ctrl_stubs_lock:
+            keys = [
+                key
+                for key in Grpclet._ctrl_stubs
+                if key[0] == pid and pod_address in (None, key[1])
+            ]
+            channels = [Grpclet._ctrl_stubs.pop(key)[0] for key in keys]
+        for channel in channels:
+            channel.close()
 
+    @staticmethod
+    def _create_grpc_stub(pod_address, is_async=True, own_connection=False):
+        channel = Grpclet._create_grpc_channel(pod_address, is_async, own_connection)
         stub = jina_pb2_grpc.JinaDataRequestRPCStub(channel)
 
         return stub
 
-    def _add_envelope(self, msg, routing_table):
-        if not self._static_routing_table:
-            new_envelope = jina_pb2.EnvelopeProto()
-            new_envelope.CopyFrom(msg.envelope)
-            new_envelope.routing_table.CopyFrom(routing_table.proto)
-            new_message = Message(request=msg.request, envelope=new_envelope)
-
-            return new_message
+    @staticmethod
+    def _create_grpc_channel(pod_address, is_async=True, own_connection=False):
+        options = [
+            ('grpc.max_send_message_length', -1),
+            ('grpc.max_receive_message_length', -1),
+        ]
+        if own_connection:
+            # channels share the connection to the same address, unless each has its own subchannel pool
+            options.append(('grpc.use_local_subchannel_pool', 1))
+        if is_async:
+            channel = grpc.aio.insecure_channel(pod_address, options=options)
         else:
-            return msg
+            channel = grpc.insecure_channel(pod_address, options=options)
+        return channel
+
+    def _needs_routing_table(self, routing_table, pod_address) -> bool:
+        # the full table is sent until the receiver acknowledges a message with it,
+        # unless the Flow registered it with the receiver when it started
+        return self._compact_routing_table and not (
+            routing_table.is_registered_with_target
+            or (pod_address, routing_table.id) in self._routing_table_receivers
+        )
+
+    def _add_envelope(self, msg, routing_table, pod_address, with_table):
+        new_envelope = jina_pb2.EnvelopeProto()
+        new_envelope.CopyFrom(msg.envelope)
+        routing_table.add_to_envelope(
+            new_envelope, compact=self._compact_routing_table, with_table=with_table
+        )
+        new_message = msg.fork(new_envelope)
+        new_message.target_address = pod_address
+        return new_message
 
     async def close(self, grace_period=None, *args, **kwargs):
         """Stop the Grpc server
@@ -140,6 +246,12 @@ class Grpclet(jina_pb2_grpc.JinaDataRequestRPCServicer):
             self._logger.warning(
                 f'Could not gracefully complete {len(self._pending_tasks)} pending tasks on close.'
             )
+        for streams, _ in self._streams.values():
+            for stream in streams:
+                stream.close()
+        if self._balancer:
+            self._balancer.close()
+        Grpclet.close_ctrl_channels()
         self._logger.debug('Close grpc server')
         await self._grpc_server.stop(grace_period)
 
@@ -168,10 +280,20 @@ class Grpclet(jina_pb2_grpc.JinaDataRequestRPCServicer):
         """Processes messages received by the GRPC server
         :param msg: The received message
         :param args: Extra positional arguments
-        :return: Empty protobuf struct, necessary to return for protobuf Empty
+        :return: the number of received messages not processed yet, which the balancer of the sender reads as the
+            queue depth, or the miss of the routing table
         """
+        if RoutingTable.is_missing(msg.envelope):
+            # the message is dropped, the sender sends it again with the full routing table
+            self._logger.debug(
+                f'routing table {msg.envelope.routing_table_ref.id} is not registered, asking the sender for it'
+            )
+            return struct_pb2.Value(string_value=_ROUTING_TABLE_MISS)
         if self.callback:
-            self._pending_tasks.append(asyncio.create_task(self.callback(msg)))
+            self._queue_depth += 1
+            task = asyncio.create_task(self.callback(msg))
+            task.add_done_callback(self._on_processed)
+            self._pending_tasks.append(task)
         else:
             self._logger.debug(
                 'Grpclet received data request, but no callback was registered'
@@ -179,4 +301,16 @@ class Grpclet(jina_pb2_grpc.JinaDataRequestRPCServicer):
 
         self.msg_recv += 1
         self._update_pending_tasks()
-        return struct_pb2.Value()
+        return struct_pb2.Value(number_value=self._queue_depth)
+
+    def _on_processed(self, task: 'asyncio.Task'):
+        self._queue_depth -= 1
+
+    async def CallStream(self, msgs, *args):
+        """Processes the messages of a stream received by the GRPC server
+        :param msgs: The received messages
+        :param args: Extra positional arguments
+        :yield: the acknowledgement of every message, see :meth:`Call`
+        """
+        async for msg in msgs:
+            yield await self.Call(msg)
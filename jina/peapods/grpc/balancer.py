@@ -0,0 +1,221 @@
+import asyncio
+import random
+import socket
+import statistics
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+import grpc
+
+__all__ = ['ReplicaBalancer']
+
+
+class _ReplicaStats:
+    """The load of one replica address."""
+
+    def __init__(self, target: str):
+        self.target = target
+        self.outstanding = 0
+        # the number of messages the replica has received but not processed yet, as it reported last
+        self.queue_depth = 0
+        self.latency = None  # type: Optional[float]
+        self.ejected_until = 0.0
+
+
+class ReplicaBalancer:
+    """Choose the replica a message is sent to from the latency and the load of each replica.
+
+    The replicas of a target ``host:port`` are the addresses its host resolves to, e.g. the Pods behind a headless
+    Kubernetes service. A target resolving to a single address is used as it is. The host is resolved by a
+    background task of the running event loop, so choosing a replica never blocks, and the target itself is used
+    until its replicas are resolved.
+
+    A replica acknowledges a message as soon as it receives it, so the latency of a call is the latency of the
+    transport, not the time the replica takes to process the message. The load of a replica is therefore the
+    number of outstanding calls to it plus its queue depth, i.e. the messages it has received but not processed
+    yet, as reported with its last acknowledgement.
+
+    For every message, two replicas are picked at random and the one with the lower
+    ``latency * (outstanding + queue_depth + 1)`` gets the message, where the latency is an exponential moving
+    average. A replica whose call fails, or whose latency exceeds ``eject_ratio`` times the median latency of the
+    other replicas, is ejected for ``eject_seconds``, but never the last replica of a target.
+
+    :param eject_ratio: the ratio to the median latency above which a replica is ejected
+    :param eject_seconds: the time in seconds a replica is ejected for
+    :param resolve_interval: the time in seconds after which the replicas of a target are resolved again
+    :param decay: the weight of the history in the moving average of the latency
+    """
+
+    def __init__(
+        self,
+        eject_ratio: float = 3.0,
+        eject_seconds: float = 10.0,
+        resolve_interval: float = 30.0,
+        decay: float = 0.8,
+    ):
+        self.eject_ratio = eject_ratio
+        self.eject_seconds = eject_seconds
+        self.resolve_interval = resolve_interval
+        self.decay = decay
+        self._replicas = {}  # type: Dict[str, List[str]]
+        self._resolved_at = {}  # type: Dict[str, float]
+        self._refresh_tasks = {}  # type: Dict[str, asyncio.Task]
+        self._stats = {}  # type: Dict[str, _ReplicaStats]
+
+    def get_replicas(self, target: str) -> List[str]:
+        """Get the replica addresses of a target without blocking.
+
+        The replicas are resolved again by a background task every ``resolve_interval`` seconds. Until they are
+        resolved for the first time, the target itself is returned.
+
+        :param target: the address of the target, i.e. ``host:port``
+        :return: the addresses of the replicas
+        """
+        if (
+            target not in self._resolved_at
+            or time.monotonic() - self._resolved_at[target] >= self.resolve_interval
+        ) and target not in self._refresh_tasks:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                # without a running event loop, e.g. in a synchronous caller, the target is used as it is
+                pass
+            else:
+                self._refresh_tasks[target] = loop.create_task(self.refresh(target))
+        return self._replicas.get(target, [target])
+
+    async def refresh(self, target: str):
+        """Resolve the replica addresses of a target.
+
+        :param target: the address of the target, i.e. ``host:port``
+        """
+        try:
+            replicas = await self._resolve(target)
+        finally:
+            self._refresh_tasks.pop(target, None)
+        self._replicas[target] = replicas
+        self._resolved_at[target] = time.monotonic()
+        for address in replicas:
+            if address not in self._stats:
+                self._stats[address] = _ReplicaStats(target)
+
+    @staticmethod
+    async def _resolve(target: str) -> List[str]:
+        host, _, port = target.rpartition(':')
+        try:
+            infos = await asyncio.get_running_loop().getaddrinfo(
+                host, int(port), family=socket.AF_INET, type=socket.SOCK_STREAM
+            )
+        except (socket.gaierror, ValueError):
+            return [target]
+        addresses = sorted({f'{info[4][0]}:{port}' for info in infos})
+        return addresses if len(addresses) > 1 else [target]
+
+    def close(self):
+        """Cancel the background tasks resolving the replicas."""
+        for task in self._refresh_tasks.values():
+            task.cancel()
+        self._refresh_tasks = {}
+
+    def choose(self, target: str) -> str:
+        """Choose the replica of a target the next message is sent to.
+
+        :param target: the address of the target, i.e. ``host:port``
+        :return: the address of the chosen replica
+        """
+        replicas = self.get_replicas(target)
+        if len(replicas) == 1:
+            return replicas[0]
+        now = time.monotonic()
+        candidates = [a for a in replicas if self._stats[a].ejected_until <= now]
+        if len(candidates) < 2:
+            return candidates[0] if candidates else random.choice(replicas)
+
+        # a replica without a response yet counts as the fastest one, so it gets traffic
+        latencies = [
+            self._stats[a].latency
+            for a in candidates
+            if self._stats[a].latency is not None
+        ]
+        default_latency = min(latencies, default=1.0)
+
+        def _score(address: str) -> float:
+            stats = self._stats[address]
+            latency = default_latency if stats.latency is None else stats.latency
+            return latency * (stats.outstanding + stats.queue_depth + 1)
+
+        return min(random.sample(candidates, 2), key=_score)
+
+    @contextmanager
+    def track(self, address: str):
+        """Track a call to a replica, its latency is recorded when the call returns and the replica is ejected if
+        the call fails.
+
+        .. highlight:: python
+        .. code-block:: python
+
+            address = balancer.choose(target)
+            with balancer.track(address):
+                ack = await stub.Call(msg)
+            balancer.report_queue_depth(address, int(ack.number_value))
+
+        :param address: the address of the replica returned by :meth:`choose`
+        :yield: nothing
+        """
+        stats = self._stats.get(address)
+        if stats is None:
+            yield
+            return
+        stats.outstanding += 1
+        start = time.perf_counter()
+        try:
+            yield
+        except grpc.RpcError:
+            self._eject(address)
+            raise
+        else:
+            self._update(address, time.perf_counter() - start)
+        finally:
+            stats.outstanding -= 1
+
+    def report_queue_depth(self, address: str, queue_depth: int):
+        """Record the queue depth a replica reported with the acknowledgement of a message.
+
+        :param address: the address of the replica returned by :meth:`choose`
+        :param queue_depth: the number of messages the replica has received but not processed yet
+        """
+        stats = self._stats.get(address)
+        if stats is not None:
+            stats.queue_depth = queue_depth
+
+    def _update(self, address: str, latency: float):
+        stats = self._stats[address]
+        if stats.latency is None:
+            stats.latency = latency
+        else:
+            stats.latency = self.decay * stats.latency + (1 - self.decay) * latency
+
+        others = [
+            self._stats[a].latency
+            for a in self._replicas.get(stats.target, ())
+            if a != address
+            and self._stats[a].latency is not None
+            and self._stats[a].ejected_until <= time.monotonic()
+        ]
+        if others and stats.latency > self.eject_ratio * statistics.median(others):
+            self._eject(address)
+
+    def _eject(self, address: str):
+        stats = self._stats[address]
+        now = time.monotonic()
+        others = [
+            a
+            for a in self._replicas.get(stats.target, ())
+            if a != address and self._stats[a].ejected_until <= now
+        ]
+        if not others:
+            return
+        stats.ejected_until = now + self.eject_seconds
+        # the replica is judged by fresh responses once it is back
+        stats.latency = None
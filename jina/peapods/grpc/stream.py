@@ -0,0 +1,102 @@
+import asyncio
+from collections import deque
+from typing import Deque, List, Optional, TYPE_CHECKING
+
+import grpc
+
+if TYPE_CHECKING:
+    from google.protobuf import struct_pb2
+
+    from ...proto import jina_pb2_grpc
+    from ...types.message import Message
+
+__all__ = ['MessageStream']
+
+
+class MessageStream:
+    """A bidirectional stream of Messages to one receiver over one channel.
+
+    All messages go over the same call, so they do not pay the setup of a new RPC each. The messages are written by
+    one task in the order of :meth:`send`, and the receiver acknowledges every message in the same order. The call
+    is opened with the first message, and opened again with the next message after it fails.
+
+    :param stub: the stub of the channel to the receiver
+    """
+
+    def __init__(self, stub: 'jina_pb2_grpc.JinaDataRequestRPCStub'):
+        self._stub = stub
+        self._call = None
+        self._tasks = []  # type: List[asyncio.Task]
+        # the messages not written yet, with the futures of their acknowledgements
+        self._queue = asyncio.Queue()
+        self._acks = deque()  # type: Deque[asyncio.Future]
+
+    async def send(self, msg: 'Message') -> 'struct_pb2.Value':
+        """Send a message and wait until the receiver acknowledges it.
+
+        :param msg: the message to send
+        :return: the acknowledgement of the receiver
+        """
+        if self._call is None:
+            self._open()
+        ack = asyncio.get_event_loop().create_future()
+        self._queue.put_nowait((msg, ack))
+        return await ack
+
+    def _open(self):
+        self._call = self._stub.CallStream()
+        self._tasks = [
+            asyncio.ensure_future(self._write(self._call)),
+            asyncio.ensure_future(self._read(self._call)),
+        ]
+
+    async def _write(self, call):
+        try:
+            while True:
+                msg, ack = await self._queue.get()
+                self._acks.append(ack)
+                await call.write(msg)
+        except asyncio.CancelledError:
+            raise
+        except Exception as ex:
+            self._fail(call, ex)
+
+    async def _read(self, call):
+        try:
+            while True:
+                response = await call.read()
+                if response is grpc.aio.EOF:
+                    raise ConnectionError('the stream is closed by the receiver')
+                ack = self._acks.popleft()
+                if not ack.done():
+                    ack.set_result(response)
+        except asyncio.CancelledError:
+            raise
+        except Exception as ex:
+            self._fail(call, ex)
+
+    def _fail(self, call, ex: Optional[Exception] = None):
+        if call is not self._call:
+            return
+        self._call = None
+        call.cancel()
+        for task in self._tasks:
+            task.cancel()
+        self._tasks = []
+        # the messages not acknowledged yet may or may not be received, they are failed all the same
+        pending = list(self._acks)
+        self._acks.clear()
+        while not self._queue.empty():
+            pending.append(self._queue.get_nowait()[1])
+        for ack in pending:
+            if ack.done():
+                continue
+            if ex is None:
+                ack.cancel()
+            else:
+                ack.set_exception(ex)
+
+    def close(self):
+        """Close the stream, the messages not acknowledged yet are cancelled."""
+        if self._call is not None:
+            self._fail(self._call)
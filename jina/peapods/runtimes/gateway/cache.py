@@ -0,0 +1,152 @@
+import json
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple, Union
+
+from ....proto import jina_pb2
+from ....types.document import get_content_hash
+from ....types.request import Request
+
+__all__ = ['ResponseCache']
+
+
+class ResponseCache:
+    """Cache the responses of the Flow in the Gateway, so a repeated request is answered without touching any Pea.
+
+    A request is keyed by its endpoint, its target peapod, its parameters and the content hashes of its Documents,
+    so the ids of the Documents do not matter. Only the endpoints in `config` are cached, each with its own
+    ``ttl`` in seconds. The least recently used responses are evicted once the cache holds more than `max_bytes`.
+
+    A cached response gets the request id of the new request. Its Documents that have the id of a Document of the
+    cached request get the id of the Document with the same content in the new request, and so does the ``parent_id``
+    of their chunks.
+
+    .. highlight:: python
+    .. code-block:: python
+
+        f = Flow(response_cache={'/search': {'ttl': 60}}).add(uses=MyIndexer)
+
+    :param config: the cache config per endpoint, i.e. ``ttl``
+    :param max_bytes: the maximum size of all cached responses in bytes
+    """
+
+    def __init__(self, config: Dict[str, Dict], max_bytes: int):
+        self._ttl = {}  # type: Dict[str, float]
+        for endpoint, c in (config or {}).items():
+            ttl = float((c or {}).get('ttl', 60))
+            if ttl <= 0:
+                raise ValueError(
+                    f'invalid response cache config of {endpoint}: {c}, `ttl` must be positive'
+                )
+            self._ttl[endpoint] = ttl
+        self.max_bytes = max_bytes
+        # key -> (serialized response, expiry time, ids of the Documents of the request)
+        self._entries = OrderedDict()  # type: Dict[Tuple, Tuple[bytes, float, Tuple]]
+        self._num_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """The number of hits, misses and evictions, and the number and the size in bytes of the cached responses.
+
+        .. # noqa: DAR201"""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'entries': len(self._entries),
+            'bytes': self._num_bytes,
+        }
+
+    def get_key(
+        self, request: Union['Request', 'jina_pb2.RequestProto']
+    ) -> Optional[Tuple]:
+        """Get the cache key of a request.
+
+        :param request: the request from the client
+        :return: the key or None if the endpoint of the request is not cached
+        """
+        request = _as_request(request)
+        if request._request_type != 'data':
+            return
+        header = request._lazy_proto.header
+        if header.exec_endpoint not in self._ttl:
+            return
+        return (
+            header.exec_endpoint,
+            header.target_peapod,
+            json.dumps(request.parameters, sort_keys=True, default=str),
+            tuple(get_content_hash(d) for d in request.body.docs),
+        )
+
+    def get(
+        self, key: Tuple, request: Union['Request', 'jina_pb2.RequestProto']
+    ) -> Optional['Request']:
+        """Get the cached response to a request, the hit or the miss is counted.
+
+        :param key: the key of the request from :meth:`get_key`
+        :param request: the request
+        :return: the response with the request id and the Document ids of `request`, or None if it is not cached
+        """
+        entry = self._entries.get(key)
+        if entry is not None and entry[1] <= time.monotonic():
+            self._remove(key)
+            entry = None
+        if entry is None:
+            self.misses += 1
+            return
+        self.hits += 1
+        self._entries.move_to_end(key)
+
+        request = _as_request(request)
+        response = jina_pb2.RequestProto()
+        response.ParseFromString(entry[0])
+        response.request_id = request.request_id
+        # the Documents of both requests have the same content in the same order, as their keys are equal
+        ids = dict(zip(entry[2], (d.id for d in request.body.docs)))
+        for d in response.data.docs:
+            if d.id in ids:
+                d.id = ids[d.id]
+            for c in d.chunks:
+                if c.parent_id in ids:
+                    c.parent_id = ids[c.parent_id]
+        return Request(response)
+
+    def put(
+        self,
+        key: Tuple,
+        response: 'Request',
+        request: Union['Request', 'jina_pb2.RequestProto'],
+    ):
+        """Cache a successful response, the least recently used responses are evicted to make room for it.
+
+        :param key: the key of the request from :meth:`get_key`
+        :param response: the response from the Flow
+        :param request: the request the response answers
+        """
+        if response.status.code != jina_pb2.StatusProto.SUCCESS:
+            return
+        data = response.proto.SerializePartialToString()
+        if len(data) > self.max_bytes:
+            return
+        if key in self._entries:
+            self._remove(key)
+        while self._entries and self._num_bytes + len(data) > self.max_bytes:
+            self._remove(next(iter(self._entries)))
+            self.evictions += 1
+        self._entries[key] = (
+            data,
+            time.monotonic() + self._ttl[key[0]],
+            tuple(d.id for d in _as_request(request).body.docs),
+        )
+        self._num_bytes += len(data)
+
+    def _remove(self, key: Tuple):
+        data = self._entries.pop(key)[0]
+        self._num_bytes -= len(data)
+
+
+def _as_request(request: Union['Request', 'jina_pb2.RequestProto']) -> 'Request':
+    return request if isinstance(request, Request) else Request(request)
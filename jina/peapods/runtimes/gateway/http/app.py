@@ -106,6 +106,13 @@ def get_fastapi_app(args: 'argparse.Namespace', logger: 'JinaLogger'):
                 'jina': _info[0],
                 'envs': _info[1],
                 'used_memory': used_memory_readable(),
+                'deadline_exceeded': servicer.num_deadline_exceeded,
+                'prefetch': servicer.window.stats
+                if servicer.window is not None
+                else None,
+                'response_cache': servicer.cache.stats
+                if servicer.cache is not None
+                else None,
             }
 
         @app.post(
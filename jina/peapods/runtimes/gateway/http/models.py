@@ -254,6 +254,9 @@ class JinaStatusModel(BaseModel):
     jina: Dict
     envs: Dict
     used_memory: str
+    deadline_exceeded: int = 0
+    prefetch: Optional[Dict] = None
+    response_cache: Optional[Dict] = None
 
     class Config:
         alias_generator = _to_camel_case
@@ -303,6 +306,12 @@ class JinaRequestModel(BaseModel):
         example={'top_k': 3, 'model': 'bert'},
         description='A dictionary of parameters to be sent to the executor.',
     )
+    timeout: Optional[float] = Field(
+        None,
+        example=10.0,
+        description='The seconds the request may take, after which the Flow skips it without calling any further '
+        'Executor and returns it with the status `DEADLINE_EXCEEDED`.',
+    )
 
     class Config:
         alias_generator = _to_camel_case
@@ -1,17 +1,105 @@
 import argparse
 import asyncio
+import time
 from asyncio import Future
-from typing import AsyncGenerator, Dict, Union
+from typing import AsyncGenerator, Dict, List, Optional, Tuple, Union
 
+from .cache import ResponseCache
 from ...grpc import Grpclet
 from ....helper import typename, get_or_reuse_loop
 from ....logging.logger import JinaLogger
+from ....proto import jina_pb2
 from ....types.message import Message
 
-__all__ = ['PrefetchCaller']
+__all__ = ['PrefetchCaller', 'AdaptivePrefetchWindow']
 
 if False:
     from ...zmq import AsyncZmqlet
+    from ....types.request import Request
+
+
+class AdaptivePrefetchWindow:
+    """Tune the number of requests in flight from the observed response latency, by additive increase and
+    multiplicative decrease (AIMD).
+
+    As long as the smoothed latency stays within `tolerance` times the lowest latency seen, the Flow keeps up and
+    the window grows by one request per round trip. Once requests start to queue up in the Peas, the latency rises
+    above it and the window shrinks by `backoff`, at most once per round trip.
+
+    :param initial: the initial window
+    :param min_window: the smallest window
+    :param max_window: the largest window
+    :param tolerance: the ratio of the smoothed latency to the lowest latency, above which the window shrinks
+    :param backoff: the factor the window shrinks by
+    :param decay: the weight of the history in the moving averages
+    """
+
+    def __init__(
+        self,
+        initial: int,
+        min_window: int = 1,
+        max_window: int = 1000,
+        tolerance: float = 2.0,
+        backoff: float = 0.75,
+        decay: float = 0.9,
+    ):
+        self.min_window = min_window
+        self.max_window = max_window
+        self.tolerance = tolerance
+        self.backoff = backoff
+        self.decay = decay
+        self._window = float(min(max(initial, min_window), max_window))
+        self._latency = None  # type: Optional[float]
+        self._min_latency = None  # type: Optional[float]
+        self._throughput = 0.0
+        self._last_response = None  # type: Optional[float]
+        self._last_decrease = 0.0
+
+    @property
+    def size(self) -> int:
+        """The number of requests allowed in flight.
+
+        .. # noqa: DAR201"""
+        return int(self._window)
+
+    @property
+    def stats(self) -> Dict[str, float]:
+        """The current window, the smoothed and the lowest latency in milliseconds and the throughput in responses per
+        second.
+
+        .. # noqa: DAR201"""
+        return {
+            'window': self.size,
+            'latency_ms': (self._latency or 0.0) * 1000,
+            'min_latency_ms': (self._min_latency or 0.0) * 1000,
+            'throughput': self._throughput,
+        }
+
+    def update(self, latency: float):
+        """Adapt the window to the latency of a response.
+
+        :param latency: the time between sending a request and receiving its response in seconds
+        """
+        now = time.perf_counter()
+        if self._last_response is not None:
+            rate = 1 / max(now - self._last_response, 1e-6)
+            self._throughput = self.decay * self._throughput + (1 - self.decay) * rate
+        self._last_response = now
+
+        if self._latency is None:
+            self._latency = self._min_latency = latency
+        else:
+            self._latency = self.decay * self._latency + (1 - self.decay) * latency
+            # the lowest latency slowly follows the current one, so the window recovers if the requests get heavier
+            self._min_latency = min(
+                latency, self._min_latency + (self._latency - self._min_latency) / 1000
+            )
+
+        if self._latency <= self.tolerance * self._min_latency:
+            self._window = min(self._window + 1 / self._window, self.max_window)
+        elif now - self._last_decrease > self._latency:
+            self._window = max(self._window * self.backoff, self.min_window)
+            self._last_decrease = now
 
 
 class PrefetchCaller:
@@ -29,6 +117,21 @@ class PrefetchCaller:
         self.logger = JinaLogger(self.name, **vars(args))
         self._message_buffer: Dict[str, Future[Message]] = dict()
         self.iolet = iolet
+        #: the adaptive window of requests in flight, None if the fixed ``--prefetch`` is used
+        self.window = (
+            AdaptivePrefetchWindow(args.prefetch) if args.adaptive_prefetch else None
+        )
+        self._send_times = {}  # type: Dict[str, float]
+        #: the number of requests the Flow skipped because their deadline passed
+        self.num_deadline_exceeded = 0
+        #: the cache of the responses, None if no endpoint is cached
+        self.cache = (
+            ResponseCache(args.response_cache, args.response_cache_bytes)
+            if args.response_cache
+            else None
+        )
+        # the cache key and the request of every request whose response is cached, by the request id
+        self._cache_keys = {}  # type: Dict[str, Tuple[Tuple, 'Request']]
 
         if isinstance(iolet, Grpclet):
             self.iolet.callback = self._unwrap_request
@@ -37,7 +140,7 @@ class PrefetchCaller:
             self._receive_task = get_or_reuse_loop().create_task(self._receive())
 
     async def _unwrap_request(self, msg):
-        return self._process_message(msg.request)
+        return self._process_message(msg.response)
 
     async def _receive(self):
         try:
@@ -56,10 +159,21 @@ class PrefetchCaller:
                     'PrefetchCaller closed, all outstanding requests canceled'
                 )
             self._message_buffer.clear()
+            self._send_times.clear()
+            self._cache_keys.clear()
 
     def _process_message(self, message):
         if message.request_id in self._message_buffer:
             future = self._message_buffer.pop(message.request_id)
+            if message.status.code == jina_pb2.StatusProto.DEADLINE_EXCEEDED:
+                self.num_deadline_exceeded += 1
+            if message.request_id in self._send_times:
+                self.window.update(
+                    time.perf_counter() - self._send_times.pop(message.request_id)
+                )
+            if message.request_id in self._cache_keys:
+                key, request = self._cache_keys.pop(message.request_id)
+                self.cache.put(key, message, request)
             future.set_result(message)
         else:
             self.logger.warning(
@@ -70,6 +184,12 @@ class PrefetchCaller:
         """
         Stop receiving messages
         """
+        if self.num_deadline_exceeded:
+            self.logger.info(
+                f'{self.num_deadline_exceeded} requests were skipped as their deadline passed'
+            )
+        if self.cache is not None:
+            self.logger.info(f'response cache: {self.cache.stats}')
         self._receive_task.cancel()
 
     async def send(self, request_iterator, *args) -> AsyncGenerator[None, Message]:
@@ -109,7 +229,21 @@ class PrefetchCaller:
                         )
 
                     future = get_or_reuse_loop().create_future()
+                    if self.cache is not None:
+                        key = self.cache.get_key(next_request)
+                        if key is not None:
+                            response = self.cache.get(key, next_request)
+                            if response is not None:
+                                future.set_result(response)
+                                fetch_to.append(future)
+                                continue
+                            self._cache_keys[next_request.request_id] = (
+                                key,
+                                next_request,
+                            )
                     self._message_buffer[next_request.request_id] = future
+                    if self.window is not None:
+                        self._send_times[next_request.request_id] = time.perf_counter()
                     asyncio.create_task(
                         self.iolet.send_message(
                             Message(None, next_request, 'gateway', **vars(self.args))
@@ -122,7 +256,9 @@ class PrefetchCaller:
             return False
 
         prefetch_task = []
-        is_req_empty = await prefetch_req(self.args.prefetch, prefetch_task)
+        is_req_empty = await prefetch_req(
+            1 if self.window is not None else self.args.prefetch, prefetch_task
+        )
         if is_req_empty and not prefetch_task:
             self.logger.error(
                 'receive an empty stream from the client! '
@@ -131,8 +267,13 @@ class PrefetchCaller:
             )
             return
 
+        if self.window is not None:
+            async for r in self._send_adaptive(
+                prefetch_req, prefetch_task, is_req_empty
+            ):
+                yield r
         # the total num requests < self.args.prefetch
-        if is_req_empty:
+        elif is_req_empty:
             for r in asyncio.as_completed(prefetch_task):
                 yield await r
         else:
@@ -157,3 +298,39 @@ class PrefetchCaller:
                 # this list dries, clear it and feed it with on_recv_task
                 prefetch_task.clear()
                 prefetch_task = [j for j in onrecv_task]
+
+    async def _send_adaptive(
+        self, prefetch_req, pending: List[Future], is_req_empty: bool
+    ) -> AsyncGenerator[None, Message]:
+        """Keep the requests of all streams in flight up to the adaptive window, and yield the responses as they come.
+
+        :param prefetch_req: the function fetching and sending requests of this stream
+        :param pending: the requests of this stream in flight
+        :param is_req_empty: True if all requests of this stream are sent
+        :yield: message
+        """
+        done = asyncio.Queue()
+        num_pending = 0
+        while True:
+            # every stream keeps at least one request in flight, so none of them starves, the responses not yielded yet
+            # count as well, so they do not pile up if the client is slower than the Flow
+            while not is_req_empty and (
+                not num_pending + len(pending)
+                or max(len(self._message_buffer), num_pending + len(pending))
+                < self.window.size
+            ):
+                is_req_empty = await prefetch_req(1, pending)
+            for future in pending:
+                future.add_done_callback(done.put_nowait)
+            num_pending += len(pending)
+            pending.clear()
+            if not num_pending:
+                return
+            if self.logger.debug_enabled:
+                self.logger.debug(f'adaptive prefetch: {self.window.stats}')
+            futures = [await done.get()]
+            while not done.empty():
+                futures.append(done.get_nowait())
+            num_pending -= len(futures)
+            for future in futures:
+                yield future.result()
@@ -5,20 +5,27 @@ import threading
 import time
 from abc import ABC
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Union, Dict, List
 
 from grpc import RpcError
 
 from jina.enums import OnErrorStrategy
-from jina.excepts import NoExplicitMessage, ChainedPodException, RuntimeTerminated
+from jina.excepts import (
+    NoExplicitMessage,
+    ChainedPodException,
+    DeadlineExceeded,
+    RuntimeTerminated,
+)
 from jina.helper import get_or_reuse_loop, random_identity
 from jina.peapods.grpc import Grpclet
 from jina.peapods.runtimes.base import BaseRuntime
 from jina.peapods.runtimes.request_handlers.data_request_handler import (
     DataRequestHandler,
 )
+from jina.peapods.runtimes.request_handlers.dynamic_batching import DynamicBatcher
 from jina.proto import jina_pb2
-from jina.types.message import Message
+from jina.types.message import Message, Request
 from jina.types.routing.table import RoutingTable
 
 
@@ -41,6 +48,19 @@ class GRPCDataRuntime(BaseRuntime, ABC):
         self._static_routing_table = args.static_routing_table
 
         self._data_request_handler = DataRequestHandler(args, self.logger)
+        # the executor is called in these threads, so that the event loop keeps receiving and sending messages
+        self._thread_pool = ThreadPoolExecutor(max_workers=args.threads)
+        self._batcher = DynamicBatcher(
+            args.uses_dynamic_batching,
+            self._data_request_handler,
+            self.name,
+            self._thread_pool,
+        )
+        # every message is handled in its own task, this bounds the ones waiting for the executor, a batch is only
+        # filled if enough of its messages can be in flight
+        self._inflight = asyncio.Semaphore(
+            max(args.max_inflight, self._batcher.max_batch_size)
+        )
         self._grpclet = Grpclet(
             args=self.args,
             message_callback=self._callback,
@@ -59,6 +79,7 @@ class GRPCDataRuntime(BaseRuntime, ABC):
         """Close the `Grpclet` and `DataRequestHandler`."""
         self.logger.debug('Teardown GRPCDataRuntime')
 
+        self._thread_pool.shutdown()
         self._data_request_handler.close()
         start = time.time()
         while self._pending_tasks and time.time() - start < 1.0:
@@ -127,6 +148,8 @@ class GRPCDataRuntime(BaseRuntime, ABC):
         except RpcError:
             # TERMINATE can fail if the the runtime dies before sending the return value
             pass
+        finally:
+            Grpclet.close_ctrl_channels(control_address)
 
     @staticmethod
     def wait_for_ready_or_shutdown(
@@ -155,7 +178,23 @@ class GRPCDataRuntime(BaseRuntime, ABC):
 
     async def _callback(self, msg: Message) -> None:
         try:
-            msg = self._post_hook(self._handle(self._pre_hook(msg)))
+            msg = self._pre_hook(msg)
+            if not msg.is_data_request:
+                msg = self._handle(msg)
+            else:
+                async with self._inflight:
+                    if (
+                        self._batcher.is_batched(msg)
+                        and self._get_expected_parts(msg) == 1
+                    ):
+                        msg = await self._batcher.handle(msg)
+                    elif self._data_request_handler.is_async(msg):
+                        msg = await self._handle_async(msg)
+                    else:
+                        msg = await self._loop.run_in_executor(
+                            self._thread_pool, self._handle, msg
+                        )
+            msg = self._post_hook(msg)
             if msg.is_data_request:
                 asyncio.create_task(self._grpclet.send_message(msg))
         except RuntimeTerminated:
@@ -172,6 +211,10 @@ class GRPCDataRuntime(BaseRuntime, ABC):
             # silent and do not propagate message anymore
             # 1. wait partial message to be finished
             pass
+        except DeadlineExceeded:
+            msg = self._post_hook(msg)
+            msg.add_deadline_exceeded()
+            asyncio.create_task(self._grpclet.send_message(msg))
         except (RuntimeError, Exception, ChainedPodException) as ex:
             if self.args.on_error_strategy == OnErrorStrategy.THROW_EARLY:
                 raise
@@ -211,22 +254,35 @@ class GRPCDataRuntime(BaseRuntime, ABC):
             self.logger.debug(f'skip executor: not data request')
             return msg
 
-        req_id = msg.envelope.request_id
-        num_expected_parts = self._get_expected_parts(msg)
         self._data_request_handler.handle(
             msg=msg,
-            partial_requests=[m.request for m in self._pending_msgs[req_id]]
-            if num_expected_parts > 1
-            else None,
+            partial_requests=self._get_partial_requests(msg),
+            peapod_name=self.name,
+        )
+
+        return msg
+
+    async def _handle_async(self, msg: Message) -> Message:
+        """Same as :meth:`_handle`, but for a DataRequest of an ``async def`` endpoint of the executor.
+        :param msg: received message
+        :return: the transformed message.
+        """
+        await self._data_request_handler.handle_async(
+            msg=msg,
+            partial_requests=self._get_partial_requests(msg),
             peapod_name=self.name,
         )
 
         return msg
 
+    def _get_partial_requests(self, msg: Message) -> Optional[List[Request]]:
+        if self._get_expected_parts(msg) > 1:
+            return [m.request for m in self._pending_msgs[msg.envelope.request_id]]
+
     def _get_expected_parts(self, msg):
         if msg.is_data_request:
             if not self._static_routing_table:
-                graph = RoutingTable(msg.envelope.routing_table)
+                graph = RoutingTable.from_envelope(msg.envelope)
                 return graph.active_target_pod.expected_parts
             else:
                 return self.args.num_part
@@ -268,6 +324,10 @@ class GRPCDataRuntime(BaseRuntime, ABC):
         ):
             raise ChainedPodException
 
+        if msg.is_data_request and msg.is_deadline_exceeded:
+            # the client does not wait for the result anymore
+            raise DeadlineExceeded
+
         return msg
 
     def _log_info_msg(self, msg, part_str):
@@ -1,3 +1,4 @@
+import inspect
 import re
 from typing import Dict, List, Optional, TYPE_CHECKING
 
@@ -5,10 +6,12 @@ from .... import __default_endpoint__
 from ....excepts import (
     ExecutorFailToLoad,
     BadConfigSource,
+    DeadlineExceeded,
 )
 from ....executors import BaseExecutor
 from ....helper import typename
-from ....types.arrays.document import DocumentArray
+from ....proto import jina_pb2
+from ....types.arrays.document import DocumentArray, FlattenedContainer
 from ....types.arrays.abstract import AbstractDocumentArray
 from ....types.message import Message, Request
 
@@ -52,6 +55,45 @@ def _get_docs_from_msg(
         return result
 
 
+def _get_docs_bytes_from_msg(
+    msg: 'Message',
+    partial_request: List[Request],
+) -> Optional[bytes]:
+    """Merge the Documents of the partial requests at the byte level, without parsing them.
+
+    This only works when none of the partial requests is touched, compressed, quantized or has out-of-band
+    tensor frames, otherwise None is returned and the Documents have to be merged as :class:`DocumentArray`.
+
+    :param msg: the message the merged Documents are assigned to
+    :param partial_request: the partial requests
+    :return: the serialized ``DataRequestProto`` with the Documents of all partial requests
+    """
+    bodies = []
+    for r in reversed(partial_request):
+        if (
+            r.is_decompressed
+            or r._compression_algorithm
+            or r._tensor_frames
+            or r._request_type != 'data'
+        ):
+            return
+        body = jina_pb2.LazyDataRequestProto()
+        body.ParseFromString(r._lazy_proto.data)
+        if body.embedding_scale:
+            return
+        bodies.append(body)
+
+    # the groundtruths are kept from the request of the message, the same as in :meth:`replace_docs`
+    own = next(
+        (b for r, b in zip(reversed(partial_request), bodies) if r is msg.request),
+        bodies[0],
+    )
+    result = jina_pb2.LazyDataRequestProto()
+    result.docs.extend(d for b in bodies for d in b.docs)
+    result.groundtruths.extend(own.groundtruths)
+    return result.SerializePartialToString()
+
+
 class DataRequestHandler:
     """Object to encapsulate the code related to handle the data requests passing to executor and its returned values"""
 
@@ -98,6 +140,22 @@ class DataRequestHandler:
             parsed_params.update(**specific_parameters)
         return parsed_params
 
+    def is_async(self, msg: 'Message') -> bool:
+        """Check if the message is handled by an ``async def`` endpoint of the executor, which must be awaited via
+        :meth:`handle_async`.
+
+        Only the envelope is read, so the request is not deserialized.
+
+        :param msg: the received message
+        :return: True if the endpoint is a coroutine function
+        """
+        if msg.envelope.request_type != 'DataRequest':
+            return False
+        func = self._executor.requests.get(
+            msg.envelope.header.exec_endpoint
+        ) or self._executor.requests.get(__default_endpoint__)
+        return inspect.iscoroutinefunction(func)
+
     def handle(
         self,
         msg: 'Message',
@@ -110,6 +168,39 @@ class DataRequestHandler:
         :param partial_requests: All the partial requests, to be considered when more than one expected part
         :param peapod_name: the name of the peapod owning this handler
         """
+        kwargs = self._get_executor_kwargs(msg, partial_requests, peapod_name)
+        if kwargs is not None:
+            self._set_result(msg, partial_requests, kwargs, self._executor(**kwargs))
+
+    async def handle_async(
+        self,
+        msg: 'Message',
+        partial_requests: Optional[List[Request]],
+        peapod_name: str,
+    ):
+        """Same as :meth:`handle`, but awaits the executor if its endpoint is an ``async def`` function.
+
+        :param msg: The message to handle containing a DataRequest
+        :param partial_requests: All the partial requests, to be considered when more than one expected part
+        :param peapod_name: the name of the peapod owning this handler
+        """
+        kwargs = self._get_executor_kwargs(msg, partial_requests, peapod_name)
+        if kwargs is not None:
+            r_docs = self._executor(**kwargs)
+            if inspect.isawaitable(r_docs):
+                r_docs = await r_docs
+            self._set_result(msg, partial_requests, kwargs, r_docs)
+
+    def _get_executor_kwargs(
+        self,
+        msg: 'Message',
+        partial_requests: Optional[List[Request]],
+        peapod_name: str,
+    ) -> Optional[Dict]:
+        # the deadline may pass while the message waits for the executor, e.g. in the queue of a thread pool
+        if msg.is_deadline_exceeded:
+            raise DeadlineExceeded
+
         # skip executor if target_peapod mismatch
         if not re.match(msg.envelope.header.target_peapod, peapod_name):
             self.logger.debug(
@@ -126,26 +217,28 @@ class DataRequestHandler:
                 f'skip executor: mismatch request, exec_endpoint: {msg.envelope.header.exec_endpoint}, requests: {self._executor.requests}'
             )
             if partial_requests:
-                DataRequestHandler.replace_docs(
-                    msg,
-                    docs=_get_docs_from_msg(
+                data = _get_docs_bytes_from_msg(msg, partial_request=partial_requests)
+                if data is not None:
+                    DataRequestHandler.replace_data(msg, data)
+                else:
+                    DataRequestHandler.replace_docs(
                         msg,
-                        partial_request=partial_requests,
-                        field='docs',
-                    ),
-                )
+                        docs=_get_docs_from_msg(
+                            msg,
+                            partial_request=partial_requests,
+                            field='docs',
+                        ),
+                    )
             return
 
         params = self._parse_params(msg.request.parameters, self._executor.metas.name)
-        docs = _get_docs_from_msg(
-            msg,
-            partial_request=partial_requests,
-            field='docs',
-        )
-        # executor logic
-        r_docs = self._executor(
+        return dict(
             req_endpoint=msg.envelope.header.exec_endpoint,
-            docs=docs,
+            docs=_get_docs_from_msg(
+                msg,
+                partial_request=partial_requests,
+                field='docs',
+            ),
             parameters=params,
             docs_matrix=_get_docs_matrix_from_message(
                 msg,
@@ -164,6 +257,13 @@ class DataRequestHandler:
             ),
         )
 
+    @staticmethod
+    def _set_result(
+        msg: 'Message',
+        partial_requests: Optional[List[Request]],
+        kwargs: Dict,
+        r_docs: Optional['AbstractDocumentArray'],
+    ):
         # assigning result back to request
         # 1. Return none: do nothing
         # 2. Return nonempty and non-DocumentArray: raise error
@@ -174,11 +274,104 @@ class DataRequestHandler:
                 raise TypeError(
                     f'return type must be {DocumentArray!r} or None, but getting {typename(r_docs)}'
                 )
-            elif r_docs != msg.request.docs:
+            elif not DataRequestHandler._is_view_of(r_docs, msg.request.docs):
                 # this means the returned DocArray is a completely new one
                 DataRequestHandler.replace_docs(msg, r_docs)
         elif partial_requests:
-            DataRequestHandler.replace_docs(msg, docs)
+            DataRequestHandler.replace_docs(msg, kwargs['docs'])
+
+    def handle_batch(self, msgs: List['Message']):
+        """Handle the DataRequests of several messages with one call of the executor.
+
+        The Documents of all requests are passed to the executor as one :class:`DocumentArray`, and the Documents it
+        returns are split back to the requests in order.
+
+        :param msgs: the messages to handle, they must have the same endpoint and parameters
+        """
+        sizes = [len(m.request.docs) for m in msgs]
+        kwargs = self._get_batch_kwargs(msgs)
+        self._set_batch_result(msgs, sizes, kwargs, self._executor(**kwargs))
+
+    async def handle_batch_async(self, msgs: List['Message']):
+        """Same as :meth:`handle_batch`, but awaits the executor if its endpoint is an ``async def`` function.
+
+        :param msgs: the messages to handle, they must have the same endpoint and parameters
+        """
+        sizes = [len(m.request.docs) for m in msgs]
+        kwargs = self._get_batch_kwargs(msgs)
+        r_docs = self._executor(**kwargs)
+        if inspect.isawaitable(r_docs):
+            r_docs = await r_docs
+        self._set_batch_result(msgs, sizes, kwargs, r_docs)
+
+    def _get_batch_kwargs(self, msgs: List['Message']) -> Dict:
+        # a view over the Documents of all requests, modifying them in place modifies the requests
+        docs = DocumentArray(FlattenedContainer(m.request.docs._pb_body for m in msgs))
+        groundtruths = DocumentArray(
+            FlattenedContainer(m.request.groundtruths._pb_body for m in msgs)
+        )
+        return dict(
+            req_endpoint=msgs[0].envelope.header.exec_endpoint,
+            docs=docs if len(docs) else None,
+            parameters=self._parse_params(
+                msgs[0].request.parameters, self._executor.metas.name
+            ),
+            docs_matrix=[docs] if len(docs) else None,
+            groundtruths=groundtruths if len(groundtruths) else None,
+            groundtruths_matrix=[groundtruths] if len(groundtruths) else None,
+        )
+
+    @staticmethod
+    def _set_batch_result(
+        msgs: List['Message'],
+        sizes: List[int],
+        kwargs: Dict,
+        r_docs: Optional['AbstractDocumentArray'],
+    ):
+        docs = kwargs['docs']
+        if r_docs is None or docs is None:
+            return
+        if not isinstance(r_docs, AbstractDocumentArray):
+            raise TypeError(
+                f'return type must be {DocumentArray!r} or None, but getting {typename(r_docs)}'
+            )
+        if DataRequestHandler._is_view_of(r_docs, docs):
+            return
+        if len(r_docs) != len(docs):
+            raise ValueError(
+                f'an endpoint with dynamic batching must return one Document per input Document, '
+                f'but getting {len(r_docs)} for {len(docs)}'
+            )
+        start = 0
+        for msg, size in zip(msgs, sizes):
+            DataRequestHandler.replace_docs(msg, r_docs[start : start + size])
+            start += size
+
+    @staticmethod
+    def _is_view_of(docs: 'AbstractDocumentArray', target: 'DocumentArray') -> bool:
+        """Check if `docs` holds exactly the Document protos of `target` in the same order.
+
+        Only the identity of the proto container or of its elements is compared, never their content,
+        so a result built from new Documents is always considered different.
+
+        :param docs: the DocumentArray returned by the executor
+        :param target: the DocumentArray of the request
+        :return: True if `docs` is a view of `target`
+        """
+        body = getattr(docs, '_pb_body', None)
+        if body is target._pb_body:
+            return True
+        if isinstance(body, FlattenedContainer):
+            # e.g. `docs.traverse_flat(['r', 'c'])` when the Documents have no chunks
+            containers = [c for c in body.containers if len(c)]
+            if len(containers) == 1 and containers[0] is target._pb_body:
+                return True
+            body = list(body)
+        return (
+            isinstance(body, list)
+            and len(body) == len(target._pb_body)
+            and all(a is b for a, b in zip(body, target._pb_body))
+        )
 
     @staticmethod
     def replace_docs(msg, docs):
@@ -187,9 +380,23 @@ class DataRequestHandler:
         :param msg: The message object
         :param docs: the new docs to be used
         """
+        # the new docs may be a view on the protos of the request, so they are collected before clearing it
+        docs = list(docs)
         msg.request.docs.clear()
         msg.request.docs.extend(docs)
 
+    @staticmethod
+    def replace_data(msg, data):
+        """Replaces the body of the request in a message with a serialized data request, without parsing it.
+
+        :param msg: The message object
+        :param data: the serialized ``DataRequestProto``
+        """
+        r = jina_pb2.LazyRequestProto()
+        r.CopyFrom(msg.request._lazy_proto)
+        r.data = data
+        msg.request = r.SerializePartialToString()
+
     def close(self):
         """ Close the data request handler, by closing the executor """
         self._executor.close()
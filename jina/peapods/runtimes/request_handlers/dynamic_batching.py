@@ -0,0 +1,149 @@
+import asyncio
+import inspect
+import json
+import re
+from concurrent.futures import Executor
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
+
+from .... import __default_endpoint__
+
+if TYPE_CHECKING:
+    from .data_request_handler import DataRequestHandler
+    from ....types.message import Message
+
+__all__ = ['DynamicBatcher']
+
+
+class _Batch:
+    """The messages collected for one call of the executor."""
+
+    def __init__(self, loop: 'asyncio.AbstractEventLoop'):
+        self.msgs = []  # type: List['Message']
+        self.num_docs = 0
+        self.future = loop.create_future()
+        self.timer = None  # type: Optional['asyncio.TimerHandle']
+
+
+class DynamicBatcher:
+    """Merge the DataRequests of several messages to the same endpoint into one call of the executor.
+
+    The first message of a batch starts a timer of ``max_wait_ms``. The batch is handled once it holds
+    ``max_batch_size`` Documents or the timer expires, whichever comes first. The executor gets the Documents of all
+    messages as one :class:`DocumentArray`, and each message gets its own Documents back, so every request is still
+    answered with its own envelope.
+
+    Only messages with the same endpoint and the same parameters are batched together. An endpoint with dynamic
+    batching must return None, modify the Documents in place, or return one Document per input Document in order.
+
+    .. highlight:: python
+    .. code-block:: python
+
+        f = Flow().add(
+            uses=MyEncoder,
+            uses_dynamic_batching={'/encode': {'max_batch_size': 64, 'max_wait_ms': 10}},
+        )
+
+    :param config: the batching config per endpoint, i.e. ``max_batch_size`` and ``max_wait_ms``
+    :param data_request_handler: the handler calling the executor
+    :param peapod_name: the name of the peapod owning the handler
+    :param thread_pool: if given, endpoints that are not ``async def`` are called in these threads, otherwise they
+        block the event loop
+    """
+
+    def __init__(
+        self,
+        config: Dict[str, Dict],
+        data_request_handler: 'DataRequestHandler',
+        peapod_name: str,
+        thread_pool: Optional[Executor] = None,
+    ):
+        self._config = {}  # type: Dict[str, Tuple[int, float]]
+        for endpoint, c in (config or {}).items():
+            max_batch_size = int(c.get('max_batch_size', 32))
+            max_wait_ms = float(c.get('max_wait_ms', 10))
+            if max_batch_size < 1 or max_wait_ms < 0:
+                raise ValueError(
+                    f'invalid dynamic batching config of {endpoint}: {c}, `max_batch_size` must be positive '
+                    f'and `max_wait_ms` must not be negative'
+                )
+            self._config[endpoint] = (max_batch_size, max_wait_ms / 1000)
+        self._handler = data_request_handler
+        self._peapod_name = peapod_name
+        self._thread_pool = thread_pool
+        self._batches = {}  # type: Dict[Tuple[str, str], _Batch]
+
+    @property
+    def max_batch_size(self) -> int:
+        """The largest ``max_batch_size`` of all endpoints, 0 if no endpoint is batched.
+
+        .. # noqa: DAR201"""
+        return max((c[0] for c in self._config.values()), default=0)
+
+    def _get_config(self, endpoint: str) -> Optional[Tuple[int, float]]:
+        if endpoint in self._config:
+            return self._config[endpoint]
+        if endpoint not in self._handler._executor.requests:
+            # the request is handled by the default endpoint of the executor
+            return self._config.get(__default_endpoint__)
+
+    def is_batched(self, msg: 'Message') -> bool:
+        """Check if the message goes to an endpoint with dynamic batching.
+
+        Only the envelope is read, so the request is not deserialized.
+
+        :param msg: the received message
+        :return: True if the message is handled via :meth:`handle`
+        """
+        if not self._config or msg.envelope.request_type != 'DataRequest':
+            return False
+        header = msg.envelope.header
+        return self._get_config(header.exec_endpoint) is not None and bool(
+            re.match(header.target_peapod, self._peapod_name)
+        )
+
+    async def handle(self, msg: 'Message') -> 'Message':
+        """Add the message to the pending batch of its endpoint and wait until the batch is handled.
+
+        :param msg: the received message, :meth:`is_batched` must be True for it
+        :return: the message with the result of the executor
+        """
+        endpoint = msg.envelope.header.exec_endpoint
+        max_batch_size, max_wait = self._get_config(endpoint)
+        key = (
+            endpoint,
+            json.dumps(msg.request.parameters, sort_keys=True, default=str),
+        )
+
+        loop = asyncio.get_event_loop()
+        batch = self._batches.get(key)
+        if batch is None:
+            batch = self._batches[key] = _Batch(loop)
+            batch.timer = loop.call_later(max_wait, self._flush, key, batch)
+        batch.msgs.append(msg)
+        batch.num_docs += len(msg.request.docs)
+        if batch.num_docs >= max_batch_size:
+            self._flush(key, batch)
+
+        await asyncio.shield(batch.future)
+        return msg
+
+    def _flush(self, key: Tuple[str, str], batch: '_Batch'):
+        if self._batches.get(key) is not batch:
+            # the batch is already flushed
+            return
+        del self._batches[key]
+        batch.timer.cancel()
+        asyncio.ensure_future(self._run(batch))
+
+    async def _run(self, batch: '_Batch'):
+        try:
+            if self._handler.is_async(batch.msgs[0]) or self._thread_pool is None:
+                await self._handler.handle_batch_async(batch.msgs)
+            else:
+                await asyncio.get_event_loop().run_in_executor(
+                    self._thread_pool, self._handler.handle_batch, batch.msgs
+                )
+        except Exception as ex:
+            batch.future.set_exception(ex)
+        else:
+            batch.future.set_result(None)
@@ -1,26 +1,31 @@
 import argparse
+import asyncio
 import time
 from collections import defaultdict
-from typing import Dict, List, Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Dict, List, Optional, Set, Union
 
 import zmq
 
 
 from .base import ZMQRuntime
 from ..request_handlers.data_request_handler import DataRequestHandler
+from ..request_handlers.dynamic_batching import DynamicBatcher
 from ...zmq import ZmqStreamlet
 from ....enums import OnErrorStrategy, SocketType
 from ....excepts import (
     NoExplicitMessage,
     MemoryOverHighWatermark,
     ChainedPodException,
+    DeadlineExceeded,
     RuntimeTerminated,
     UnknownControlCommand,
 )
 from ....helper import random_identity
 from ....logging.profile import used_memory
 from ....proto import jina_pb2
-from ....types.message import Message
+from ....types.message import Message, Request
 from ....types.routing.table import RoutingTable
 
 if False:
@@ -49,7 +54,23 @@ class ZEDRuntime(ZMQRuntime):
         # idle_dealer_ids only becomes non-None when it receives IDLE ControlRequest
         self._idle_dealer_ids = set()
 
+        # the messages being handled by `async def` endpoints of the executor
+        self._inflight_tasks = set()  # type: Set[asyncio.Future]
+        self._is_inflight_paused = False
+
         self._data_request_handler = DataRequestHandler(self.args, self.logger)
+        # with several threads, all of them share the executor, the event loop only receives and sends messages
+        self._thread_pool = (
+            ThreadPoolExecutor(max_workers=args.threads) if args.threads > 1 else None
+        )
+        self._batcher = DynamicBatcher(
+            args.uses_dynamic_batching,
+            self._data_request_handler,
+            self.name,
+            self._thread_pool,
+        )
+        # a batch is only filled if enough of its messages can be in flight
+        self._max_inflight = max(args.max_inflight, self._batcher.max_batch_size)
         self._static_routing_table = args.static_routing_table
 
         self._load_zmqstreamlet()
@@ -61,6 +82,8 @@ class ZEDRuntime(ZMQRuntime):
     def teardown(self):
         """Close the `ZmqStreamlet` and `Executor`."""
         self._zmqstreamlet.close()
+        if self._thread_pool is not None:
+            self._thread_pool.shutdown()
         self._data_request_handler.close()
         super().teardown()
 
@@ -122,6 +145,10 @@ class ZEDRuntime(ZMQRuntime):
         ):
             raise ChainedPodException
 
+        if msg.is_data_request and msg.is_deadline_exceeded:
+            # the client does not wait for the result anymore
+            raise DeadlineExceeded
+
         return msg
 
     def _log_info_msg(self, msg, part_str):
@@ -180,6 +207,41 @@ class ZEDRuntime(ZMQRuntime):
             self.logger.debug(f'skip executor: not data request')
             return msg
 
+        self._route_to_idle_dealer(msg)
+        self._data_request_handler.handle(
+            msg=msg,
+            partial_requests=self._get_partial_requests(msg),
+            peapod_name=self.name,
+        )
+
+        return msg
+
+    async def _handle_async(self, msg: 'Message') -> 'Message':
+        """Same as :meth:`_handle`, but for a DataRequest of an ``async def`` endpoint of the executor, of an
+        endpoint with dynamic batching, or of any endpoint with several threads.
+
+        :param msg: received message
+        :return: the transformed message.
+        """
+        self._route_to_idle_dealer(msg)
+        if self._batcher.is_batched(msg) and self._expect_parts(msg) == 1:
+            return await self._batcher.handle(msg)
+
+        kwargs = dict(
+            msg=msg,
+            partial_requests=self._get_partial_requests(msg),
+            peapod_name=self.name,
+        )
+        if self._thread_pool is None or self._data_request_handler.is_async(msg):
+            await self._data_request_handler.handle_async(**kwargs)
+        else:
+            await asyncio.get_event_loop().run_in_executor(
+                self._thread_pool, partial(self._data_request_handler.handle, **kwargs)
+            )
+
+        return msg
+
+    def _route_to_idle_dealer(self, msg: 'Message'):
         # migrated from the previously RouteDriver logic
         # set dealer id
         if self._idle_dealer_ids:
@@ -193,17 +255,9 @@ class ZEDRuntime(ZMQRuntime):
                 f'using route, set receiver_id: {msg.envelope.receiver_id}'
             )
 
-        req_id = msg.envelope.request_id
-        num_expected_parts = self._expect_parts(msg)
-        self._data_request_handler.handle(
-            msg=msg,
-            partial_requests=[m.request for m in self._pending_msgs[req_id]]
-            if num_expected_parts > 1
-            else None,
-            peapod_name=self.name,
-        )
-
-        return msg
+    def _get_partial_requests(self, msg: 'Message') -> Optional[List['Request']]:
+        if self._expect_parts(msg) > 1:
+            return [m.request for m in self._pending_msgs[msg.envelope.request_id]]
 
     def _handle_control_req(self, msg: 'Message'):
         # migrated from previous ControlDriver logic
@@ -244,6 +298,14 @@ class ZEDRuntime(ZMQRuntime):
 
         :param msg: received message
         """
+        if (
+            self._data_request_handler.is_async(msg)
+            or self._batcher.is_batched(msg)
+            or (self._thread_pool is not None and msg.is_data_request)
+        ):
+            self._start_async_callback(msg)
+            return
+
         try:
             # notice how executor related exceptions are handled here
             # generally unless executor throws an OSError, the exception are caught and solved inplace
@@ -253,8 +315,11 @@ class ZEDRuntime(ZMQRuntime):
                 self._zmqstreamlet.send_message(processed_msg)
         except RuntimeTerminated:
             # this is the proper way to end when a terminate signal is sent
-            self._zmqstreamlet.send_message(msg)
-            self._zmqstreamlet.close()
+            if self._inflight_tasks:
+                asyncio.ensure_future(self._terminate_after_inflight(msg))
+            else:
+                self._zmqstreamlet.send_message(msg)
+                self._zmqstreamlet.close()
         except KeyboardInterrupt as kbex:
             # save executor
             self.logger.debug(f'{kbex!r} causes the breaking from the event loop')
@@ -274,6 +339,11 @@ class ZEDRuntime(ZMQRuntime):
             # 1. wait partial message to be finished
             # 2. dealer send a control message and no need to go on
             pass
+        except DeadlineExceeded:
+            if not self.is_post_hook_done:
+                self._post_hook(msg)
+            msg.add_deadline_exceeded()
+            self._zmqstreamlet.send_message(msg)
         except (RuntimeError, Exception, ChainedPodException) as ex:
             # general runtime error and nothing serious, we simply mark the message to error and pass on
             if not self.is_post_hook_done:
@@ -281,22 +351,85 @@ class ZEDRuntime(ZMQRuntime):
 
             if self.args.on_error_strategy == OnErrorStrategy.THROW_EARLY:
                 raise
-            if isinstance(ex, ChainedPodException):
-                # the error is print from previous pod, no need to show it again
-                # hence just add exception and propagate further
-                # please do NOT add logger.error here!
-                msg.add_exception()
-            else:
-                msg.add_exception(ex, executor=self._data_request_handler._executor)
-                self.logger.error(
-                    f'{ex!r}'
-                    + f'\n add "--quiet-error" to suppress the exception details'
-                    if not self.args.quiet_error
-                    else '',
-                    exc_info=not self.args.quiet_error,
-                )
+            self._add_exception(msg, ex)
+            self._zmqstreamlet.send_message(msg)
+
+    def _start_async_callback(self, msg: 'Message'):
+        """Handle the message in a task, so that further messages are received while the executor awaits.
+
+        Receiving is paused while ``max_inflight`` messages are being handled.
+
+        :param msg: received message
+        """
+        task = asyncio.ensure_future(self._async_msg_callback(msg))
+        self._inflight_tasks.add(task)
+        task.add_done_callback(self._on_async_callback_done)
+        if len(self._inflight_tasks) >= self._max_inflight:
+            self._zmqstreamlet.pause_pollin()
+            self._is_inflight_paused = True
+
+    def _on_async_callback_done(self, task: 'asyncio.Future'):
+        self._inflight_tasks.discard(task)
+        if self._is_inflight_paused and len(self._inflight_tasks) < self._max_inflight:
+            self._is_inflight_paused = False
+            self._zmqstreamlet.resume_pollin()
+
+    async def _async_msg_callback(self, msg: 'Message'):
+        """Same as :meth:`_msg_callback` for a DataRequest of an ``async def`` endpoint, of an endpoint with dynamic
+        batching, or of any endpoint with several threads. The response is sent as soon as it completes, regardless
+        of the order of the requests.
+
+        :param msg: received message
+        """
+        is_post_hook_done = False
+        try:
+            msg = self._post_hook(await self._handle_async(self._pre_hook(msg)))
+            is_post_hook_done = True
+            self._zmqstreamlet.send_message(msg)
+        except (SystemError, zmq.error.ZMQError) as ex:
+            self.logger.debug(f'{ex!r} causes the breaking from the event loop')
+            self._zmqstreamlet.send_message(msg)
+            self._zmqstreamlet.close()
+        except MemoryOverHighWatermark:
+            self.logger.critical(
+                f'memory usage {used_memory()} GB is above the high-watermark: {self.args.memory_hwm} GB'
+            )
+        except NoExplicitMessage:
+            pass
+        except DeadlineExceeded:
+            if not is_post_hook_done:
+                self._post_hook(msg)
+            msg.add_deadline_exceeded()
+            self._zmqstreamlet.send_message(msg)
+        except (RuntimeError, Exception, ChainedPodException) as ex:
+            if not is_post_hook_done:
+                self._post_hook(msg)
 
+            self._add_exception(msg, ex)
             self._zmqstreamlet.send_message(msg)
+            if self.args.on_error_strategy == OnErrorStrategy.THROW_EARLY:
+                # raising in the task would only log the exception, so the error is sent on and the runtime stops
+                self._zmqstreamlet.close()
+
+    async def _terminate_after_inflight(self, msg: 'Message'):
+        await asyncio.wait(list(self._inflight_tasks))
+        self._zmqstreamlet.send_message(msg)
+        self._zmqstreamlet.close()
+
+    def _add_exception(self, msg: 'Message', ex: Exception):
+        if isinstance(ex, ChainedPodException):
+            # the error is print from previous pod, no need to show it again
+            # hence just add exception and propagate further
+            # please do NOT add logger.error here!
+            msg.add_exception()
+        else:
+            msg.add_exception(ex, executor=self._data_request_handler._executor)
+            self.logger.error(
+                f'{ex!r}' + f'\n add "--quiet-error" to suppress the exception details'
+                if not self.args.quiet_error
+                else '',
+                exc_info=not self.args.quiet_error,
+            )
 
     #: Some class-specific properties
 
@@ -321,7 +454,7 @@ class ZEDRuntime(ZMQRuntime):
                 self.args.socket_in == SocketType.ROUTER_BIND
                 and not self._static_routing_table
             ):
-                graph = RoutingTable(msg.envelope.routing_table)
+                graph = RoutingTable.from_envelope(msg.envelope)
                 return graph.active_target_pod.expected_parts
             else:
                 return self.args.num_part
@@ -10,6 +10,7 @@ import zmq.asyncio
 from zmq.eventloop.zmqstream import ZMQStream
 from zmq.ssh import tunnel_connection
 
+from . import shm
 from ..networking import get_connect_host
 from ... import __default_host__
 from ...enums import SocketType
@@ -52,6 +53,10 @@ class Zmqlet:
         self.name = str(args.name) or self.__class__.__name__
         self.logger = logger
         self.send_recv_kwargs = vars(args)
+        if getattr(args, 'shared_memory', False) and not shm.is_available():
+            (logger or default_logger).warning(
+                'shared memory is not available on this platform, frames are sent via the socket'
+            )
         if ctrl_addr:
             self.ctrl_addr = ctrl_addr
             self.ctrl_with_ipc = self.ctrl_addr.startswith('ipc://')
@@ -90,10 +95,13 @@ class Zmqlet:
         self.out_sockets = {}
         self._active = True
         self._static_routing_table = args.static_routing_table
+        self._compact_routing_table = args.compact_routing_table
         if args.static_routing_table:
             self._routing_table = RoutingTable(args.routing_table)
         else:
             self._routing_table = None
+            if args.compact_routing_table and args.routing_table:
+                RoutingTable(args.routing_table).register(shared=True)
 
     def _register_pollin(self):
         """Register :attr:`in_sock`, :attr:`ctrl_sock` and :attr:`out_sock` (if :attr:`out_sock_type` is zmq.ROUTER)
@@ -316,7 +324,7 @@ class Zmqlet:
         routing_table = (
             self._routing_table
             if self._routing_table
-            else RoutingTable(message.envelope.routing_table)
+            else RoutingTable.from_envelope(message.envelope)
         )
         next_targets = routing_table.get_next_targets()
         next_routes = []
@@ -333,14 +341,28 @@ class Zmqlet:
             next_routes.append((target, out_socket))
         return next_routes
 
+    def _add_routing_table(
+        self, routing_table: 'RoutingTable', envelope: 'jina_pb2.EnvelopeProto'
+    ):
+        if not self._compact_routing_table:
+            routing_table.add_to_envelope(envelope)
+            return
+
+        # zmq does not acknowledge messages, so only a receiver the Flow registered the table with gets a reference
+        routing_table.add_to_envelope(
+            envelope,
+            compact=True,
+            with_table=not routing_table.is_registered_with_target,
+        )
+
     def _send_message_dynamic(self, msg: 'Message'):
         next_routes = self._get_dynamic_next_routes(msg)
         for routing_table, out_sock in next_routes:
             new_envelope = jina_pb2.EnvelopeProto()
             new_envelope.CopyFrom(msg.envelope)
             if not self._static_routing_table:
-                new_envelope.routing_table.CopyFrom(routing_table.proto)
-            new_message = Message(request=msg.request, envelope=new_envelope)
+                self._add_routing_table(routing_table, new_envelope)
+            new_message = msg.fork(new_envelope)
 
             new_message.envelope.receiver_id = (
                 routing_table.active_target_pod.target_identity
@@ -437,8 +459,8 @@ class AsyncZmqlet(Zmqlet):
             new_envelope = jina_pb2.EnvelopeProto()
             new_envelope.CopyFrom(msg.envelope)
             if not self._static_routing_table:
-                new_envelope.routing_table.CopyFrom(routing_table.proto)
-            new_message = Message(request=msg.request, envelope=new_envelope)
+                self._add_routing_table(routing_table, new_envelope)
+            new_message = msg.fork(new_envelope)
             asyncio.create_task(self._send_message_via(out_sock, new_message))
 
     async def _send_message_via(self, socket, msg):
@@ -645,6 +667,7 @@ def send_message(
     msg: 'Message',
     raise_exception: bool = False,
     timeout: int = -1,
+    shared_memory: bool = False,
     **kwargs,
 ) -> int:
     """Send a protobuf message to a socket
@@ -653,13 +676,20 @@ def send_message(
     :param msg: the protobuf message
     :param raise_exception: if true: raise an exception which might occur during send, if false: log error
     :param timeout: waiting time (in seconds) for sending
+    :param shared_memory: if set, large frames are handed over via shared memory, the receiver must be on the same host
     :param kwargs: keyword arguments
     :return: the size (in bytes) of the sent message
     """
     num_bytes = 0
     try:
         _prep_send_socket(sock, timeout)
-        sock.send_multipart(msg.dump())
+        frames, shm_offsets = _dump_message(sock, msg, shared_memory)
+        try:
+            sock.send_multipart(frames, copy=False)
+        except BaseException:
+            # the receiver never gets the descriptors, so the segments are freed for the next messages
+            shm.release_frames(frames, shm_offsets)
+            raise
         num_bytes = msg.size
     except zmq.error.Again:
         raise TimeoutError(
@@ -680,6 +710,30 @@ def send_message(
     return num_bytes
 
 
+def _dump_message(
+    sock: Union['zmq.Socket', 'ZMQStream'], msg: 'Message', shared_memory: bool
+) -> Tuple[List[bytes], List[int]]:
+    if msg.envelope.compression.adaptive:
+        # the adaptive compression is chosen per target
+        msg.target_address = getattr(sock, 'socket', sock).getsockopt_string(
+            zmq.LAST_ENDPOINT
+        )
+    frames = msg.dump()
+    offsets = []
+    # a segment is read only once, so it can not be published to multiple subscribers
+    if (
+        shared_memory
+        and getattr(sock, 'socket', sock).type != zmq.PUB
+        and shm.is_available()
+    ):
+        offsets = shm.write_frames(frames)
+        if offsets:
+            msg.envelope.shm_frames.extend(offsets)
+            frames[-2] = msg.envelope.SerializePartialToString()
+            msg.envelope.ClearField('shm_frames')
+    return frames, offsets
+
+
 def _prep_send_socket(sock, timeout):
     if timeout > 0:
         sock.setsockopt(zmq.SNDTIMEO, timeout)
@@ -695,19 +749,29 @@ def _prep_recv_socket(sock, timeout):
 
 
 async def send_message_async(
-    sock: 'zmq.Socket', msg: 'Message', timeout: int = -1, **kwargs
+    sock: 'zmq.Socket',
+    msg: 'Message',
+    timeout: int = -1,
+    shared_memory: bool = False,
+    **kwargs,
 ) -> int:
     """Send a protobuf message to a socket in async manner
 
     :param sock: the target socket to send
     :param msg: the protobuf message
     :param timeout: waiting time (in seconds) for sending
+    :param shared_memory: if set, large frames are handed over via shared memory, the receiver must be on the same host
     :param kwargs: keyword arguments
     :return: the size (in bytes) of the sent message
     """
     try:
         _prep_send_socket(sock, timeout)
-        await sock.send_multipart(msg.dump())
+        frames, shm_offsets = _dump_message(sock, msg, shared_memory)
+        try:
+            await sock.send_multipart(frames, copy=False)
+        except BaseException:
+            shm.release_frames(frames, shm_offsets)
+            raise
         return msg.size
     except zmq.error.Again:
         raise TimeoutError(
@@ -798,8 +862,9 @@ def _parse_from_frames(sock_type, frames: List[bytes]) -> 'Message':
     The list of frames (has length >=3) has the following structure:
 
         - offset 0: the client id, can be empty
-        - offset 1: is the offset 2 frame compressed
-        - offset 2: the body of the serialized protobuf message
+        - offset 1 to -3: the dense buffers sent out-of-band, if any
+        - offset -2: is the offset -1 frame compressed
+        - offset -1: the body of the serialized protobuf message
 
     :param sock_type: the recv socket type
     :param frames: list of bytes to parse from
@@ -813,7 +878,15 @@ def _parse_from_frames(sock_type, frames: List[bytes]) -> 'Message':
         if len(frames) == 4:
             frames.pop(0)
 
-    return Message(frames[1], frames[2])
+    msg = Message(frames[-2], frames[-1])
+    if msg.envelope.shm_frames:
+        frames = shm.read_frames(frames, msg.envelope.shm_frames)
+        msg.envelope.ClearField('shm_frames')
+        msg.request = frames[-1]
+    num_tensor_frames = msg.envelope.num_tensor_frames
+    if num_tensor_frames:
+        msg.set_tensor_frames(frames[-2 - num_tensor_frames : -2])
+    return msg
 
 
 def _get_random_ipc() -> str:
@@ -0,0 +1,236 @@
+"""Hand over large frames between Peas on the same host via shared memory instead of the socket."""
+import mmap
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Dict, List, Optional, Sequence
+
+from ...logging.predefined import default_logger
+
+if False:
+    from multiprocessing.shared_memory import SharedMemory
+
+__all__ = [
+    'SHM_MIN_BYTES',
+    'is_available',
+    'write_frames',
+    'read_frames',
+    'release_frames',
+]
+
+SHM_MIN_BYTES = int(os.environ.get('JINA_SHM_MIN_BYTES', 1 << 20))
+
+# every segment starts with a header, its first byte tells if the segment holds a frame not read yet
+_HEADER_BYTES = 64
+_FREE, _BUSY = 0, 1
+# the maximum number of segments a process keeps for sending, frames are sent via the socket if all of them are busy
+_MAX_SEGMENTS = 64
+# the time in seconds after which a segment that is still not read, e.g. as its receiver is gone, may be unlinked
+_MAX_BUSY_SECONDS = 60
+# the maximum number of segments of other processes a receiver keeps attached
+_MAX_ATTACHED = 64
+# where the segments live as files on Linux
+_SHM_DIR = '/dev/shm'
+
+_pools = {}  # type: Dict[int, '_SegmentPool']
+_attached = OrderedDict()  # type: Dict[str, memoryview]
+_lock = threading.Lock()
+
+
+def is_available() -> bool:
+    """Check if frames can be handed over via shared memory on this platform.
+
+    :return: True if shared memory is available
+    """
+    if os.name == 'nt':
+        # a segment on Windows is freed as soon as its creator closes it
+        return False
+    try:
+        from multiprocessing import shared_memory  # noqa: F401
+    except ImportError:
+        # Python < 3.8
+        return False
+    return True
+
+
+class _SegmentPool:
+    """The segments a process writes its frames into, a segment is reused once the receiver has read it.
+
+    Reusing segments avoids allocating new pages for every message, which costs as much as copying the frame.
+    """
+
+    def __init__(self):
+        from multiprocessing.util import Finalize
+
+        self._segments = []  # type: List['SharedMemory']
+        # when each segment was last marked as busy
+        self._busy_since = {}  # type: Dict[str, float]
+        self._lock = threading.Lock()
+        # unlike `atexit`, this also runs when a forked Pea exits
+        Finalize(self, self.close, exitpriority=0)
+
+    def acquire(self, size: int) -> Optional['SharedMemory']:
+        """Get a free segment for a frame of `size` bytes and mark it as busy.
+
+        :param size: the size of the frame
+        :return: the segment or None if all segments are busy
+        """
+        with self._lock:
+            free = [
+                s
+                for s in self._segments
+                if s.buf[0] == _FREE and s.size - _HEADER_BYTES >= size
+            ]
+            if free:
+                segment = min(free, key=lambda s: s.size)
+            elif len(self._segments) < _MAX_SEGMENTS or self._evict():
+                segment = self._create(size)
+            else:
+                return None
+            segment.buf[0] = _BUSY
+            self._busy_since[segment.name] = time.monotonic()
+            return segment
+
+    def release(self, name: str):
+        """Mark a segment as free again, e.g. when the frame in it could not be sent.
+
+        :param name: the name of the segment
+        """
+        with self._lock:
+            for segment in self._segments:
+                if segment.name == name:
+                    segment.buf[0] = _FREE
+
+    def _create(self, size: int) -> 'SharedMemory':
+        from multiprocessing.shared_memory import SharedMemory
+
+        # the pages of a segment are only allocated when written, so rounding up is cheap
+        capacity = 1 << (_HEADER_BYTES + size - 1).bit_length()
+        # the segment stays registered with the resource tracker, which unlinks it if this process gets killed
+        segment = SharedMemory(
+            name=f'jina-{uuid.uuid4().hex[:16]}', create=True, size=capacity
+        )
+        self._segments.append(segment)
+        return segment
+
+    def _evict(self) -> bool:
+        free = [s for s in self._segments if s.buf[0] == _FREE]
+        if free:
+            segment = min(free, key=lambda s: s.size)
+        else:
+            # a segment that is not read for long is unlinked rather than reused, so a late receiver fails to
+            # attach it instead of reading another frame
+            deadline = time.monotonic() - _MAX_BUSY_SECONDS
+            stale = [s for s in self._segments if self._busy_since[s.name] < deadline]
+            if not stale:
+                return False
+            segment = min(stale, key=lambda s: self._busy_since[s.name])
+            default_logger.warning(
+                f'unlinking the shared memory {segment.name} that is not read for {_MAX_BUSY_SECONDS}s'
+            )
+        self._segments.remove(segment)
+        self._busy_since.pop(segment.name, None)
+        segment.close()
+        segment.unlink()
+        return True
+
+    def close(self):
+        """Unlink all segments, the frames in them that are not read yet are lost."""
+        with self._lock:
+            for segment in self._segments:
+                if segment.buf[0] == _BUSY:
+                    default_logger.debug(
+                        f'unlinking the shared memory {segment.name} that is not read yet'
+                    )
+                segment.close()
+                try:
+                    segment.unlink()
+                except FileNotFoundError:
+                    pass
+            self._segments.clear()
+            self._busy_since.clear()
+
+
+def _get_pool() -> '_SegmentPool':
+    pid = os.getpid()
+    with _lock:
+        # a forked process must not write into the segments of its parent
+        if pid not in _pools:
+            _pools[pid] = _SegmentPool()
+        return _pools[pid]
+
+
+def _attach(name: str) -> memoryview:
+    with _lock:
+        if name in _attached:
+            _attached.move_to_end(name)
+            return _attached[name]
+        if os.path.isdir(_SHM_DIR):
+            # attaching via `SharedMemory` registers the segment with the resource tracker of the receiver, which
+            # would unlink it when the receiver exits
+            with open(os.path.join(_SHM_DIR, name), 'r+b') as fp:
+                buf = memoryview(mmap.mmap(fp.fileno(), 0))
+        else:
+            from multiprocessing.shared_memory import SharedMemory
+
+            buf = SharedMemory(name=name).buf
+        _attached[name] = buf
+        if len(_attached) > _MAX_ATTACHED:
+            _attached.popitem(last=False)[1].release()
+        return buf
+
+
+def write_frames(frames: List[bytes], min_bytes: Optional[int] = None) -> List[int]:
+    """Move the request and the out-of-band tensor frames of at least `min_bytes` into shared memory segments.
+
+    Each moved frame is replaced in place by a small descriptor of its segment. The segment is reused for later
+    frames once the receiver has read it, and unlinked when this process exits.
+
+    :param frames: the frames of a dumped :class:`Message`, i.e. the receiver id, the tensor frames, the envelope
+        and the request
+    :param min_bytes: the minimum size of a frame to be moved, by default ``JINA_SHM_MIN_BYTES``
+    :return: the offsets of the moved frames from the end of `frames`, 1 is the request
+    """
+    if min_bytes is None:
+        min_bytes = SHM_MIN_BYTES
+    offsets = []
+    for offset in (1, *range(3, len(frames))):
+        size = len(frames[-offset])
+        if size < max(min_bytes, 1):
+            continue
+        segment = _get_pool().acquire(size)
+        if segment is None:
+            continue
+        segment.buf[_HEADER_BYTES : _HEADER_BYTES + size] = frames[-offset]
+        frames[-offset] = f'{segment.name}:{size}'.encode()
+        offsets.append(offset)
+    return offsets
+
+
+def release_frames(frames: List[bytes], offsets: Sequence[int]):
+    """Free the segments of the descriptors written by :func:`write_frames` when the frames could not be sent.
+
+    :param frames: the frames with the descriptors
+    :param offsets: the offsets of the descriptors from the end of `frames`
+    """
+    pool = _get_pool()
+    for offset in offsets:
+        pool.release(bytes(frames[-offset]).decode().rsplit(':', 1)[0])
+
+
+def read_frames(frames: List[bytes], offsets: Sequence[int]) -> List[bytes]:
+    """Replace the descriptors written by :func:`write_frames` by the frames they refer to, and free the segments.
+
+    :param frames: the received frames
+    :param offsets: the offsets of the descriptors from the end of `frames`
+    :return: the frames
+    """
+    for offset in offsets:
+        name, size = frames[-offset].decode().rsplit(':', 1)
+        buf = _attach(name)
+        frames[-offset] = bytes(buf[_HEADER_BYTES : _HEADER_BYTES + int(size)])
+        # the frame is copied out, so the sender can reuse the segment
+        buf[0] = _FREE
+    return frames
@@ -3,6 +3,7 @@
 import grpc
 
 from google.protobuf import empty_pb2 as google_dot_protobuf_dot_empty__pb2
+from google.protobuf import struct_pb2 as google_dot_protobuf_dot_struct__pb2
 from . import serializer as jina__pb2
 
 
@@ -102,6 +103,11 @@ class JinaDataRequestRPCStub(object):
             request_serializer=jina__pb2.MessageProto.SerializeToString,
             response_deserializer=google_dot_protobuf_dot_empty__pb2.Empty.FromString,
         )
+        self.CallStream = channel.stream_stream(
+            '/jina.JinaDataRequestRPC/CallStream',
+            request_serializer=jina__pb2.MessageProto.SerializeToString,
+            response_deserializer=google_dot_protobuf_dot_struct__pb2.Value.FromString,
+        )
 
 
 class JinaDataRequestRPCServicer(object):
@@ -115,6 +121,14 @@ class JinaDataRequestRPCServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def CallStream(self, request_iterator, context):
+        """Pass in a stream of Messages, every Message is acknowledged in order once it is received, the acknowledgement
+        is empty unless the Message refers to a routing table the receiver does not know
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_JinaDataRequestRPCServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -123,6 +137,11 @@ def add_JinaDataRequestRPCServicer_to_server(servicer, server):
             request_deserializer=jina__pb2.MessageProto.FromString,
             response_serializer=google_dot_protobuf_dot_empty__pb2.Empty.SerializeToString,
         ),
+        'CallStream': grpc.stream_stream_rpc_method_handler(
+            servicer.CallStream,
+            request_deserializer=jina__pb2.MessageProto.FromString,
+            response_serializer=google_dot_protobuf_dot_struct__pb2.Value.SerializeToString,
+        ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
         'jina.JinaDataRequestRPC', rpc_method_handlers
@@ -164,3 +183,32 @@ class JinaDataRequestRPC(object):
             timeout,
             metadata,
         )
+
+    @staticmethod
+    def CallStream(
+        request_iterator,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.stream_stream(
+            request_iterator,
+            target,
+            '/jina.JinaDataRequestRPC/CallStream',
+            jina__pb2.MessageProto.SerializeToString,
+            google_dot_protobuf_dot_struct__pb2.Value.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+        )
@@ -19,7 +19,8 @@ class RequestProto:
         # noqa: DAR102
         # noqa: DAR201
         """
-        return x.proto.SerializePartialToString()
+        with x._prepare_for_send():
+            return x.proto.SerializePartialToString()
 
     @staticmethod
     def FromString(x: bytes):
@@ -44,7 +45,7 @@ class MessageProto:
         # noqa: DAR102
         # noqa: DAR201
         """
-        return x.proto.SerializeToString()
+        return x.SerializeToString()
 
     @staticmethod
     def FromString(x: bytes):
@@ -1,11 +1,24 @@
 import re
 from abc import ABC, abstractmethod
 from math import inf
-from typing import Union, List, Tuple, Iterable, Callable, Optional, Dict, Iterator
+from typing import (
+    Union,
+    List,
+    Tuple,
+    Iterable,
+    Callable,
+    Optional,
+    Dict,
+    Iterator,
+    Any,
+    Sequence,
+    Generator,
+)
 
 import numpy as np
 
 if False:
+    from multiprocessing.pool import Pool
     from .document import DocumentArray
     from .memmap import DocumentArrayMemmap
     from .traversable import TraversableSequence
@@ -170,6 +183,69 @@ class AbstractDocumentArray(ABC):
         """
         ...
 
+    @abstractmethod
+    def query(
+        self,
+        predicates: Dict[str, Any],
+        traversal_paths: Sequence[str] = ('r',),
+    ) -> 'DocumentArray':
+        """Find Documents whose tags satisfy all `predicates`.
+
+        :param predicates: Dictionary of the form {tag: value} or {tag: {operator: operand}}
+        :param traversal_paths: List specifying traversal paths
+        """
+        ...
+
+    @abstractmethod
+    def dedup(
+        self, fields: Optional[Sequence[str]] = None, keep: str = 'first'
+    ) -> 'DocumentArray':
+        """Remove Documents with duplicate content, the order of the kept Documents is preserved.
+
+        :param fields: the names of the fields that define the content, by default the fields used by
+            :attr:`Document.content_hash`
+        :param keep: `first` or `last`, which Document of each group of duplicates to keep
+        """
+        ...
+
+    @abstractmethod
+    def map(
+        self,
+        func: Callable[['Document'], Any],
+        backend: str = 'process',
+        num_worker: Optional[int] = None,
+        batch_size: int = 16,
+        pool: Optional['Pool'] = None,
+    ) -> Generator[Any, None, None]:
+        """Apply `func` to every Document in parallel and yield the results in order.
+
+        :param func: the function to apply, it takes a :class:`Document` as input
+        :param backend: `thread` or `process`
+        :param num_worker: the number of workers, by default the number of CPUs
+        :param batch_size: the number of Documents sent to a worker per task
+        :param pool: a pool to run on, by default a persistent pool is used
+        """
+        ...
+
+    @abstractmethod
+    def map_batch(
+        self,
+        func: Callable[['DocumentArray'], Any],
+        batch_size: int,
+        backend: str = 'process',
+        num_worker: Optional[int] = None,
+        pool: Optional['Pool'] = None,
+    ) -> Generator[Any, None, None]:
+        """Apply `func` to every batch of `batch_size` Documents in parallel and yield the results in order.
+
+        :param func: the function to apply, it takes a :class:`DocumentArray` as input
+        :param batch_size: the number of Documents in each batch
+        :param backend: `thread` or `process`
+        :param num_worker: the number of workers, by default the number of CPUs
+        :param pool: a pool to run on, by default a persistent pool is used
+        """
+        ...
+
     @abstractmethod
     def sample(self, k: int, seed: Optional[int] = None) -> 'DocumentArray':
         """random sample k elements from :class:`DocumentArray` without replacement.
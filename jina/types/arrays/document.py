@@ -1,3 +1,4 @@
+import bisect
 import itertools
 import json
 from abc import abstractmethod
@@ -22,9 +23,13 @@ import numpy as np
 
 from .abstract import AbstractDocumentArray
 from .neural_ops import DocumentArrayNeuralOpsMixin
+from .parallel_ops import DocumentArrayParallelOpsMixin
 from .search_ops import DocumentArraySearchOpsMixin
-from .traversable import TraversableSequence
+from .tag_index import TagIndex
+from .traversable import TraversableSequence, _check_traversal_path_type
 from ..document import Document
+from ..ndarray.dense.frames import materialize_frames
+from ..ndarray.dense.numpy import stack_dense_protos
 from ...helper import typename
 from ...proto import jina_pb2
 
@@ -39,7 +44,7 @@ except:
         RepeatedCompositeFieldContainer as RepeatedContainer,
     )
 
-__all__ = ['DocumentArray', 'DocumentArrayGetAttrMixin']
+__all__ = ['DocumentArray', 'DocumentArrayGetAttrMixin', 'FlattenedContainer']
 
 DocumentArraySourceType = TypeVar(
     'DocumentArraySourceType',
@@ -50,6 +55,124 @@ DocumentArraySourceType = TypeVar(
 )
 
 
+class FlattenedContainer(MutableSequence):
+    """A read-through view that concatenates several containers of `DocumentProto` without copying them.
+
+    It is used as the body of the :class:`DocumentArray` returned by :meth:`DocumentArray.traverse_flat`, so that
+    iterating, indexing, :attr:`embeddings` and :meth:`get_attributes` work directly on the nested chunks and
+    matches. Modifying the protos in place is reflected on the nested Documents, while changing the sequence
+    itself (append, insert, delete, sort) first copies the references into a plain list.
+
+    Indexing looks the container up in the cached offsets of the containers. The offsets are rebuilt by ``len()``,
+    or when the container an index falls into has changed its length.
+
+    :param containers: the containers of `DocumentProto` to concatenate
+    """
+
+    def __init__(self, containers: Iterable[Sequence['jina_pb2.DocumentProto']]):
+        self._containers = list(containers)
+        # the lengths of the containers and the position of the first proto of each, rebuilt when a length changes
+        self._lengths = None  # type: Optional[List[int]]
+        self._offsets = None  # type: Optional[List[int]]
+        self._materialized = None  # type: Optional[List['jina_pb2.DocumentProto']]
+
+    def _as_list(self) -> List['jina_pb2.DocumentProto']:
+        if self._materialized is None:
+            self._materialized = list(itertools.chain.from_iterable(self._containers))
+            self._containers, self._lengths, self._offsets = None, None, None
+        return self._materialized
+
+    def _update_offsets(self):
+        lengths = [len(c) for c in self._containers]
+        if lengths != self._lengths:
+            self._lengths = lengths
+            self._offsets = [0, *itertools.accumulate(lengths)]
+
+    def _locate(self, item: int) -> int:
+        if self._offsets is None:
+            self._update_offsets()
+        c = bisect.bisect_right(self._offsets, item) - 1
+        if c >= len(self._containers) or len(self._containers[c]) != self._lengths[c]:
+            # the container changed since the offsets were built, or the position is past the known ones
+            self._update_offsets()
+            c = bisect.bisect_right(self._offsets, item) - 1
+        return c
+
+    @property
+    def containers(self) -> List[Sequence['jina_pb2.DocumentProto']]:
+        """The containers concatenated by the view, or the plain list once it is copied.
+
+        :return: the list of containers
+        """
+        if self._materialized is not None:
+            return [self._materialized]
+        return self._containers
+
+    def __len__(self):
+        if self._materialized is not None:
+            return len(self._materialized)
+        self._update_offsets()
+        return self._offsets[-1]
+
+    def __iter__(self):
+        if self._materialized is not None:
+            return iter(self._materialized)
+        return itertools.chain.from_iterable(self._containers)
+
+    def __getitem__(self, item: Union[int, slice]):
+        if self._materialized is not None:
+            return self._materialized[item]
+        if isinstance(item, slice):
+            start, stop = item.start or 0, item.stop
+            if (
+                item.step not in (None, 1)
+                or start < 0
+                or (stop is not None and stop < 0)
+            ):
+                return [self[i] for i in range(*item.indices(len(self)))]
+            # only the containers the slice starts in and after are read
+            c = self._locate(start)
+            if c >= len(self._containers):
+                return []
+            protos = itertools.chain.from_iterable(
+                itertools.islice(self._containers, c, None)
+            )
+            skip = start - self._offsets[c]
+            end = None if stop is None else skip + max(stop - start, 0)
+            return list(itertools.islice(protos, skip, end))
+        if item < 0:
+            item += len(self)
+        c = self._locate(item) if item >= 0 else -1
+        if not 0 <= c < len(self._containers):
+            raise IndexError('index out of range')
+        return self._containers[c][item - self._offsets[c]]
+
+    def __setitem__(self, key, value):
+        self._as_list()[key] = value
+
+    def __delitem__(self, key):
+        del self._as_list()[key]
+
+    def __eq__(self, other):
+        return list(self) == list(other)
+
+    def insert(self, index: int, value: 'jina_pb2.DocumentProto') -> None:
+        """Insert a proto into the view, this copies the references into a plain list first.
+
+        :param index: Position of the insertion.
+        :param value: the proto to insert
+        """
+        self._as_list().insert(index, value)
+
+    def sort(self, *args, **kwargs) -> None:
+        """Sort the view, this copies the references into a plain list first.
+
+        :param args: positional arguments of :meth:`list.sort`
+        :param kwargs: keyword arguments of :meth:`list.sort`
+        """
+        self._as_list().sort(*args, **kwargs)
+
+
 class DocumentArrayGetAttrMixin:
     """A mixin that provides attributes getter in bulk """
 
@@ -133,11 +256,7 @@ class DocumentArrayGetAttrMixin:
 
         :return: blobs stacked per row as `np.ndarray`.
         """
-        x_mat = b''.join(d.proto.blob.dense.buffer for d in self)
-
-        return np.frombuffer(x_mat, dtype=self[0].proto.blob.dense.dtype).reshape(
-            (len(self), *self[0].proto.blob.dense.shape)
-        )
+        return stack_dense_protos([d.proto.blob.dense for d in self])
 
     @blobs.setter
     def blobs(self, b: np.ndarray):
@@ -160,6 +279,7 @@ class DocumentArray(
     DocumentArrayGetAttrMixin,
     DocumentArrayNeuralOpsMixin,
     DocumentArraySearchOpsMixin,
+    DocumentArrayParallelOpsMixin,
     Itr,
     AbstractDocumentArray,
 ):
@@ -178,12 +298,13 @@ class DocumentArray(
     def __init__(self, docs: Optional[DocumentArraySourceType] = None):
         super().__init__()
         self._pb_body = []
+        self._tag_index = None  # type: Optional[TagIndex]
         if docs is not None:
             if isinstance(docs, jina_pb2.DocumentArrayProto):
                 # This would happen when loading from file or memmap
                 self._pb_body = docs.docs
-            elif isinstance(docs, RepeatedContainer):
-                # This would happen when `doc.matches` or `doc.chunks`
+            elif isinstance(docs, (RepeatedContainer, FlattenedContainer)):
+                # This would happen when `doc.matches` or `doc.chunks` or `traverse_flat`
                 self._pb_body = docs
             elif isinstance(docs, DocumentArray):
                 # This would happen in the client
@@ -199,8 +320,10 @@ class DocumentArray(
                     # This would happen in the client
                     for doc in docs:
                         if isinstance(doc, Document):
+                            materialize_frames(doc.proto)
                             self._pb_body.append(doc.proto)
                         elif isinstance(doc, jina_pb2.DocumentProto):
+                            materialize_frames(doc)
                             self._pb_body.append(doc)
                         else:
                             raise ValueError(f'Unexpected element in an input list')
@@ -211,14 +334,88 @@ class DocumentArray(
         self._update_id_to_index_map()
 
     def _update_id_to_index_map(self):
-        """Update the id_to_index map by enumerating all Documents in self._pb_body.
+        """Invalidate the id_to_index map, so that it is rebuilt lazily on the next lookup by id.
 
-        Very costy! Only use this function when self._pb_body is dramtically changed.
+        Only use this function when self._pb_body is dramatically changed, e.g. sorted or reversed.
+        """
+        # id -> (position, number of mutations logged before the position was recorded)
+        self._id_to_index = {}  # type: Dict[str, Tuple[int, int]]
+        # all Documents before this position are indexed and unaffected by the logged mutations
+        self._id_to_index_valid_upto = 0
+        # positional mutations not yet compacted into the map, as (position, shift) pairs
+        self._id_to_index_log = []  # type: List[Tuple[int, int]]
+        self._id_to_index_epoch = 0
+
+    def _log_id_to_index_shift(self, position: int, shift: int):
+        """Record that all Documents at or after :param:`position` moved by :param:`shift`.
+
+        The map itself is not touched, stale positions are translated on lookup. The log is
+        compacted into the map once it grows beyond ``sqrt(len(self))`` entries.
+
+        :param position: the first position affected by the mutation
+        :param shift: the number of positions the affected Documents moved by
         """
+        self._id_to_index_valid_upto = min(
+            self._id_to_index_valid_upto, position, len(self._pb_body)
+        )
+        self._id_to_index_log.append((position, shift))
+        self._id_to_index_epoch += 1
+        if len(self._id_to_index_log) > max(32, int(len(self._pb_body) ** 0.5)):
+            self._compact_id_to_index_map()
+
+    def _compact_id_to_index_map(self):
+        """Re-index all Documents after the first logged mutation, costs O(n - valid_upto)."""
+        for i in range(self._id_to_index_valid_upto, len(self._pb_body)):
+            self._id_to_index[self._pb_body[i].id] = (i, self._id_to_index_epoch)
+        self._id_to_index_valid_upto = len(self._pb_body)
+        self._id_to_index_log.clear()
+
+    def _get_index_by_id(self, key: str) -> int:
+        """Get the position of a Document given its id.
+
+        :param key: the id of the Document
+        :return: the position of the Document in this array
+        :raises KeyError: if no Document with this id is in the array
+        """
+        if key not in self._id_to_index:
+            if self._id_to_index_valid_upto == len(self._pb_body):
+                raise KeyError(key)
+            self._compact_id_to_index_map()
+
+        idx, epoch = self._id_to_index[key]
+        if idx >= self._id_to_index_valid_upto:
+            log_start = epoch - self._id_to_index_epoch + len(self._id_to_index_log)
+            for position, shift in self._id_to_index_log[max(log_start, 0) :]:
+                if idx >= position:
+                    idx += shift
+        return idx
+
+    def _set_index_of_id(self, key: str, index: int):
+        if index == len(self._pb_body) - 1 == self._id_to_index_valid_upto:
+            self._id_to_index_valid_upto += 1
+        self._id_to_index[key] = (index, self._id_to_index_epoch)
+
+    def _pop_ids(self, indices: Iterable[int]):
+        for i in indices:
+            doc_id = self._pb_body[i].id
+            self._id_to_index.pop(doc_id, None)
+            if self._tag_index is not None:
+                self._tag_index.remove(doc_id)
+
+    def build_tag_index(self, *tags: str) -> None:
+        """Build a secondary index over the values of `tags`, used by :meth:`find`, :meth:`split` and :meth:`query`.
+
+        The index is built once and then maintained on every append, insert, set and delete. Calling this
+        again rebuilds the index from scratch, e.g. after the tags of the Documents were modified in place.
+
+        :param tags: the names of the tags to index, dunder keys like ``meta__color`` are supported
+        """
+        self._tag_index = TagIndex(tags)
+        self._tag_index.extend(self._pb_body)
 
-        self._id_to_index = {
-            d.id: i for i, d in enumerate(self._pb_body)
-        }  # type: Dict[str, int]
+    def drop_tag_index(self) -> None:
+        """Drop the secondary index built by :meth:`build_tag_index`"""
+        self._tag_index = None
 
     def insert(self, index: int, doc: 'Document') -> None:
         """
@@ -227,26 +424,52 @@ class DocumentArray(
         :param index: Position of the insertion.
         :param doc: The doc needs to be inserted.
         """
+        size = len(self._pb_body)
+        index = min(max(size + index, 0) if index < 0 else index, size)
+        materialize_frames(doc.proto)
         self._pb_body.insert(index, doc.proto)
-        self._id_to_index[doc.id] = index
+        if index < size:
+            self._log_id_to_index_shift(index, 1)
+        self._set_index_of_id(doc.id, index)
+        if self._tag_index is not None:
+            self._tag_index.add(doc)
 
     def __setitem__(self, key, value: 'Document'):
         if isinstance(key, int):
+            self._pop_ids((key,))
             self[key].CopyFrom(value)
-            self._id_to_index[value.id] = key
+            self._set_index_of_id(value.id, key % len(self._pb_body))
         elif isinstance(key, str):
-            self[self._id_to_index[key]].CopyFrom(value)
+            idx = self._get_index_by_id(key)
+            # the new Document may have another id, so the old one is dropped from the index
+            self._pop_ids((idx,))
+            self[idx].CopyFrom(value)
+            self._set_index_of_id(value.id, idx)
         else:
             raise IndexError(f'do not support this index {key}')
+        if self._tag_index is not None:
+            self._tag_index.add(value)
 
     def __delitem__(self, index: Union[int, str, slice]):
         if isinstance(index, int):
+            self._pop_ids((index,))
             del self._pb_body[index]
+            if index < 0:
+                index += len(self._pb_body) + 1
+            self._log_id_to_index_shift(index, -1)
         elif isinstance(index, str):
-            del self[self._id_to_index[index]]
-            self._id_to_index.pop(index)
+            del self[self._get_index_by_id(index)]
         elif isinstance(index, slice):
-            del self._pb_body[index]
+            indices = range(*index.indices(len(self._pb_body)))
+            if indices:
+                self._pop_ids(indices)
+                del self._pb_body[index]
+                first, last = sorted((indices[0], indices[-1]))
+                self._id_to_index_valid_upto = min(self._id_to_index_valid_upto, first)
+                if abs(indices.step) == 1:
+                    self._log_id_to_index_shift(last + 1, -len(indices))
+                else:
+                    self._compact_id_to_index_map()
         else:
             raise IndexError(
                 f'do not support this index type {typename(index)}: {index}'
@@ -266,13 +489,17 @@ class DocumentArray(
             yield Document(d)
 
     def __contains__(self, item: str):
-        return item in self._id_to_index
+        try:
+            self._get_index_by_id(item)
+            return True
+        except KeyError:
+            return False
 
     def __getitem__(self, item: Union[int, str, slice]):
         if isinstance(item, int):
             return Document(self._pb_body[item])
         elif isinstance(item, str):
-            return self[self._id_to_index[item]]
+            return self[self._get_index_by_id(item)]
         elif isinstance(item, slice):
             return DocumentArray(self._pb_body[item])
         else:
@@ -297,8 +524,11 @@ class DocumentArray(
 
         :param doc: The doc needs to be appended.
         """
-        self._id_to_index[doc.id] = len(self._pb_body)
+        materialize_frames(doc.proto)
         self._pb_body.append(doc.proto)
+        self._set_index_of_id(doc.id, len(self._pb_body) - 1)
+        if self._tag_index is not None:
+            self._tag_index.add(doc)
 
     def extend(self, iterable: Iterable['Document']) -> None:
         """
@@ -315,7 +545,9 @@ class DocumentArray(
     def clear(self):
         """Clear the data of :class:`DocumentArray`"""
         del self._pb_body[:]
-        self._id_to_index.clear()
+        self._update_id_to_index_map()
+        if self._tag_index is not None:
+            self._tag_index.clear()
 
     def reverse(self):
         """In-place reverse the sequence."""
@@ -507,6 +739,69 @@ class DocumentArray(
     def _flatten(sequence):
         return DocumentArray(list(itertools.chain.from_iterable(sequence)))
 
+    @staticmethod
+    def _traverse_protos(body: Sequence['jina_pb2.DocumentProto'], path: str):
+        if path:
+            loc = path[0]
+            if loc == 'r':
+                yield from DocumentArray._traverse_protos(body, path[1:])
+            elif loc == 'm':
+                for d in body:
+                    yield from DocumentArray._traverse_protos(d.matches, path[1:])
+            elif loc == 'c':
+                for d in body:
+                    yield from DocumentArray._traverse_protos(d.chunks, path[1:])
+            else:
+                raise ValueError(
+                    f'`path`:{loc} is invalid, must be one of `c`, `r`, `m`'
+                )
+        else:
+            yield body
+
+    def traverse_flat_per_path(
+        self, traversal_paths: Iterable[str]
+    ) -> Iterable['DocumentArray']:
+        """
+        Returns a flattened :class:``DocumentArray`` per path in :param:``traversal_paths``
+        with all Documents, that are reached by the path.
+
+        The returned :class:``DocumentArray`` is a view on the nested Documents, it does not copy them.
+
+        :param traversal_paths: a list of string that represents the traversal path
+        :yield: :class:``DocumentArray`` containing the document of all leaves per path.
+        """
+        _check_traversal_path_type(traversal_paths)
+
+        for p in traversal_paths:
+            yield DocumentArray(
+                FlattenedContainer(self._traverse_protos(self._pb_body, p))
+            )
+
+    def traverse_flat(self, traversal_paths: Iterable[str]) -> 'DocumentArray':
+        """
+        Returns a single flattened :class:``DocumentArray`` with all Documents, that are reached
+        via the :param:``traversal_paths``.
+
+        The returned :class:``DocumentArray`` is a view on the nested Documents, it does not copy them.
+
+        .. warning::
+            When defining the :param:``traversal_paths`` with multiple paths, the returned
+            :class:``Documents`` are determined at once and not on the fly. This is a different
+            behavior then in :method:``traverse`` and :method:``traverse_flattened_per_path``!
+
+        :param traversal_paths: a list of string that represents the traversal path
+        :return: a single :class:``DocumentArray`` containing the document of all leaves when applying the traversal_paths.
+        """
+        _check_traversal_path_type(traversal_paths)
+
+        return DocumentArray(
+            FlattenedContainer(
+                c
+                for p in traversal_paths
+                for c in self._traverse_protos(self._pb_body, p)
+            )
+        )
+
     # Properties for fast access of commonly used attributes
     @property
     def embeddings(self) -> np.ndarray:
@@ -520,12 +815,7 @@ class DocumentArray(
 
         :return: embeddings stacked per row as `np.ndarray`.
         """
-        x_mat = b''.join(d.embedding.dense.buffer for d in self._pb_body)
-        proto = self[0].proto.embedding.dense
-
-        return np.frombuffer(x_mat, dtype=proto.dtype).reshape(
-            (len(self), proto.shape[0])
-        )
+        return stack_dense_protos([d.embedding.dense for d in self._pb_body])
 
     @embeddings.setter
     def embeddings(self, emb: np.ndarray):
@@ -3,7 +3,7 @@ import mmap
 import os
 import shutil
 import tempfile
-from collections import OrderedDict
+from collections import OrderedDict, defaultdict
 from collections.abc import Iterable as Itr
 from pathlib import Path
 from typing import (
@@ -13,6 +13,7 @@ from typing import (
     List,
     Tuple,
     Optional,
+    Sequence,
 )
 
 import numpy as np
@@ -21,10 +22,13 @@ from .abstract import AbstractDocumentArray
 from .bpm import BufferPoolManager
 from .document import DocumentArray, DocumentArrayGetAttrMixin
 from .neural_ops import DocumentArrayNeuralOpsMixin
+from .parallel_ops import DocumentArrayParallelOpsMixin
 from .search_ops import DocumentArraySearchOpsMixin
 from .traversable import TraversableSequence
-from ..document import Document
+from ..document import Document, get_content_hash, DIGEST_SIZE
+from ..ndarray.dense.numpy import stack_dense_protos
 from ...logging.predefined import default_logger
+from ...proto import jina_pb2
 
 
 HEADER_NONE_ENTRY = (-1, -1, -1)
@@ -36,6 +40,7 @@ class DocumentArrayMemmap(
     DocumentArrayGetAttrMixin,
     DocumentArrayNeuralOpsMixin,
     DocumentArraySearchOpsMixin,
+    DocumentArrayParallelOpsMixin,
     Itr,
     AbstractDocumentArray,
 ):
@@ -49,6 +54,9 @@ class DocumentArrayMemmap(
         - `header.bin`: stores id, offset, length and boundary info of each Document in `body.bin`;
         - `body.bin`: stores Documents continuously
 
+    If a content hash index is built via :meth:`build_content_hash_index`, a third file `content_hash.bin` stores the
+    content hash of every Document version written to `body.bin`.
+
     When loading :class:`DocumentArrayMemmap`, it loads the content of `header.bin` into memory, while storing
     all `body.bin` data on disk. As `header.bin` is often much smaller than `body.bin`, memory is saved.
 
@@ -89,6 +97,7 @@ class DocumentArrayMemmap(
         self._header_path = os.path.join(path, 'header.bin')
         self._body_path = os.path.join(path, 'body.bin')
         self._embeddings_path = os.path.join(path, 'embeddings.bin')
+        self._content_hash_path = os.path.join(path, 'content_hash.bin')
         self._key_length = key_length
         self._last_mmap = None
         self._load_header_body()
@@ -136,24 +145,114 @@ class DocumentArrayMemmap(
                 self._header_map[r[0]] = (idx, r[1], r[2], r[3])
 
         self._body_fileno = self._body.fileno()
-        self._start = 0
-        if self._header_map:
-            self._start = tmp[-1][1] + tmp[-1][3]
-            self._body.seek(self._start)
+        # the body is append-only, the last entry of the header may be deleted or updated
+        self._start = self._body.seek(0, 2)
         self._last_mmap = None
+        self._load_content_hash_index(mode)
+
+    @property
+    def _content_hash_dtype(self):
+        return [
+            ('', (np.str_, self._key_length)),
+            ('', (np.str_, 2 * DIGEST_SIZE)),
+        ]
+
+    def _load_content_hash_index(self, mode: str = 'a'):
+        if getattr(self, '_content_hash_file', None) is not None:
+            self._content_hash_file.close()
+        self._content_hash_file = None
+        self._content_hashes = {}
+        self._content_hash_ids = defaultdict(set)
+        if not os.path.exists(self._content_hash_path):
+            return
+
+        open(self._content_hash_path, mode).close()
+        self._content_hash_file = open(self._content_hash_path, 'r+b')
+        tmp = np.frombuffer(
+            self._content_hash_file.read(), dtype=self._content_hash_dtype
+        )
+        # the file is a log of all written versions, the last entry of an id is the current one
+        for doc_id, content_hash in tmp:
+            if doc_id in self._header_map:
+                self._content_hashes[doc_id] = content_hash
+        for doc_id, content_hash in self._content_hashes.items():
+            self._content_hash_ids[content_hash].add(doc_id)
+
+    def _set_content_hash(self, doc_id: str, content_hash: str):
+        self._discard_content_hash(doc_id)
+        self._content_hashes[doc_id] = content_hash
+        self._content_hash_ids[content_hash].add(doc_id)
+        self._content_hash_file.write(
+            np.array((doc_id, content_hash), dtype=self._content_hash_dtype).tobytes()
+        )
+
+    def _discard_content_hash(self, doc_id: str):
+        content_hash = self._content_hashes.pop(doc_id, None)
+        if content_hash is not None:
+            ids = self._content_hash_ids[content_hash]
+            ids.discard(doc_id)
+            if not ids:
+                del self._content_hash_ids[content_hash]
+
+    def build_content_hash_index(self) -> None:
+        """Build a persistent index of the content hash of every Document.
+
+        Once built, the index is kept up to date on every write and is loaded together with the header, so
+        :meth:`dedup` and ``extend(..., skip_duplicates=True)`` do not need to read and hash the stored Documents.
+        """
+        self.save()
+        open(self._content_hash_path, 'wb').close()
+        self._load_content_hash_index()
+        for doc_id, (_, p, r, r_plus_l) in self._header_map.items():
+            pb = jina_pb2.DocumentProto()
+            pb.ParseFromString(self._mmap[p + r : p + r_plus_l])
+            self._set_content_hash(doc_id, get_content_hash(pb))
+        self._content_hash_file.flush()
+
+    def drop_content_hash_index(self) -> None:
+        """Remove the content hash index from the disk."""
+        if self._content_hash_file is not None:
+            self._content_hash_file.close()
+            os.remove(self._content_hash_path)
+        self._load_content_hash_index()
+
+    @property
+    def has_content_hash_index(self) -> bool:
+        """Check if the content hash index is built.
+
+        :return: True if a content hash index is kept for this :class:`DocumentArrayMemmap`
+        """
+        return self._content_hash_file is not None
 
     def __len__(self):
         return len(self._header_map)
 
-    def extend(self, values: Iterable['Document']) -> None:
+    def extend(
+        self, values: Iterable['Document'], skip_duplicates: bool = False
+    ) -> None:
         """Extend the :class:`DocumentArrayMemmap` by appending all the items from the iterable.
 
         :param values: the iterable of Documents to extend this array with
+        :param skip_duplicates: if set, Documents whose content hash is already stored are not appended. This
+            builds the content hash index via :meth:`build_content_hash_index` if it does not exist yet.
         """
+        if skip_duplicates and not self.has_content_hash_index:
+            self.build_content_hash_index()
         for d in values:
-            self.append(d, flush=False)
+            if skip_duplicates:
+                content_hash = get_content_hash(d)
+                if content_hash in self._content_hash_ids:
+                    continue
+                self._update_or_append(d, flush=False, content_hash=content_hash)
+            else:
+                self.append(d, flush=False)
+        self._flush()
+
+    def _flush(self):
         self._header.flush()
         self._body.flush()
+        if self._content_hash_file is not None:
+            self._content_hash_file.flush()
         self._last_mmap = None
 
     def clear(self) -> None:
@@ -167,6 +266,7 @@ class DocumentArrayMemmap(
         idx: Optional[int] = None,
         flush: bool = True,
         update_buffer: bool = True,
+        content_hash: Optional[str] = None,
     ) -> None:
         value = doc.binary_str()
         l = len(value)  #: the length
@@ -202,11 +302,11 @@ class DocumentArrayMemmap(
             self._header.seek(0, 2)
         self._start = p + r + l
         self._body.write(value)
+        if self._content_hash_file is not None:
+            self._set_content_hash(doc.id, content_hash or get_content_hash(doc))
         self._invalidate_embeddings_memmap()
         if flush:
-            self._header.flush()
-            self._body.flush()
-            self._last_mmap = None
+            self._flush()
         if update_buffer:
             result = self.buffer_pool.add_or_update(doc.id, doc)
             if result:
@@ -330,6 +430,7 @@ class DocumentArrayMemmap(
         self._header.flush()
         self._last_mmap = None
         self._header_map.pop(str_key)
+        self._discard_content_hash(str_key)
         self.buffer_pool.delete_if_exists(str_key)
         self._invalidate_embeddings_memmap()
 
@@ -383,6 +484,7 @@ class DocumentArrayMemmap(
                     )
                     if str_key in self.buffer_pool.doc_map:
                         self.buffer_pool.doc_map.pop(str_key)
+                    self._discard_content_hash(str_key)
             else:
                 raise IndexError(f'`key`={key} is out of range')
         elif isinstance(key, str):
@@ -396,6 +498,17 @@ class DocumentArrayMemmap(
     def _flatten(sequence):
         return itertools.chain.from_iterable(sequence)
 
+    def _iter_content_hashes(self, fields: Optional[Sequence[str]]) -> Iterable[str]:
+        if fields is not None or not self.has_content_hash_index:
+            yield from super()._iter_content_hashes(fields)
+            return
+        for doc_id in self._header_map:
+            if doc_id in self.buffer_pool:
+                # the Document may be modified in memory after it was written
+                yield get_content_hash(self.buffer_pool[doc_id])
+            else:
+                yield self._content_hashes[doc_id]
+
     def __bool__(self):
         """To simulate ```l = []; if l: ...```
 
@@ -418,9 +531,7 @@ class DocumentArrayMemmap(
         docs_to_flush = self.buffer_pool.docs_to_flush()
         for key, doc in docs_to_flush:
             self._update(doc, self._str2int_id(key), flush=False)
-        self._header.flush()
-        self._body.flush()
-        self._last_mmap = None
+        self._flush()
 
     def __del__(self):
         self.save()
@@ -429,12 +540,16 @@ class DocumentArrayMemmap(
         """Prune deleted Documents from this object, this yields a smaller on-disk storage. """
         tdir = tempfile.mkdtemp()
         dam = DocumentArrayMemmap(tdir, key_length=self._key_length)
+        if self.has_content_hash_index:
+            dam.build_content_hash_index()
         dam.extend(self)
         dam.reload()
         os.remove(self._body_path)
         os.remove(self._header_path)
         shutil.copy(os.path.join(tdir, 'header.bin'), self._header_path)
         shutil.copy(os.path.join(tdir, 'body.bin'), self._body_path)
+        if self.has_content_hash_index:
+            shutil.copy(os.path.join(tdir, 'content_hash.bin'), self._content_hash_path)
         self.reload()
 
     @property
@@ -542,10 +657,7 @@ class DocumentArrayMemmap(
         if self._embeddings_memmap is not None:
             return self._embeddings_memmap
 
-        x_mat = b''.join(d.proto.embedding.dense.buffer for d in self)
-        embeds = np.frombuffer(
-            x_mat, dtype=self[0].proto.embedding.dense.dtype
-        ).reshape((len(self), self[0].proto.embedding.dense.shape[0]))
+        embeds = stack_dense_protos([d.proto.embedding.dense for d in self])
 
         self._embeddings_memmap = embeds
 
@@ -1,9 +1,10 @@
-from typing import Optional, Union, Callable, Tuple
+from typing import Optional, Union, Callable, Tuple, Sequence
 
 import numpy as np
 
 from ... import Document
 from ...importer import ImportExtensions
+from ..ndarray.dense.numpy import stack_dense_protos
 from ...math.helper import top_k, minmax_normalize, update_rows_x_mat_best
 
 if False:
@@ -187,6 +188,65 @@ class DocumentArrayNeuralOpsMixin:
 
         return dist, idx
 
+    def merge_matches(
+        self,
+        others: Sequence['DocumentArray'],
+        metric_name: str,
+        limit: Optional[int] = None,
+        descending: bool = False,
+    ) -> None:
+        """Merge the matches of the Documents at the same positions in `others` into `self`, keeping the top `limit`.
+
+        This is the typical reduce step after querying multiple shards, e.g. in an Executor
+        receiving ``docs_matrix``:
+
+        .. highlight:: python
+        .. code-block:: python
+
+            @requests(on='/search')
+            def merge(self, docs_matrix, **kwargs):
+                docs_matrix[0].merge_matches(docs_matrix[1:], metric_name='cosine', limit=10)
+                return docs_matrix[0]
+
+        The scores of all candidate matches are ranked in one vectorized step, and only the selected matches are
+        copied into the result.
+
+        :param others: the DocumentArrays with the same number of Documents as `self`, e.g. the results of the other shards
+        :param metric_name: the name of the score the matches are ranked by
+        :param limit: the maximum number of matches of each Document, by default all matches are kept
+        :param descending: if set, higher scores rank first, otherwise lower scores (i.e. distances) rank first
+        """
+        for da in others:
+            if len(da) != len(self):
+                raise ValueError(
+                    f'can not merge matches of {len(da)} Documents into {len(self)} Documents'
+                )
+        if not len(self):
+            return
+
+        candidates = [
+            [m for da in (self, *others) for m in da._pb_body[j].matches]
+            for j in range(len(self))
+        ]
+        width = max(len(c) for c in candidates)
+        if not width:
+            return
+
+        missing = -np.inf if descending else np.inf
+        scores = np.full((len(candidates), width), missing)
+        for j, c in enumerate(candidates):
+            scores[j, : len(c)] = [
+                m.scores[metric_name].value if metric_name in m.scores else missing
+                for m in c
+            ]
+        limit = width if limit is None else min(limit, width)
+        _, idx = top_k(scores, limit, descending=descending)
+
+        for d, c, row in zip(self._pb_body, candidates, idx.tolist()):
+            selected = [c[i] for i in row if i < len(c)]
+            del d.matches[:]
+            d.matches.extend(selected)
+
     def visualize(
         self,
         output: Optional[str] = None,
@@ -278,12 +338,4 @@ class DocumentArrayNeuralOpsMixin:
         if indices is None:
             indices = slice(0, len(self))
 
-        x_mat = bytearray()
-        len_slice = 0
-        for d in self[indices]:
-            x_mat += d.proto.embedding.dense.buffer
-            len_slice += 1
-
-        return np.frombuffer(x_mat, dtype=self[0].proto.embedding.dense.dtype).reshape(
-            (len_slice, self[0].proto.embedding.dense.shape[0])
-        )
+        return stack_dense_protos([d.proto.embedding.dense for d in self[indices]])
@@ -0,0 +1,226 @@
+import atexit
+import os
+from collections import deque
+from functools import partial
+from typing import Callable, Any, Optional, Generator, Iterable, List, Tuple, Dict
+
+from ...helper import batch_iterator
+
+if False:
+    from multiprocessing.pool import Pool
+    from .document import DocumentArray
+    from ..document import Document
+
+__all__ = ['DocumentArrayParallelOpsMixin', 'get_pool']
+
+_RAW, _SELF, _DOCUMENT, _DOCUMENT_ARRAY = range(4)
+
+_pools = {}  # type: Dict[Tuple[str, Optional[int], int], 'Pool']
+
+
+def get_pool(backend: str = 'process', num_worker: Optional[int] = None) -> 'Pool':
+    """Get a persistent worker pool, it is created on the first call and reused by all later calls in this process.
+
+    :param backend: `thread` for a pool of threads, `process` for a pool of processes
+    :param num_worker: the number of workers in the pool, by default the number of CPUs
+    :return: the worker pool
+    """
+    key = (backend, num_worker, os.getpid())
+    if key not in _pools:
+        if backend == 'thread':
+            from multiprocessing.pool import ThreadPool as Pool
+        elif backend == 'process':
+            from multiprocessing import Pool
+        else:
+            raise ValueError(
+                f'backend={backend} is not supported, must be one of `thread`, `process`'
+            )
+        _pools[key] = Pool(processes=num_worker)
+    return _pools[key]
+
+
+@atexit.register
+def _close_pools():
+    for (_, _, pid), pool in list(_pools.items()):
+        if pid == os.getpid():
+            pool.terminate()
+    _pools.clear()
+
+
+def _dump_result(result: Any, target: Any) -> Tuple[int, Any]:
+    from ..document import Document
+    from .document import DocumentArray
+    from ...proto import jina_pb2
+
+    if result is target:
+        return _SELF, None
+    elif isinstance(result, Document):
+        return _DOCUMENT, result.binary_str()
+    elif isinstance(result, DocumentArray):
+        dap = jina_pb2.DocumentArrayProto()
+        dap.docs.extend(result._pb_body)
+        return _DOCUMENT_ARRAY, dap.SerializePartialToString()
+    return _RAW, result
+
+
+def _load_result(kind: int, payload: Any, target: Any) -> Any:
+    from ..document import Document
+    from .document import DocumentArray
+    from ...proto import jina_pb2
+
+    if kind == _SELF:
+        return target
+    elif kind == _DOCUMENT:
+        return Document(payload)
+    elif kind == _DOCUMENT_ARRAY:
+        dap = jina_pb2.DocumentArrayProto()
+        dap.ParseFromString(payload)
+        return DocumentArray(dap.docs)
+    return payload
+
+
+def _run_on_serialized(
+    func: Callable, batched: bool, payloads: List[bytes]
+) -> Tuple[List[Optional[bytes]], List[Tuple[int, Any]]]:
+    """Run `func` in a worker process on Documents given as serialized protos.
+
+    :param func: the function to run
+    :param batched: if set, `func` is called once on all Documents as a :class:`DocumentArray`
+    :param payloads: the serialized Documents
+    :return: the serialized Documents that `func` modified (None if unmodified) and the dumped results
+    """
+    from ..document import Document
+    from .document import DocumentArray
+
+    docs = [Document(p) for p in payloads]
+    if batched:
+        da = DocumentArray(docs)
+        results = [_dump_result(func(da), da)]
+    else:
+        results = [_dump_result(func(d), d) for d in docs]
+
+    updated = []
+    for d, p in zip(docs, payloads):
+        b = d.binary_str()
+        updated.append(b if b != p else None)
+    return updated, results
+
+
+def _run_in_thread(func: Callable, batched: bool, items: List[Any]) -> List[Any]:
+    if batched:
+        return [func(items[0])]
+    return [func(d) for d in items]
+
+
+class DocumentArrayParallelOpsMixin:
+    """ A mixin that provides parallel map functionality to DocumentArrays"""
+
+    def map(
+        self,
+        func: Callable[['Document'], Any],
+        backend: str = 'process',
+        num_worker: Optional[int] = None,
+        batch_size: int = 16,
+        pool: Optional['Pool'] = None,
+    ) -> Generator[Any, None, None]:
+        """Apply `func` to every Document in parallel and yield the results in order.
+
+        Modifications `func` makes to a Document in place are reflected on the Document of a
+        :class:`DocumentArray`, also when using the `process` backend. This makes it a drop-in replacement for a loop like
+        ``for d in docs: d.convert_image_uri_to_blob()``, e.g.
+
+        .. highlight:: python
+        .. code-block:: python
+
+            for _ in docs.map(Document.convert_image_uri_to_blob):
+                pass
+
+        .. note::
+            With the `process` backend, Documents are sent to the workers as serialized protos and
+            `func` must be picklable, i.e. a module-level function rather than a lambda or closure.
+
+        .. note::
+            Only a bounded number of Documents is in flight at any time, so mapping over a
+            :class:`DocumentArrayMemmap` does not load it into memory at once.
+
+        :param func: the function to apply, it takes a :class:`Document` as input
+        :param backend: `thread` for I/O-bound or GIL-releasing functions, `process` for CPU-bound Python functions
+        :param num_worker: the number of workers, by default the number of CPUs
+        :param batch_size: the number of Documents sent to a worker per task
+        :param pool: a pool to run on, by default a persistent pool from :func:`get_pool` is used
+        :yield: the results of `func` in the order of the Documents
+        """
+        yield from self._map(
+            func, batch_iterator(self, batch_size), False, backend, num_worker, pool
+        )
+
+    def map_batch(
+        self,
+        func: Callable[['DocumentArray'], Any],
+        batch_size: int,
+        backend: str = 'process',
+        num_worker: Optional[int] = None,
+        pool: Optional['Pool'] = None,
+    ) -> Generator[Any, None, None]:
+        """Apply `func` to every batch of `batch_size` Documents in parallel and yield the results in order.
+
+        Same as :meth:`map`, but `func` takes a :class:`DocumentArray` of a batch of Documents as input.
+
+        :param func: the function to apply, it takes a :class:`DocumentArray` as input
+        :param batch_size: the number of Documents in each batch
+        :param backend: `thread` for I/O-bound or GIL-releasing functions, `process` for CPU-bound Python functions
+        :param num_worker: the number of workers, by default the number of CPUs
+        :param pool: a pool to run on, by default a persistent pool from :func:`get_pool` is used
+        :yield: the results of `func` in the order of the batches
+        """
+        from .document import DocumentArray
+
+        batches = (
+            b if isinstance(b, DocumentArray) else DocumentArray(list(b))
+            for b in batch_iterator(self, batch_size)
+        )
+        yield from self._map(
+            func, ((b,) for b in batches), True, backend, num_worker, pool
+        )
+
+    @staticmethod
+    def _map(
+        func: Callable,
+        tasks: Iterable,
+        batched: bool,
+        backend: str,
+        num_worker: Optional[int],
+        pool: Optional['Pool'],
+    ) -> Generator[Any, None, None]:
+        pool = pool or get_pool(backend, num_worker)
+        max_pending = 2 * (num_worker or os.cpu_count() or 1)
+        in_thread = backend == 'thread'
+        worker = partial(
+            _run_in_thread if in_thread else _run_on_serialized, func, batched
+        )
+
+        pending = deque()
+
+        def _collect():
+            items, async_result = pending.popleft()
+            if in_thread:
+                return async_result.get()
+
+            updated, dumped = async_result.get()
+            for d, b in zip(items[0] if batched else items, updated):
+                if b is not None:
+                    d.proto.ParseFromString(b)
+            return [_load_result(k, p, t) for (k, p), t in zip(dumped, items)]
+
+        for items in tasks:
+            items = list(items)
+            if in_thread:
+                payload = items
+            else:
+                payload = [d.binary_str() for d in (items[0] if batched else items)]
+            pending.append((items, pool.apply_async(worker, (payload,))))
+            if len(pending) >= max_pending:
+                yield from _collect()
+
+        while pending:
+            yield from _collect()
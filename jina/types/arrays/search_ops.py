@@ -1,12 +1,33 @@
 import re
 import random
 import operator
-from collections import defaultdict
-from typing import Dict, Optional, Union, Tuple, Any
+from collections import defaultdict, Counter
+from numbers import Number
+from typing import Dict, Optional, Union, Tuple, Any, Iterable, Set, Sequence
 
+from .tag_index import get_tag_value
+from ..document import get_content_hash
 
 if False:
     from .document import DocumentArray
+    from .tag_index import TagIndex
+
+
+def _in(value, candidates):
+    try:
+        return value in candidates
+    except TypeError:
+        return False
+
+
+def _compare(op):
+    def _func(value, other):
+        try:
+            return value is not None and op(value, other)
+        except TypeError:
+            return False
+
+    return _func
 
 
 class DocumentArraySearchOpsMixin:
@@ -21,6 +42,38 @@ class DocumentArraySearchOpsMixin:
         '>=': operator.ge,
     }
 
+    _predicates = {
+        '$eq': operator.eq,
+        '$neq': operator.ne,
+        '$gt': _compare(operator.gt),
+        '$gte': _compare(operator.ge),
+        '$lt': _compare(operator.lt),
+        '$lte': _compare(operator.le),
+        '$in': _in,
+        '$nin': lambda value, candidates: not _in(value, candidates),
+        '$regex': lambda value, pattern: isinstance(value, str)
+        and re.search(pattern, value) is not None,
+        '$contains': lambda value, substring: isinstance(value, str)
+        and substring in value,
+    }
+
+    def _get_tag_index(
+        self, tags: Iterable[str], traversal_paths: Sequence[str] = ('r',)
+    ) -> Optional['TagIndex']:
+        index = getattr(self, '_tag_index', None)
+        if (
+            index is not None
+            and list(traversal_paths) == ['r']
+            and all(tag in index for tag in tags)
+        ):
+            return index
+
+    def _get_docs_by_ids(self, ids: Iterable[str]) -> 'DocumentArray':
+        from .document import DocumentArray
+
+        positions = sorted(self._get_index_by_id(doc_id) for doc_id in ids)
+        return DocumentArray([self._pb_body[pos] for pos in positions])
+
     def find(
         self,
         regexes: Dict[str, Union[str, re.Pattern]],
@@ -41,6 +94,9 @@ class DocumentArraySearchOpsMixin:
         Example: If `len(regexes)=3`,  `value=2` and `operator='>='` then the documents
                  from the DocumentArray will be accepted if they match at least 2 regular expressions.
 
+        If all tags in `regexes` are indexed via :meth:`DocumentArray.build_tag_index`, the root Documents
+        are found via the trigram index instead of scanning every Document.
+
         :param regexes: Dictionary of the form {tag: Optional[str, regex]}
         :param traversal_paths: List specifying traversal paths
         :param operator: Operator used to accept/reject a document
@@ -55,19 +111,29 @@ class DocumentArraySearchOpsMixin:
         ), f'operator={operator} is not a valid operator from {self._operators.keys()}'
 
         operator_func = self._operators[operator]
-        iterdocs = self.traverse_flat(traversal_paths)
-        filtered = DocumentArray()
-
         threshold = threshold or len(regexes)
 
         for tag_name, regex in regexes.items():
             if isinstance(regex, str):
                 regexes[tag_name] = re.compile(regex)
 
+        index = self._get_tag_index(regexes.keys(), traversal_paths)
+        if index is not None and not operator_func(0, threshold):
+            counter = Counter()
+            for tag_name, pattern in regexes.items():
+                counter.update(index.regex(tag_name, pattern))
+            return self._get_docs_by_ids(
+                doc_id
+                for doc_id, count in counter.items()
+                if operator_func(count, threshold)
+            )
+
+        iterdocs = self.traverse_flat(traversal_paths)
+        filtered = DocumentArray()
         for pos, doc in enumerate(iterdocs):
             counter = 0
             for tag_name, pattern in regexes.items():
-                tag_value = doc.tags.get(tag_name, None)
+                tag_value = get_tag_value(doc, tag_name)
                 if tag_value:
                     if pattern.match(tag_value):
                         counter += 1
@@ -118,10 +184,24 @@ class DocumentArraySearchOpsMixin:
         .. note::
             If the :attr:`tags` of :class:`Document` do not contains the specified :attr:`tag`,
             return an empty dict.
+
+        .. note::
+            If `tag` is indexed via :meth:`DocumentArray.build_tag_index`, the groups are read from the index.
         """
         from .document import DocumentArray
         from ...helper import dunder_get
 
+        index = self._get_tag_index((tag,))
+        if index is not None:
+            groups = [
+                (sorted(self._get_index_by_id(doc_id) for doc_id in ids), value)
+                for value, ids in index.groups(tag).items()
+            ]
+            return {
+                value: DocumentArray([self._pb_body[pos] for pos in positions])
+                for positions, value in sorted(groups, key=lambda g: g[0][0])
+            }
+
         rv = defaultdict(DocumentArray)
         for doc in self:
             if '__' in tag:
@@ -133,3 +213,136 @@ class DocumentArraySearchOpsMixin:
                 continue
             rv[value].append(doc)
         return dict(rv)
+
+    def _iter_content_hashes(self, fields: Optional[Sequence[str]]) -> Iterable[str]:
+        for doc in getattr(self, '_pb_body', self):
+            yield get_content_hash(doc, fields)
+
+    def dedup(
+        self, fields: Optional[Sequence[str]] = None, keep: str = 'first'
+    ) -> 'DocumentArray':
+        """Remove Documents with duplicate content, the order of the kept Documents is preserved.
+
+        Two Documents are duplicates when they have the same hash over `fields`. The hashes are
+        computed on the protos directly, on a :class:`DocumentArrayMemmap` with a content hash index
+        the stored hashes are used.
+
+        :param fields: the names of the fields that define the content, by default the fields used by
+            :attr:`Document.content_hash`
+        :param keep: `first` to keep the first Document of each group of duplicates, `last` to keep the last one
+        :return: a :class:`DocumentArray` without duplicates
+        """
+        from .document import DocumentArray
+        from ...proto import jina_pb2
+
+        if keep not in ('first', 'last'):
+            raise ValueError(f'keep={keep} is not supported, must be `first` or `last`')
+        if fields is not None:
+            fields = tuple(fields)
+            unknown = set(fields).difference(
+                jina_pb2.DocumentProto.DESCRIPTOR.fields_by_name
+            )
+            if unknown:
+                raise ValueError(f'{unknown} are not fields of Document')
+
+        positions = {}
+        for pos, h in enumerate(self._iter_content_hashes(fields)):
+            if keep == 'last' or h not in positions:
+                positions[h] = pos
+        kept = set(positions.values())
+
+        return DocumentArray(
+            [d for pos, d in enumerate(getattr(self, '_pb_body', self)) if pos in kept]
+        )
+
+    def query(
+        self,
+        predicates: Dict[str, Any],
+        traversal_paths: Sequence[str] = ('r',),
+    ) -> 'DocumentArray':
+        """Find Documents whose tags satisfy all `predicates`.
+
+        Each predicate maps a tag name to either a value, which is matched by equality, or to a dict of
+        operators and operands, e.g.
+
+        .. highlight:: python
+        .. code-block:: python
+
+            da.query({'color': 'red', 'price': {'$gte': 10, '$lt': 20}, 'title': {'$regex': 'jina'}})
+
+        The supported operators are: ['$eq', '$neq', '$gt', '$gte', '$lt', '$lte', '$in', '$nin', '$regex',
+        '$contains']. Tag names can be dunder keys like ``meta__color`` to refer to nested tags.
+
+        If a tag index is built via :meth:`DocumentArray.build_tag_index`, the predicates on indexed tags are
+        answered from the index and only the remaining predicates are checked Document by Document.
+
+        :param predicates: Dictionary of the form {tag: value} or {tag: {operator: operand}}
+        :param traversal_paths: List specifying traversal paths
+        :return: DocumentArray with Documents that satisfy all predicates
+        """
+        from .document import DocumentArray
+
+        conditions = []
+        for tag_name, predicate in predicates.items():
+            if not isinstance(predicate, dict):
+                predicate = {'$eq': predicate}
+            for op, operand in predicate.items():
+                assert (
+                    op in self._predicates
+                ), f'operator={op} is not a valid operator from {self._predicates.keys()}'
+                conditions.append((tag_name, op, operand))
+
+        candidates = None  # type: Optional[Set[str]]
+        unindexed = []
+        for tag_name, op, operand in conditions:
+            index = self._get_tag_index((tag_name,), traversal_paths)
+            ids = (
+                self._query_tag_index(index, tag_name, op, operand)
+                if index is not None
+                else None
+            )
+            if ids is None:
+                unindexed.append((tag_name, self._predicates[op], operand))
+            else:
+                candidates = ids if candidates is None else candidates & ids
+
+        docs = (
+            self.traverse_flat(traversal_paths)
+            if candidates is None
+            else self._get_docs_by_ids(candidates)
+        )
+        if not unindexed:
+            return DocumentArray(list(docs))
+
+        return DocumentArray(
+            [
+                doc
+                for doc in docs
+                if all(
+                    func(get_tag_value(doc, tag_name), operand)
+                    for tag_name, func, operand in unindexed
+                )
+            ]
+        )
+
+    @staticmethod
+    def _query_tag_index(
+        index: 'TagIndex', tag: str, op: str, operand: Any
+    ) -> Optional[Set[str]]:
+        if op == '$eq':
+            if operand is None:
+                # the index has no entries for the Documents without the tag, which match `None`
+                return
+            return index.equal(tag, operand)
+        elif op == '$in':
+            if any(v is None for v in operand):
+                return
+            return set().union(*(index.equal(tag, v) for v in operand))
+        elif op in ('$gt', '$gte', '$lt', '$lte') and isinstance(operand, Number):
+            if op.startswith('$gt'):
+                return index.range(tag, low=operand, include_low=op == '$gte')
+            return index.range(tag, high=operand, include_high=op == '$lte')
+        elif op == '$regex':
+            return index.regex(tag, operand, full_scan=True)
+        elif op == '$contains':
+            return index.contains(tag, operand)
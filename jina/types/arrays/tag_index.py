@@ -0,0 +1,296 @@
+import bisect
+import re
+import sre_constants
+import sre_parse
+from collections import defaultdict
+from numbers import Number
+from typing import Any, Dict, Iterable, List, Optional, Set, Union
+
+from ...helper import dunder_get
+from ...proto import jina_pb2
+
+if False:
+    from ..document import Document
+
+__all__ = ['TagIndex', 'get_tag_value']
+
+
+def get_tag_value(doc: Union['Document', 'jina_pb2.DocumentProto'], tag: str) -> Any:
+    """Get the value of a tag from a Document, `tag` can be a dunder key referring to a nested tag.
+
+    :param doc: the Document or the DocumentProto to read the tag from
+    :param tag: the tag name, e.g. ``color`` or ``meta__color``
+    :return: the value of the tag or None if the Document does not have it
+    """
+    tags = doc.tags
+    if '__' in tag:
+        try:
+            return dunder_get(tags, tag)
+        except (KeyError, IndexError, AttributeError, TypeError, ValueError):
+            return None
+    return tags[tag] if tag in tags else None
+
+
+def _is_scalar(value: Any) -> bool:
+    return isinstance(value, (str, Number))
+
+
+def _is_numeric(value: Any) -> bool:
+    return isinstance(value, Number) and not isinstance(value, bool)
+
+
+def _trigrams(value: str) -> Set[str]:
+    return {value[i : i + 3] for i in range(len(value) - 2)}
+
+
+def _required_literals(pattern: 're.Pattern') -> List[str]:
+    """Extract the literal substrings every string matching `pattern` must contain.
+
+    Only literal runs at the top level of the pattern are considered, which is enough to
+    narrow down candidates for typical tag regexes like ``r'Ber.*'`` or ``r'.*-2021-.*'``.
+
+    :param pattern: the compiled regular expression
+    :return: a list of literal strings
+    """
+    if pattern.flags & re.IGNORECASE or not isinstance(pattern.pattern, str):
+        return []
+    try:
+        parsed = sre_parse.parse(pattern.pattern, pattern.flags)
+    except (sre_constants.error, TypeError):
+        return []
+
+    literals, current = [], []
+    for op, arg in parsed:
+        if op is sre_constants.LITERAL:
+            current.append(chr(arg))
+            continue
+        if op is sre_constants.BRANCH:
+            # alternatives do not share a required literal that can be cheaply found
+            return []
+        if current:
+            literals.append(''.join(current))
+            current = []
+    if current:
+        literals.append(''.join(current))
+    return literals
+
+
+class TagIndex:
+    """A secondary index over the values of chosen tags of the Documents in a :class:`DocumentArray`.
+
+    Every tag value is kept in a hash index for equality and grouping. Numeric values are also kept
+    in a sorted array for range queries, string values are also kept in a trigram index for regex
+    and substring queries. The index refers to Documents by their ids, so it stays valid when the
+    array is reordered.
+
+    .. note::
+        The index reflects the tags of a Document at the time it is added to the array. If tags are
+        modified in place, rebuild the index via :meth:`DocumentArray.build_tag_index`.
+
+    :param tags: the names of the tags to index, dunder keys like ``meta__color`` are supported
+    """
+
+    def __init__(self, tags: Iterable[str]):
+        self.tags = tuple(tags)
+        self.clear()
+
+    def clear(self):
+        """Remove all Documents from the index"""
+        self._values = {tag: {} for tag in self.tags}  # type: Dict[str, Dict[str, Any]]
+        self._hash = {
+            tag: defaultdict(set) for tag in self.tags
+        }  # type: Dict[str, Dict[Union[str, Number], Set[str]]]
+        self._sorted_values = {tag: [] for tag in self.tags}  # type: Dict[str, List]
+        self._sorted_ids = {tag: [] for tag in self.tags}  # type: Dict[str, List[str]]
+        self._trigrams = {
+            tag: defaultdict(set) for tag in self.tags
+        }  # type: Dict[str, Dict[str, Set[str]]]
+
+    def __contains__(self, tag: str) -> bool:
+        return tag in self._values
+
+    def add(self, doc: Union['Document', 'jina_pb2.DocumentProto']):
+        """Add the tag values of a Document to the index.
+
+        :param doc: the Document or the DocumentProto to add
+        """
+        doc_id = doc.id
+        for tag in self.tags:
+            value = get_tag_value(doc, tag)
+            if value is None:
+                continue
+            if doc_id in self._values[tag]:
+                self._remove_value(tag, doc_id)
+            self._add_value(tag, doc_id, value)
+            if _is_numeric(value):
+                pos = bisect.bisect_right(self._sorted_values[tag], value)
+                self._sorted_values[tag].insert(pos, value)
+                self._sorted_ids[tag].insert(pos, doc_id)
+
+    def extend(self, docs: Iterable[Union['Document', 'jina_pb2.DocumentProto']]):
+        """Add the tag values of many Documents to the index, sorting the numeric values only once.
+
+        :param docs: the Documents or the DocumentProtos to add
+        """
+        for doc in docs:
+            doc_id = doc.id
+            for tag in self.tags:
+                value = get_tag_value(doc, tag)
+                if value is None:
+                    continue
+                if doc_id in self._values[tag]:
+                    self._remove_value(tag, doc_id)
+                self._add_value(tag, doc_id, value)
+                if _is_numeric(value):
+                    self._sorted_values[tag].append(value)
+                    self._sorted_ids[tag].append(doc_id)
+
+        for tag in self.tags:
+            if self._sorted_values[tag]:
+                pairs = sorted(
+                    zip(self._sorted_values[tag], self._sorted_ids[tag]),
+                    key=lambda p: p[0],
+                )
+                self._sorted_values[tag] = [v for v, _ in pairs]
+                self._sorted_ids[tag] = [k for _, k in pairs]
+
+    def _add_value(self, tag: str, doc_id: str, value: Any):
+        self._values[tag][doc_id] = value
+        if _is_scalar(value):
+            self._hash[tag][value].add(doc_id)
+        if isinstance(value, str):
+            for t in _trigrams(value):
+                self._trigrams[tag][t].add(doc_id)
+
+    def remove(self, doc_id: str):
+        """Remove a Document from the index.
+
+        :param doc_id: the id of the Document to remove
+        """
+        for tag in self.tags:
+            if doc_id in self._values[tag]:
+                self._remove_value(tag, doc_id)
+
+    def _remove_value(self, tag: str, doc_id: str):
+        value = self._values[tag].pop(doc_id)
+        if _is_scalar(value):
+            ids = self._hash[tag][value]
+            ids.discard(doc_id)
+            if not ids:
+                del self._hash[tag][value]
+        if _is_numeric(value):
+            values, ids = self._sorted_values[tag], self._sorted_ids[tag]
+            lo = bisect.bisect_left(values, value)
+            hi = bisect.bisect_right(values, value)
+            try:
+                pos = ids.index(doc_id, lo, hi)
+            except ValueError:
+                # the numeric values are not sorted yet while extending
+                pos = ids.index(doc_id)
+            del values[pos]
+            del ids[pos]
+        elif isinstance(value, str):
+            for t in _trigrams(value):
+                ids = self._trigrams[tag][t]
+                ids.discard(doc_id)
+                if not ids:
+                    del self._trigrams[tag][t]
+
+    def equal(self, tag: str, value: Any) -> Set[str]:
+        """Get the ids of the Documents whose `tag` equals `value`.
+
+        :param tag: the indexed tag
+        :param value: the value to compare with
+        :return: a set of Document ids
+        """
+        if not _is_scalar(value):
+            return {k for k, v in self._values[tag].items() if v == value}
+        return set(self._hash[tag].get(value, ()))
+
+    def range(
+        self,
+        tag: str,
+        low: Optional[Number] = None,
+        high: Optional[Number] = None,
+        include_low: bool = True,
+        include_high: bool = True,
+    ) -> Set[str]:
+        """Get the ids of the Documents whose numeric `tag` value is in the range of `low` and `high`.
+
+        :param tag: the indexed tag
+        :param low: the lower bound, unbounded if not given
+        :param high: the upper bound, unbounded if not given
+        :param include_low: if set, the lower bound is inclusive
+        :param include_high: if set, the upper bound is inclusive
+        :return: a set of Document ids
+        """
+        values = self._sorted_values[tag]
+        start, end = 0, len(values)
+        if low is not None:
+            start = (bisect.bisect_left if include_low else bisect.bisect_right)(
+                values, low
+            )
+        if high is not None:
+            end = (bisect.bisect_right if include_high else bisect.bisect_left)(
+                values, high
+            )
+        return set(self._sorted_ids[tag][start:end])
+
+    def _string_candidates(self, tag: str, literals: Iterable[str]) -> Iterable[str]:
+        candidates = None
+        for literal in literals:
+            for t in _trigrams(literal):
+                ids = self._trigrams[tag].get(t, set())
+                candidates = ids if candidates is None else candidates & ids
+                if not candidates:
+                    return ()
+        if candidates is None:
+            return self._values[tag].keys()
+        return candidates
+
+    def regex(
+        self, tag: str, pattern: Union[str, 're.Pattern'], full_scan: bool = False
+    ) -> Set[str]:
+        """Get the ids of the Documents whose string `tag` value matches the regular expression.
+
+        Candidates are narrowed down by the trigrams of the literals the pattern requires, and then
+        verified against the pattern.
+
+        :param tag: the indexed tag
+        :param pattern: the regular expression, it is applied with :meth:`re.Pattern.match`
+        :param full_scan: if set, the pattern is applied with :meth:`re.Pattern.search` instead
+        :return: a set of Document ids
+        """
+        if isinstance(pattern, str):
+            pattern = re.compile(pattern)
+        func = pattern.search if full_scan else pattern.match
+        values = self._values[tag]
+        return {
+            doc_id
+            for doc_id in self._string_candidates(tag, _required_literals(pattern))
+            if isinstance(values[doc_id], str)
+            and values[doc_id]
+            and func(values[doc_id])
+        }
+
+    def contains(self, tag: str, substring: str) -> Set[str]:
+        """Get the ids of the Documents whose string `tag` value contains `substring`.
+
+        :param tag: the indexed tag
+        :param substring: the substring to look for
+        :return: a set of Document ids
+        """
+        values = self._values[tag]
+        return {
+            doc_id
+            for doc_id in self._string_candidates(tag, (substring,))
+            if isinstance(values[doc_id], str) and substring in values[doc_id]
+        }
+
+    def groups(self, tag: str) -> Dict[Union[str, Number], Set[str]]:
+        """Get the ids of the Documents grouped by the value of `tag`.
+
+        :param tag: the indexed tag
+        :return: a dict from tag value to a set of Document ids
+        """
+        return self._hash[tag]
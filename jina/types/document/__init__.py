@@ -21,11 +21,11 @@ from typing import (
 
 import numpy as np
 from google.protobuf import json_format
-from google.protobuf.field_mask_pb2 import FieldMask
 
 from .converters import png_to_buffer, to_datauri, to_image_blob
 from .helper import versioned, VersionedMixin
 from ..mixin import ProtoTypeMixin
+from ..ndarray.dense.frames import materialize_frames
 from ..ndarray.generic import NdArray, BaseSparseNdArray
 from ..score import NamedScore
 from ..score.map import NamedScoreMapping
@@ -78,6 +78,19 @@ if False:
 __all__ = ['Document', 'DocumentContentType', 'DocumentSourceType']
 DIGEST_SIZE = 8
 
+# a tuple of field names that inclusive when computing content hash.
+_content_hash_fields = (
+    'text',
+    'blob',
+    'buffer',
+    'embedding',
+    'uri',
+    'tags',
+    'mime_type',
+    'granularity',
+    'adjacency',
+)
+
 # This list is not exhaustive because we cannot add the `sparse` types without adding the `dependencies`
 DocumentContentType = TypeVar('DocumentContentType', bytes, str, 'ArrayType')
 DocumentSourceType = TypeVar(
@@ -232,6 +245,7 @@ class Document(ProtoTypeMixin, VersionedMixin):
         try:
             if isinstance(document, jina_pb2.DocumentProto):
                 if copy:
+                    materialize_frames(document)
                     self._pb_body = jina_pb2.DocumentProto()
                     self._pb_body.CopyFrom(document)
                 else:
@@ -299,6 +313,7 @@ class Document(ProtoTypeMixin, VersionedMixin):
                             )
             elif isinstance(document, Document):
                 if copy:
+                    materialize_frames(document.proto)
                     self._pb_body = jina_pb2.DocumentProto()
                     self._pb_body.CopyFrom(document.proto)
                 else:
@@ -436,27 +451,7 @@ class Document(ProtoTypeMixin, VersionedMixin):
 
         :return: the unique hash code to represent this Document
         """
-        # a tuple of field names that inclusive when computing content hash.
-        fields = (
-            'text',
-            'blob',
-            'buffer',
-            'embedding',
-            'uri',
-            'tags',
-            'mime_type',
-            'granularity',
-            'adjacency',
-        )
-        masked_d = jina_pb2.DocumentProto()
-        present_fields = {
-            field_descriptor.name for field_descriptor, _ in self._pb_body.ListFields()
-        }
-        fields_to_hash = present_fields.intersection(fields)
-        FieldMask(paths=fields_to_hash).MergeMessage(self._pb_body, masked_d)
-        return blake2b(
-            masked_d.SerializePartialToString(), digest_size=DIGEST_SIZE
-        ).hexdigest()
+        return get_content_hash(self._pb_body)
 
     @property
     def id(self) -> str:
@@ -1132,6 +1127,7 @@ class Document(ProtoTypeMixin, VersionedMixin):
 
         :param doc: the document to merge from
         """
+        materialize_frames(doc.proto)
         self._pb_body.MergeFrom(doc.proto)
 
     def CopyFrom(self, doc: 'Document'):
@@ -1139,8 +1135,17 @@ class Document(ProtoTypeMixin, VersionedMixin):
 
         :param doc: the document to copy from
         """
+        materialize_frames(doc.proto)
         self._pb_body.CopyFrom(doc.proto)
 
+    def binary_str(self) -> bytes:
+        """Return the serialized the Document to a string.
+
+        :return: binary string representation of the object
+        """
+        materialize_frames(self._pb_body)
+        return super().binary_str()
+
     def __mermaid_str__(self):
         results = []
         from google.protobuf.json_format import MessageToDict
@@ -1260,6 +1265,7 @@ class Document(ProtoTypeMixin, VersionedMixin):
         :param kwargs: Extra keyword arguments
         :return: dict representation of the object
         """
+        materialize_frames(self._pb_body)
         d = super().dict(*args, **kwargs)
         if prettify_ndarrays:
             self._prettify_doc_dict(d)
@@ -1273,6 +1279,7 @@ class Document(ProtoTypeMixin, VersionedMixin):
         :param kwargs: Extra keyword arguments
         :return: JSON string of the object
         """
+        materialize_frames(self._pb_body)
         if prettify_ndarrays:
             import json
 
@@ -1348,3 +1355,34 @@ def _is_uri(value: str) -> bool:
 def _is_datauri(value: str) -> bool:
     scheme = urllib.parse.urlparse(value).scheme
     return scheme in {'data'}
+
+
+def get_content_hash(
+    doc: Union['Document', 'jina_pb2.DocumentProto'],
+    fields: Optional[Iterable[str]] = None,
+) -> str:
+    """Get the hash of the content of a Document.
+
+    Only the present `fields` are copied into an empty proto, which is serialized and hashed. This gives
+    the same hash as :attr:`Document.content_hash`, without wrapping the proto into a :class:`Document`.
+
+    :param doc: the Document or the DocumentProto to hash
+    :param fields: the names of the fields to hash, by default the fields used by :attr:`Document.content_hash`
+    :return: the hash code of the content
+    """
+    fields = _content_hash_fields if fields is None else fields
+    pb = getattr(doc, '_pb_body', doc)
+    masked_d = jina_pb2.DocumentProto()
+    for field_descriptor, value in pb.ListFields():
+        name = field_descriptor.name
+        if name not in fields:
+            continue
+        if field_descriptor.label == field_descriptor.LABEL_REPEATED:
+            getattr(masked_d, name).MergeFrom(value)
+        elif field_descriptor.type == field_descriptor.TYPE_MESSAGE:
+            getattr(masked_d, name).CopyFrom(value)
+        else:
+            setattr(masked_d, name, value)
+    return blake2b(
+        masked_d.SerializePartialToString(), digest_size=DIGEST_SIZE
+    ).hexdigest()
@@ -1,3 +1,4 @@
+from contextlib import contextmanager
 from typing import Optional, Iterator, Tuple, Dict, Iterable, Sequence, Union
 
 import numpy as np
@@ -52,6 +53,8 @@ class GraphDocument(Document):
         **kwargs,
     ):
         self._check_installed_array_packages()
+        self._invalidate_adjacency_cache()
+        self._pending_edges = None
         super().__init__(document=document, copy=copy, **kwargs)
         if force_undirected:
             self._pb_body.graph.undirected = force_undirected
@@ -61,6 +64,11 @@ class GraphDocument(Document):
         # cache the `nodes` into an object so that we do not have to call `self.nodes` every time which is expensive
         self._nodes = self.nodes
 
+    def _invalidate_adjacency_cache(self):
+        self._adjacency = None
+        self._csr = None
+        self._csc = None
+
     @staticmethod
     def _check_installed_array_packages():
         from ... import JINA_GLOBAL
@@ -74,6 +82,70 @@ class GraphDocument(Document):
             ):
                 JINA_GLOBAL.scipy_installed = True
 
+    @contextmanager
+    def batch_edges(self):
+        """
+        Collect the edges added inside the context and write the adjacency only once when leaving it.
+
+        Without it, every :meth:`add_single_edge` re-serializes the whole adjacency, which makes building
+        a graph edge by edge quadratic in the number of edges.
+
+        .. highlight:: python
+        .. code-block:: python
+
+            with graph.batch_edges():
+                for doc1, doc2 in pairs:
+                    graph.add_single_edge(doc1, doc2)
+
+        .. note::
+            Reading the adjacency inside the context, e.g. via :attr:`num_edges` or :meth:`remove_single_node`,
+            writes the collected edges first.
+
+        :yield: nothing, the edges are written when the context exits
+        """
+        if self._pending_edges is not None:
+            yield
+            return
+        self._pending_edges = ([], [])
+        try:
+            yield
+        finally:
+            self._commit_edges()
+            self._pending_edges = None
+
+    def _commit_edges(self):
+        if self._pending_edges is None or not self._pending_edges[0]:
+            return
+        rows, cols = self._pending_edges
+        self._pending_edges = ([], [])
+        self._write_edges(np.array(rows), np.array(cols))
+
+    def _append_edges(self, rows: Sequence[int], cols: Sequence[int]):
+        if self._pending_edges is not None:
+            self._pending_edges[0].extend(rows)
+            self._pending_edges[1].extend(cols)
+        else:
+            self._write_edges(np.asarray(rows), np.asarray(cols))
+
+    def _write_edges(self, rows: 'np.ndarray', cols: 'np.ndarray'):
+        current_adjacency = self.adjacency
+        data = np.ones(len(rows), dtype=int)
+        if current_adjacency is not None:
+            rows = np.concatenate((current_adjacency.row, rows))
+            cols = np.concatenate((current_adjacency.col, cols))
+            data = np.concatenate((current_adjacency.data, data))
+        self._set_adjacency(rows, cols, data)
+
+    def _set_adjacency(self, row: 'np.ndarray', col: 'np.ndarray', data: 'np.ndarray'):
+        from scipy.sparse import coo_matrix
+
+        if row.shape[0] > 0:
+            value = coo_matrix((data, (row, col)))
+        else:
+            value = coo_matrix((0, 0))
+        SparseNdArray(self._pb_body.graph.adjacency, sp_format='coo').value = value
+        self._invalidate_adjacency_cache()
+
     def add_single_node(self, node: 'Document'):
         """
         Add a a node to the graph
@@ -83,9 +155,7 @@ class GraphDocument(Document):
         if node.id in self._nodes:
             default_logger.debug(f'Document {node.id} is already a node of the graph')
             return
-        nodes = self.nodes
-        nodes.append(node)
-        self._nodes = nodes
+        self._nodes.append(node)
 
     @deprecated_method(new_function_name='add_single_node')
     def add_node(self, *args, **kwargs):
@@ -104,7 +174,7 @@ class GraphDocument(Document):
         :param nodes: the nodes to be added to the graph
         """
         for node in nodes:
-            self.add_node(node)
+            self.add_single_node(node)
 
     def remove_single_node(self, node: Union['Document', str]):
         """
@@ -112,8 +182,6 @@ class GraphDocument(Document):
 
         :param node: the node to be removed from the graph
         """
-        from scipy.sparse import coo_matrix
-
         node_id = node.id if isinstance(node, Document) else node
         if node_id not in self._nodes:
             default_logger.debug(
@@ -121,39 +189,27 @@ class GraphDocument(Document):
             )
             return
 
-        offset = self._nodes._id_to_index[node_id]
+        offset = self._nodes._get_index_by_id(node_id)
 
         if self.num_edges > 0:
             nodes = self._nodes
+            adjacency = self.adjacency
+            row, col, data = adjacency.row, adjacency.col, adjacency.data
 
-            edges_to_remove = []
-            for edge_id, (row, col) in enumerate(
-                zip(self.adjacency.row, self.adjacency.col)
-            ):
-                if row.item() == offset or col.item() == offset:
-                    edge_features_keys = (
-                        f'{nodes[row.item()].id}-{nodes[col.item()].id}'
-                    )
-                    edges_to_remove.append((edge_id, edge_features_keys))
-
-            for edge_id, edge_features_key in reversed(edges_to_remove):
-                self._remove_edge_id(edge_id, edge_features_key)
-
-            if self.num_edges > 0:
-                row = np.copy(self.adjacency.row)
-                col = np.copy(self.adjacency.col)
-                data = np.copy(self.adjacency.data)
-                for i in range(self.num_edges):
-                    if self.adjacency.row[i] > offset:
-                        row[i] = row[i] - 1
-                    if self.adjacency.col[i] > offset:
-                        col[i] = col[i] - 1
-                SparseNdArray(
-                    self._pb_body.graph.adjacency, sp_format='coo'
-                ).value = coo_matrix((data, (row, col)))
-
-        del self.nodes[offset]
-        self._update_nodes_cache()
+            to_remove = (row == offset) | (col == offset)
+            edge_features = self.edge_features
+            for r, c in zip(row[to_remove], col[to_remove]):
+                edge_features_key = f'{nodes[r.item()].id}-{nodes[c.item()].id}'
+                if edge_features_key in edge_features:
+                    del edge_features[edge_features_key]
+
+            keep = ~to_remove
+            row, col, data = row[keep], col[keep], data[keep]
+            row = row - (row > offset)
+            col = col - (col > offset)
+            self._set_adjacency(row, col, data)
+
+        del self._nodes[offset]
 
     @deprecated_method(new_function_name='remove_single_node')
     def remove_node(self, *args, **kwargs):
@@ -189,17 +245,18 @@ class GraphDocument(Document):
         """
         Add an edge to the graph connecting `doc1` with `doc2`
 
+        .. note::
+            To add many edges one by one, add them inside :meth:`batch_edges` or use :meth:`add_edges`.
+
         :param doc1: the starting node for this edge
         :param doc2: the ending node for this edge
         :param features: Optional features dictionary to be added to this new created edge
         """
-        from scipy.sparse import coo_matrix
-
         doc1_id = doc1.id if isinstance(doc1, Document) else doc1
         doc2_id = doc2.id if isinstance(doc2, Document) else doc2
         edge_key = self._get_edge_key(doc1_id, doc2_id)
 
-        if edge_key not in self.edge_features:
+        if edge_key not in self._pb_body.graph.edge_features.fields:
             self.edge_features[edge_key] = features
             if isinstance(doc1, Document):
                 self.add_single_node(doc1)
@@ -214,29 +271,16 @@ class GraphDocument(Document):
                     doc2_id in self._nodes
                 ), 'trying to add an edge to a node not in the graph'
 
-            current_adjacency = self.adjacency
-
             source_id = doc1_id
             target_id = doc2_id
             if self.undirected and doc1_id > doc2_id:
                 source_id = doc2_id
                 target_id = doc1_id
 
-            source_node_offset = np.array([self._nodes._id_to_index[source_id]])
-            target_node_offset = np.array([self._nodes._id_to_index[target_id]])
-
-            if current_adjacency is None:
-                row = source_node_offset
-                col = target_node_offset
-                data = np.array([1])
-            else:
-                row = np.append(current_adjacency.row, source_node_offset)
-                col = np.append(current_adjacency.col, target_node_offset)
-                data = np.append(current_adjacency.data, 1)
-
-            SparseNdArray(
-                self._pb_body.graph.adjacency, sp_format='coo'
-            ).value = coo_matrix((data, (row, col)))
+            self._append_edges(
+                [self._nodes._get_index_by_id(source_id)],
+                [self._nodes._get_index_by_id(target_id)],
+            )
 
     @deprecated_method(new_function_name='add_single_edge')
     def add_edge(self, *args, **kwargs):
@@ -261,8 +305,6 @@ class GraphDocument(Document):
         :param dest_docs: Iterable of docs containing the destination nodes
         :param edge_features: Optional features dictionary to be added to the new created edges
         """
-        from scipy.sparse import coo_matrix
-
         assert len(source_docs) == len(dest_docs), (
             'the number of source documents must match the number of '
             'destination documents '
@@ -271,6 +313,7 @@ class GraphDocument(Document):
 
         is_documents_source = isinstance(source_docs[0], Document)
         is_documents_dest = isinstance(dest_docs[0], Document)
+        features = self.edge_features
 
         for k, (doc1, doc2) in enumerate(zip(source_docs, dest_docs)):
             doc1_id = doc1.id if is_documents_source else doc1
@@ -280,72 +323,52 @@ class GraphDocument(Document):
                 self.add_single_node(doc1)
             else:
                 assert (
-                    doc1_id in self.nodes
+                    doc1_id in self._nodes
                 ), 'trying to add an edge from a node not in the graph'
             if is_documents_dest:
                 self.add_single_node(doc2)
             else:
                 assert (
-                    doc2_id in self.nodes
+                    doc2_id in self._nodes
                 ), 'trying to add an edge from a node not in the graph'
 
             edge_key = self._get_edge_key(doc1_id, doc2_id)
 
             if edge_features is not None:
-                self.edge_features[edge_key] = edge_features[k]
+                features[edge_key] = edge_features[k]
             else:
-                if edge_key not in self.edge_features:
-                    self.edge_features[edge_key] = None
+                if edge_key not in features:
+                    features[edge_key] = None
 
         # manipulate the adjacency matrix in a single shot
-        current_adjacency = self.adjacency
         source_node_offsets = np.array(
             [
-                self._nodes._id_to_index[source.id if is_documents_source else source]
+                self._nodes._get_index_by_id(
+                    source.id if is_documents_source else source
+                )
                 for source in source_docs
             ]
         )
         target_node_offsets = np.array(
             [
-                self._nodes._id_to_index[target.id if is_documents_dest else target]
+                self._nodes._get_index_by_id(target.id if is_documents_dest else target)
                 for target in dest_docs
             ]
         )
+        self._append_edges(source_node_offsets, target_node_offsets)
 
-        if current_adjacency is None:
-            row = source_node_offsets
-            col = target_node_offsets
-            data = np.ones(len(source_node_offsets), dtype=int)
-        else:
-            row = np.append(current_adjacency.row, source_node_offsets)
-            col = np.append(current_adjacency.col, target_node_offsets)
-            data = np.append(
-                current_adjacency.data, np.ones(len(source_node_offsets), dtype=int)
-            )
-
-        SparseNdArray(
-            self._pb_body.graph.adjacency, sp_format='coo'
-        ).value = coo_matrix((data, (row, col)))
-
-    def _remove_edge_id(self, edge_id: int, edge_feature_key: str):
-        from scipy.sparse import coo_matrix
-
-        if self.adjacency is not None:
-            if edge_id > self.num_edges:
+    def _remove_edge_id(self, edge_id: Union[int, 'np.ndarray'], edge_feature_key: str):
+        adjacency = self.adjacency
+        if adjacency is not None:
+            if np.any(np.asarray(edge_id) >= self.num_edges):
                 raise Exception(
                     f'Trying to remove edge {edge_id} while number of edges is {self.num_edges}'
                 )
-            row = np.delete(self.adjacency.row, edge_id)
-            col = np.delete(self.adjacency.col, edge_id)
-            data = np.delete(self.adjacency.data, edge_id)
-            if row.shape[0] > 0:
-                SparseNdArray(
-                    self._pb_body.graph.adjacency, sp_format='coo'
-                ).value = coo_matrix((data, (row, col)))
-            else:
-                SparseNdArray(
-                    self._pb_body.graph.adjacency, sp_format='coo'
-                ).value = coo_matrix((0, 0))
+            self._set_adjacency(
+                np.delete(adjacency.row, edge_id),
+                np.delete(adjacency.col, edge_id),
+                np.delete(adjacency.data, edge_id),
+            )
 
             if edge_feature_key in self.edge_features:
                 del self.edge_features[edge_feature_key]
@@ -363,14 +386,12 @@ class GraphDocument(Document):
         """
         doc1_id = doc1.id if isinstance(doc1, Document) else doc1
         doc2_id = doc2.id if isinstance(doc2, Document) else doc2
-        offset1 = self._nodes._id_to_index[doc1_id]
-        offset2 = self._nodes._id_to_index[doc2_id]
-        for edge_id, (row, col) in enumerate(
-            zip(self.adjacency.row, self.adjacency.col)
-        ):
-            if row.item() == offset1 and col.item() == offset2:
-                edge_key = self._get_edge_key(doc1_id, doc2_id)
-                self._remove_edge_id(edge_id, edge_key)
+        offset1 = self._nodes._get_index_by_id(doc1_id)
+        offset2 = self._nodes._get_index_by_id(doc2_id)
+        edge_ids = self._get_out_edge_ids(offset1)
+        edge_ids = edge_ids[self.adjacency.col[edge_ids] == offset2]
+        if len(edge_ids):
+            self._remove_edge_id(edge_ids, self._get_edge_key(doc1_id, doc2_id))
 
     @deprecated_method(new_function_name='remove_single_edge')
     def remove_edge(self, *args, **kwargs):
@@ -396,9 +417,49 @@ class GraphDocument(Document):
         """
         The adjacency list for this graph.
 
+        .. note::
+            The adjacency is deserialized once and cached until the edges change, do not modify it in place.
+
         .. # noqa: DAR201
         """
-        return SparseNdArray(self._pb_body.graph.adjacency, sp_format='coo').value
+        self._commit_edges()
+        if self._adjacency is None:
+            self._adjacency = SparseNdArray(
+                self._pb_body.graph.adjacency, sp_format='coo'
+            ).value
+        return self._adjacency
+
+    @staticmethod
+    def _build_compressed_index(
+        keys: 'np.ndarray', num_nodes: int
+    ) -> Tuple['np.ndarray', 'np.ndarray']:
+        # edge ids grouped by `keys` in a stable order and the offset of each group, as in CSR/CSC
+        order = np.argsort(keys, kind='stable')
+        indptr = np.zeros(num_nodes + 1, dtype=np.int64)
+        np.cumsum(np.bincount(keys, minlength=num_nodes), out=indptr[1:])
+        return indptr, order
+
+    def _get_out_edge_ids(self, offset: int) -> 'np.ndarray':
+        adjacency = self.adjacency
+        if adjacency is None:
+            return np.array([], dtype=np.int64)
+        if self._csr is None:
+            self._csr = self._build_compressed_index(
+                adjacency.row, max(self.num_nodes, adjacency.shape[0])
+            )
+        indptr, order = self._csr
+        return order[indptr[offset] : indptr[offset + 1]]
+
+    def _get_in_edge_ids(self, offset: int) -> 'np.ndarray':
+        adjacency = self.adjacency
+        if adjacency is None:
+            return np.array([], dtype=np.int64)
+        if self._csc is None:
+            self._csc = self._build_compressed_index(
+                adjacency.col, max(self.num_nodes, adjacency.shape[1])
+            )
+        indptr, order = self._csc
+        return order[indptr[offset] : indptr[offset + 1]]
 
     @property
     def undirected(self) -> bool:
@@ -416,7 +477,7 @@ class GraphDocument(Document):
 
         .. # noqa: DAR201
         """
-        return len(self.nodes)
+        return len(self._nodes)
 
     @property
     def num_edges(self) -> int:
@@ -444,8 +505,9 @@ class GraphDocument(Document):
         .. # noqa: DAR201
         :param doc: the document node from which to extract the outdegree.
         """
-        out_edges = self.get_outgoing_nodes(doc)
-        return len(out_edges) if out_edges else 0
+        if doc.id not in self._nodes:
+            return 0
+        return len(self._get_out_edge_ids(self._nodes._get_index_by_id(doc.id)))
 
     def get_in_degree(self, doc: 'Document') -> int:
         """
@@ -454,8 +516,9 @@ class GraphDocument(Document):
         .. # noqa: DAR201
         :param doc: the document node from which to extract the indegree.
         """
-        in_edges = self.get_incoming_nodes(doc)
-        return len(in_edges) if in_edges else 0
+        if doc.id not in self._nodes:
+            return 0
+        return len(self._get_in_edge_ids(self._nodes._get_index_by_id(doc.id)))
 
     @nodes.setter
     def nodes(self, value: Iterable['Document']):
@@ -474,13 +537,10 @@ class GraphDocument(Document):
         :param doc: the document node from which to extract the outgoing nodes.
         """
         if self.adjacency is not None and doc.id in self._nodes:
-            offset = self._nodes._id_to_index[doc.id]
+            offset = self._nodes._get_index_by_id(doc.id)
+            cols = self.adjacency.col[self._get_out_edge_ids(offset)]
             return ChunkArray(
-                [
-                    self._nodes[col.item()]
-                    for (row, col) in zip(self.adjacency.row, self.adjacency.col)
-                    if row.item() == offset
-                ],
+                [self._nodes[col.item()] for col in cols],
                 reference_doc=self,
             )
 
@@ -492,13 +552,10 @@ class GraphDocument(Document):
         :param doc: the document node from which to extract the incoming nodes.
         """
         if self.adjacency is not None and doc.id in self._nodes:
-            offset = self._nodes._id_to_index[doc.id]
+            offset = self._nodes._get_index_by_id(doc.id)
+            rows = self.adjacency.row[self._get_in_edge_ids(offset)]
             return ChunkArray(
-                [
-                    self._nodes[row.item()]
-                    for (row, col) in zip(self.adjacency.row, self.adjacency.col)
-                    if col.item() == offset
-                ],
+                [self._nodes[row.item()] for row in rows],
                 reference_doc=self,
             )
 
@@ -523,10 +580,12 @@ class GraphDocument(Document):
             nodeid_to_doc[int(node)] = node_doc
             jina_graph.add_single_node(node_doc)
 
-        for node_source, node_destination in zip(*dgl_graph.edges()):
-            jina_graph.add_single_edge(
-                nodeid_to_doc[int(node_source)], nodeid_to_doc[int(node_destination)]
-            )
+        with jina_graph.batch_edges():
+            for node_source, node_destination in zip(*dgl_graph.edges()):
+                jina_graph.add_single_edge(
+                    nodeid_to_doc[int(node_source)],
+                    nodeid_to_doc[int(node_destination)],
+                )
 
         return jina_graph
 
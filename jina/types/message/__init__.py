@@ -1,7 +1,11 @@
 import os
 import sys
+import time
 import traceback
-from typing import Union, List, Optional
+from functools import lru_cache
+from typing import Union, List, Optional, Tuple
+
+from google.protobuf.internal.encoder import _VarintBytes
 
 from ..request import Request
 from ..request.control import ControlRequest
@@ -13,12 +17,23 @@ from ...helper import colored
 from ...logging.predefined import default_logger
 from ...proto import jina_pb2
 from ...types.routing.table import RoutingTable
+from .compression import compress, get_adaptive_compressor, get_dictionary
 
 if False:
     from ...executors import BaseExecutor
 
 __all__ = ['Message']
 
+_tensor_frame_min_bytes = os.environ.get('JINA_TENSOR_FRAME_MIN_BYTES')
+TENSOR_FRAME_MIN_BYTES = (
+    int(_tensor_frame_min_bytes) if _tensor_frame_min_bytes else None
+)  # type: Optional[int]
+
+
+@lru_cache()
+def _parse_routing_table(routing_table: str) -> 'RoutingTable':
+    return RoutingTable(routing_table)
+
 
 class Message:
     """
@@ -53,6 +68,10 @@ class Message:
         **kwargs,
     ):
         self._size = 0
+        # the address the Message is sent to, the adaptive compression is chosen per target address
+        self.target_address = ''
+        # the serialized request, shared by the Messages forked from this one
+        self._request_dumps = {}
         if isinstance(envelope, bytes):
             self.envelope = jina_pb2.EnvelopeProto()
             self.envelope.ParseFromString(envelope)
@@ -70,7 +89,7 @@ class Message:
             if isinstance(self.request, Request):
                 self.request._envelope = self.envelope
 
-            self.envelope.header.CopyFrom(self.request.header)
+            self.envelope.header.CopyFrom(self.request._lazy_proto.header)
 
         if self.envelope.check_version:
             self._check_version()
@@ -82,8 +101,41 @@ class Message:
         :param msg: the to-be-copied message
         :return: the new message object
         """
+        if msg.compressed_request:
+            m = cls(msg.envelope, msg.compressed_request)
+            if msg.tensor_frames:
+                m.set_tensor_frames(list(msg.tensor_frames))
+            return m
         return cls(msg.envelope, msg.request)
 
+    def fork(self, envelope: 'jina_pb2.EnvelopeProto') -> 'Message':
+        """Create a new Message with the same request but a different envelope.
+
+        The request is serialized only once for this Message and all Messages forked from it, so fanning out
+        a request to many targets only serializes their envelopes again.
+
+        :param envelope: the envelope of the new Message
+        :return: the new message object
+        """
+        msg = Message(envelope, self.request)
+        msg._request_dumps = self._request_dumps
+        return msg
+
+    def for_target(self, address: str) -> 'Message':
+        """Get the Message to send to ``address``.
+
+        This Message is returned if it is not sent to another target yet, otherwise a fork of it, so that the
+        adaptive compression of each target is kept apart.
+
+        :param address: the address of the target
+        :return: the Message to send
+        """
+        msg = self
+        if self.target_address and self.target_address != address:
+            msg = self.fork(self.envelope)
+        msg.target_address = address
+        return msg
+
     @property
     def request(self) -> 'Request':
         """
@@ -107,6 +159,7 @@ class Message:
 
         :param val: serialized Request
         """
+        self._request_dumps = {}
         if isinstance(val, bytes):
             self._request = Request(
                 val,
@@ -139,12 +192,48 @@ class Message:
         r = jina_pb2.MessageProto()
         r.envelope.CopyFrom(self.envelope)
         if isinstance(self.request, jina_pb2.RequestProto):
-            req = self.request
+            r.request.CopyFrom(self.request)
         else:
-            req = self.request.proto
-        r.request.CopyFrom(req)
+            with self.request._prepare_for_send():
+                r.request.CopyFrom(self.request.proto)
         return r
 
+    def SerializeToString(self) -> bytes:
+        """
+        Serialize the message as :class:`jina_pb2.MessageProto` without copying the request into a new proto.
+
+        The request is serialized only on the first call, later calls and the Messages created by :meth:`fork`
+        reuse the result.
+
+        When the request is compressed, it is set as ``compressed_request`` instead, and its dense buffers are taken
+        out as ``tensor_frames`` as in :meth:`dump`.
+
+        :return: the serialized message
+        """
+        if self._is_compressed:
+            r, frames = self._dump_request()
+            e = self.envelope.SerializePartialToString()
+            # field 3 is the compressed request, field 4 are the tensor frames
+            parts = [b'\x0a', _VarintBytes(len(e)), e, b'\x1a', _VarintBytes(len(r)), r]
+            for f in frames:
+                parts.extend((b'\x22', _VarintBytes(len(f)), f))
+            return b''.join(parts)
+
+        if 'proto' not in self._request_dumps:
+            if isinstance(self.request, jina_pb2.RequestProto):
+                self._request_dumps['proto'] = self.request.SerializePartialToString()
+            else:
+                with self.request._prepare_for_send():
+                    self._request_dumps[
+                        'proto'
+                    ] = self.request.proto.SerializePartialToString()
+        r = self._request_dumps['proto']
+        e = self.envelope.SerializePartialToString()
+        # the wire format of `MessageProto`: field 1 is the envelope, field 2 is the request
+        return b''.join(
+            (b'\x0a', _VarintBytes(len(e)), e, b'\x12', _VarintBytes(len(r)), r)
+        )
+
     @property
     def is_data_request(self) -> bool:
         """check if the request is not a control request
@@ -169,6 +258,7 @@ class Message:
         compress_min_ratio: float = 1.0,
         routing_table: Optional[str] = None,
         static_routing_table: bool = False,
+        compact_routing_table: bool = False,
         *args,
         **kwargs,
     ) -> 'jina_pb2.EnvelopeProto':
@@ -190,6 +280,7 @@ class Message:
         :param compress_min_ratio: used for configuring compression
         :param routing_table: routing graph filled by gateway
         :param static_routing_table: dont include the routing table in the envelope
+        :param compact_routing_table: only include the id of the routing table and the active Pod in the envelope
         :return: the resulted protobuf message
         """
         envelope = jina_pb2.EnvelopeProto()
@@ -227,12 +318,18 @@ class Message:
                 f'expecting request in type: jina_pb2.RequestProto, but receiving {type(self.request)}'
             )
 
-        envelope.compression.algorithm = str(compress)
+        if str(compress) == str(CompressAlgo.AUTO):
+            envelope.compression.adaptive = True
+            envelope.compression.algorithm = str(CompressAlgo.NONE)
+        else:
+            envelope.compression.algorithm = str(compress)
         envelope.compression.min_ratio = compress_min_ratio
         envelope.compression.min_bytes = compress_min_bytes
         envelope.timeout = 5000
         if routing_table is not None and not static_routing_table:
-            envelope.routing_table.CopyFrom(RoutingTable(routing_table).proto)
+            _parse_routing_table(routing_table).add_to_envelope(
+                envelope, compact=compact_routing_table, with_table=False
+            )
         self._add_version(envelope)
         self._add_route(pod_name, identity, envelope)
         envelope.check_version = check_version
@@ -242,85 +339,126 @@ class Message:
         """
         Get the message in a list of bytes.
 
-        :return: array, containing encoded receiver id, serialized envelope and the compressed serialized envelope
-        """
-        r2 = self.request.SerializeToString()
-        r2 = self._compress(r2)
+        The request is serialized and compressed only on the first call, later calls and the Messages created by
+        :meth:`fork` reuse the result. Hence the request should not be changed after the Message is dumped.
 
+        When the request is compressed, its dense buffers are not serialized into it but sent as extra frames
+        without copying, as they hardly compress, so only the rest of the request, e.g. text and tags, is compressed.
+        Otherwise, the dense buffers of at least ``JINA_TENSOR_FRAME_MIN_BYTES`` are sent as extra frames if the
+        environment variable is set.
+
+        :return: array, containing encoded receiver id, the out-of-band dense buffers if any, serialized envelope and
+            the compressed serialized envelope
+        """
+        r2, frames = self._dump_request()
         r0 = self.envelope.receiver_id.encode()
         r1 = self.envelope.SerializePartialToString()
-        m = [r0, r1, r2]
+        # the envelope and the request stay the last two frames, as routers may strip the leading frames
+        m = [r0, *frames, r1, r2]
         self._size = sum(sys.getsizeof(r) for r in m)
         return m
 
+    @property
+    def _is_compressed(self) -> bool:
+        compression = self.envelope.compression
+        return compression.adaptive or compression.algorithm not in ('', 'NONE')
+
+    def _dump_request(self) -> Tuple[bytes, List[bytes]]:
+        compression = self.envelope.compression
+        # the adaptive compression is chosen per target, so only the Messages sent to the same target share the result
+        key = ('request', self.target_address if compression.adaptive else '')
+        if key not in self._request_dumps:
+            if isinstance(self.request, Request):
+                r2, frames = self.request._serialize_with_tensor_frames(
+                    0 if self._is_compressed else TENSOR_FRAME_MIN_BYTES
+                )
+            else:
+                r2, frames = self.request.SerializeToString(), []
+            r2 = self._compress(r2)
+            self._request_dumps[key] = (r2, frames, compression.algorithm)
+        r2, frames, algorithm = self._request_dumps[key]
+        compression.algorithm = algorithm
+        self.envelope.num_tensor_frames = len(frames)
+        return r2, frames
+
+    def set_tensor_frames(self, frames: List[bytes]):
+        """Set the received frames that hold the dense buffers of the request sent out-of-band.
+
+        The buffers are put back into the request when it is deserialized, if the request is not touched
+        the frames are sent again as they are.
+
+        :param frames: the frames between the receiver id and the envelope
+        """
+        self.request._tensor_frames = frames
+        self._size += sum(sys.getsizeof(f) for f in frames)
+
     def _compress(self, data: bytes) -> bytes:
-        # no further compression or post processing is required
-        if isinstance(self.request, Request) and not self.request.is_decompressed:
+        # no further compression or post processing is required, if the untouched request is compressed already
+        if (
+            isinstance(self.request, Request)
+            and not self.request.is_decompressed
+            and self.request._compression_algorithm
+        ):
+            self.envelope.compression.algorithm = str(
+                self.request._compression_algorithm
+            )
             return data
 
-        # otherwise there are two cases
+        # otherwise there are three cases
         # 1. it is a lazy request, and being used, so `self.request.SerializeToString()` is a new uncompressed string
-        # 2. it is a regular request, `self.request.SerializeToString()` is a uncompressed string
+        # 2. it is a lazy request received without compression, e.g. by the gateway, its buffer is uncompressed
+        # 3. it is a regular request, `self.request.SerializeToString()` is a uncompressed string
         # either way need compress
-        if not self.envelope.compression.algorithm:
+        compression = self.envelope.compression
+        if not compression.adaptive and not compression.algorithm:
             return data
 
-        ctag = CompressAlgo.from_string(self.envelope.compression.algorithm)
+        ctag = CompressAlgo.from_string(compression.algorithm or 'NONE')
 
-        if ctag == CompressAlgo.NONE:
+        if ctag == CompressAlgo.NONE and not compression.adaptive:
             return data
 
         _size_before = sys.getsizeof(data)
 
-        # lower than hwm, pass compression
-        if (
-            _size_before < self.envelope.compression.min_bytes
-            or self.envelope.compression.min_bytes < 0
+        # lower than hwm, pass compression unless a preset dictionary makes small messages worth compressing
+        if compression.min_bytes < 0 or (
+            _size_before < compression.min_bytes and not get_dictionary()
         ):
-            self.envelope.compression.algorithm = 'NONE'
+            compression.algorithm = 'NONE'
             return data
 
-        try:
-            if ctag == CompressAlgo.LZ4:
-                import lz4.frame
-
-                c_data = lz4.frame.compress(data)
-            elif ctag == CompressAlgo.BZ2:
-                import bz2
-
-                c_data = bz2.compress(data)
-            elif ctag == CompressAlgo.LZMA:
-                import lzma
-
-                c_data = lzma.compress(data)
-            elif ctag == CompressAlgo.ZLIB:
-                import zlib
-
-                c_data = zlib.compress(data)
-            elif ctag == CompressAlgo.GZIP:
-                import gzip
+        if _size_before < compression.min_bytes:
+            ctag = CompressAlgo.ZLIB
+        elif compression.adaptive:
+            data, ctag = get_adaptive_compressor(
+                self.target_address, compression.min_ratio
+            ).compress(data)
+            compression.algorithm = str(ctag)
+            return data
 
-                c_data = gzip.compress(data)
+        try:
+            c_data = compress(data, ctag)
 
             _size_after = sys.getsizeof(c_data)
             _c_ratio = _size_before / _size_after
 
-            if _c_ratio > self.envelope.compression.min_ratio:
+            if _c_ratio > compression.min_ratio:
                 data = c_data
+                compression.algorithm = str(ctag)
             else:
                 # compression rate is too bad, dont bother
                 # save time on decompression
                 default_logger.debug(
                     f'compression rate {(_size_before / _size_after):.2f}% '
                     f'is lower than min_ratio '
-                    f'{self.envelope.compression.min_ratio}'
+                    f'{compression.min_ratio}'
                 )
-                self.envelope.compression.algorithm = 'NONE'
+                compression.algorithm = 'NONE'
         except Exception as ex:
             default_logger.debug(
                 f'compression={str(ctag)} failed, fallback to compression="NONE". reason: {ex!r}'
             )
-            self.envelope.compression.algorithm = 'NONE'
+            compression.algorithm = 'NONE'
 
         return data
 
@@ -491,6 +629,27 @@ class Message:
         else:
             d.code = jina_pb2.StatusProto.ERROR_CHAINED
 
+    @property
+    def is_deadline_exceeded(self) -> bool:
+        """
+        Return if the deadline set by the client has passed.
+
+        :return: True if the request has a deadline and it has passed
+        """
+        header = self.envelope.header
+        return header.HasField('deadline') and (
+            header.deadline.ToNanoseconds() < time.time_ns()
+        )
+
+    def add_deadline_exceeded(self) -> None:
+        """Mark the envelope and its last route, i.e. the current Pea, as skipped because the deadline passed."""
+        if self.envelope.status.code != jina_pb2.StatusProto.DEADLINE_EXCEEDED:
+            self.envelope.status.code = jina_pb2.StatusProto.DEADLINE_EXCEEDED
+            self.envelope.status.description = (
+                f'the deadline passed before {self.envelope.routes[-1].pod}'
+            )
+        self.envelope.routes[-1].status.code = jina_pb2.StatusProto.DEADLINE_EXCEEDED
+
     @property
     def is_error(self) -> bool:
         """
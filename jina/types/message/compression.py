@@ -0,0 +1,247 @@
+import os
+import time
+import zlib
+from collections import Counter
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from ...enums import CompressAlgo
+
+__all__ = [
+    'compress',
+    'zlib_decompress',
+    'get_dictionary',
+    'train_dictionary',
+    'AdaptiveCompressor',
+    'get_adaptive_compressor',
+]
+
+# the zlib window is 32KB, a larger dictionary does not help
+MAX_DICTIONARY_SIZE = 32 * 1024
+
+# the number of bytes compressed with every candidate algorithm when sampling
+SAMPLE_BYTES = 64 * 1024
+
+# the assumed bandwidth of a link between two Peas in bytes/second, used to weigh the saved bytes against the time
+# spent on compression
+LINK_BANDWIDTH = float(os.environ.get('JINA_COMPRESS_BANDWIDTH', 125e6))
+
+_adaptive_compressors = {}  # type: Dict[Tuple[str, float], 'AdaptiveCompressor']
+
+
+def compress(data: bytes, algorithm: CompressAlgo) -> bytes:
+    """Compress data with the given algorithm.
+
+    If a dictionary is configured via ``JINA_COMPRESS_DICTIONARY``, ``ZLIB`` uses it as the preset dictionary.
+
+    :param data: the data to compress
+    :param algorithm: the compression algorithm
+    :return: the compressed data
+    """
+    if algorithm == CompressAlgo.LZ4:
+        import lz4.frame
+
+        return lz4.frame.compress(data)
+    elif algorithm == CompressAlgo.BZ2:
+        import bz2
+
+        return bz2.compress(data)
+    elif algorithm == CompressAlgo.LZMA:
+        import lzma
+
+        return lzma.compress(data)
+    elif algorithm == CompressAlgo.ZLIB:
+        dictionary = get_dictionary()
+        if dictionary:
+            c = zlib.compressobj(zdict=dictionary)
+            return c.compress(data) + c.flush()
+        return zlib.compress(data)
+    elif algorithm == CompressAlgo.GZIP:
+        import gzip
+
+        return gzip.compress(data)
+    return data
+
+
+def zlib_decompress(data: bytes) -> bytes:
+    """Decompress data compressed with ``ZLIB``, with or without a preset dictionary.
+
+    :param data: the compressed data
+    :return: the decompressed data
+    """
+    # the FDICT bit of a valid zlib header tells if a preset dictionary is used, its adler32 checksum follows
+    if (
+        len(data) > 5
+        and data[0] & 0x0F == 8
+        and (data[0] << 8 | data[1]) % 31 == 0
+        and data[1] & 0x20
+    ):
+        dictionary = get_dictionary()
+        if not dictionary or zlib.adler32(dictionary) != int.from_bytes(
+            data[2:6], 'big'
+        ):
+            raise ValueError(
+                'the data is compressed with a dictionary different from `JINA_COMPRESS_DICTIONARY`'
+            )
+        d = zlib.decompressobj(zdict=dictionary)
+        return d.decompress(data) + d.flush()
+    return zlib.decompress(data)
+
+
+@lru_cache()
+def get_dictionary() -> Optional[bytes]:
+    """Get the preset compression dictionary from the file set by the environment variable ``JINA_COMPRESS_DICTIONARY``.
+
+    All Peas of a Flow must use the same dictionary, e.g. one trained by :func:`train_dictionary`.
+
+    :return: the dictionary or None if it is not configured
+    """
+    path = os.environ.get('JINA_COMPRESS_DICTIONARY')
+    if path:
+        with open(path, 'rb') as fp:
+            return fp.read()[-MAX_DICTIONARY_SIZE:]
+
+
+def train_dictionary(
+    samples: Iterable[bytes],
+    size: int = MAX_DICTIONARY_SIZE,
+    segment_size: int = 16,
+) -> bytes:
+    """Train a preset dictionary for ``ZLIB`` on typical serialized requests.
+
+    The dictionary is built from the segments shared by most samples, e.g. mime types, tag keys and endpoints.
+    It mostly helps small requests, which are otherwise too short to compress well.
+
+    .. highlight:: python
+    .. code-block:: python
+
+        with open('requests.dict', 'wb') as fp:
+            fp.write(train_dictionary(r.SerializeToString() for r in requests))
+
+    :param samples: the serialized requests
+    :param size: the maximum size of the dictionary in bytes
+    :param segment_size: the length of the segments counted in the samples
+    :return: the dictionary
+    """
+    counts = Counter()
+    step = max(segment_size // 4, 1)
+    for sample in samples:
+        counts.update(
+            {
+                sample[i : i + segment_size]
+                for i in range(0, max(len(sample) - segment_size + 1, 1), step)
+            }
+        )
+
+    segments = []  # type: List[bytes]
+    total = 0
+    for segment, count in counts.most_common():
+        if count < 2 or total >= size:
+            break
+        segments.append(segment)
+        total += len(segment)
+
+    # zlib reaches the end of the dictionary with the shortest distances, so the most common segments go last
+    return b''.join(reversed(segments))[-size:]
+
+
+def _available_algorithms() -> List[CompressAlgo]:
+    algorithms = [CompressAlgo.ZLIB]
+    try:
+        import lz4.frame  # noqa: F401
+
+        algorithms.insert(0, CompressAlgo.LZ4)
+    except ImportError:
+        pass
+    return algorithms
+
+
+class AdaptiveCompressor:
+    """Choose the compression algorithm of a link from the sampled compression ratio and throughput.
+
+    Every `sample_interval` messages, a sample of the data is compressed with every candidate algorithm. The
+    ratio and the throughput are tracked as exponential moving averages, and the algorithm with the shortest
+    estimated time to compress and send a message over a link of ``JINA_COMPRESS_BANDWIDTH`` bytes/second is
+    chosen, which is no compression at all for incompressible data such as embeddings.
+
+    :param min_ratio: the minimum compression ratio for a compressed message to be sent
+    :param sample_interval: the number of messages between two samples
+    :param decay: the weight of the history in the moving averages
+    """
+
+    def __init__(
+        self, min_ratio: float = 1.0, sample_interval: int = 32, decay: float = 0.8
+    ):
+        self.min_ratio = min_ratio
+        self.sample_interval = sample_interval
+        self.decay = decay
+        self.algorithms = _available_algorithms()
+        # algorithm -> [compression ratio, throughput in bytes/second]
+        self._stats = {}  # type: Dict[CompressAlgo, List[float]]
+        self._num_messages = 0
+        self.algorithm = CompressAlgo.NONE
+
+    def compress(self, data: bytes) -> Tuple[bytes, CompressAlgo]:
+        """Compress data with the algorithm currently chosen for the link.
+
+        :param data: the data to compress
+        :return: the compressed data and the algorithm, ``NONE`` if the data is not compressed
+        """
+        if self._num_messages % self.sample_interval == 0:
+            self._sample(data[:SAMPLE_BYTES])
+        self._num_messages += 1
+
+        algorithm = self.algorithm
+        if algorithm == CompressAlgo.NONE:
+            return data, algorithm
+
+        start = time.perf_counter()
+        c_data = compress(data, algorithm)
+        ratio = self._update(algorithm, data, c_data, time.perf_counter() - start)
+        if ratio < self.min_ratio:
+            return data, CompressAlgo.NONE
+        return c_data, algorithm
+
+    def _sample(self, data: bytes):
+        for algorithm in self.algorithms:
+            start = time.perf_counter()
+            c_data = compress(data, algorithm)
+            self._update(algorithm, data, c_data, time.perf_counter() - start)
+
+    def _update(
+        self, algorithm: CompressAlgo, data: bytes, c_data: bytes, elapsed: float
+    ) -> float:
+        ratio = len(data) / max(len(c_data), 1)
+        throughput = len(data) / max(elapsed, 1e-9)
+        if algorithm in self._stats:
+            stats = self._stats[algorithm]
+            stats[0] = self.decay * stats[0] + (1 - self.decay) * ratio
+            stats[1] = self.decay * stats[1] + (1 - self.decay) * throughput
+        else:
+            self._stats[algorithm] = [ratio, throughput]
+        self.algorithm = self._choose()
+        return ratio
+
+    def _choose(self) -> CompressAlgo:
+        # the estimated time per byte, compared to sending the data uncompressed
+        best, best_cost = CompressAlgo.NONE, 1 / LINK_BANDWIDTH
+        for algorithm, (ratio, throughput) in self._stats.items():
+            if ratio < self.min_ratio:
+                continue
+            cost = 1 / throughput + 1 / (ratio * LINK_BANDWIDTH)
+            if cost < best_cost:
+                best, best_cost = algorithm, cost
+        return best
+
+
+def get_adaptive_compressor(address: str, min_ratio: float) -> 'AdaptiveCompressor':
+    """Get the adaptive compressor of the link to a target, it is created on the first call and reused by all later calls.
+
+    :param address: the address of the target the messages are sent to
+    :param min_ratio: the minimum compression ratio for a compressed message to be sent
+    :return: the adaptive compressor
+    """
+    key = (address, min_ratio)
+    if key not in _adaptive_compressors:
+        _adaptive_compressors[key] = AdaptiveCompressor(min_ratio)
+    return _adaptive_compressors[key]
@@ -0,0 +1,78 @@
+"""The dense buffers that are sent as separate message frames.
+
+The frames of a received request are not copied into the ``buffer`` of its dense ndarrays. They are registered
+here, and the ndarrays refer to them by ``buffer_frame``, so :attr:`DenseNdArray.value` reads them as read-only
+arrays without copying. The frames are released when the request proto they belong to is garbage collected, a
+Document copied or serialized out of the request gets its own copy of the buffers before.
+"""
+import itertools
+import weakref
+from typing import Dict, List, Sequence, Union
+
+from ....proto import jina_pb2
+
+__all__ = ['register_frames', 'get_buffer', 'materialize_frames']
+
+_frames = {}  # type: Dict[int, Union[bytes, memoryview]]
+_keys = itertools.count()
+
+
+def register_frames(
+    owner: 'jina_pb2.RequestProto', frames: Sequence[Union[bytes, memoryview]]
+) -> List[int]:
+    """Register the frames the dense ndarrays of ``owner`` refer to.
+
+    :param owner: the proto that owns the frames, they are released when it is garbage collected
+    :param frames: the frames
+    :return: the keys of the frames, to be set as ``buffer_frame`` of the dense ndarrays
+    """
+    keys = [next(_keys) % 0xFFFFFFFF + 1 for _ in frames]
+    _frames.update(zip(keys, frames))
+    weakref.finalize(owner, _release, keys)
+    return keys
+
+
+def _release(keys: List[int]):
+    for k in keys:
+        _frames.pop(k, None)
+
+
+def get_buffer(proto: 'jina_pb2.DenseNdArrayProto') -> Union[bytes, memoryview]:
+    """Get the buffer of a dense ndarray, from the frame it refers to if any.
+
+    :param proto: the dense ndarray proto
+    :return: the buffer
+    """
+    if proto.buffer_frame:
+        try:
+            return _frames[proto.buffer_frame]
+        except KeyError:
+            raise ValueError(
+                f'the frame {proto.buffer_frame} of the ndarray is released, '
+                f'as the request it is received with is garbage collected'
+            )
+    return proto.buffer
+
+
+def materialize_frames(doc: 'jina_pb2.DocumentProto'):
+    """Copy the frames the dense ndarrays of a Document, its chunks and its matches refer to into their ``buffer``.
+
+    :param doc: the Document proto
+    """
+    if not _frames:
+        return
+    stack = [doc]
+    while stack:
+        d = stack.pop()
+        for nd in (d.blob, d.embedding):
+            if nd.WhichOneof('content') == 'dense' and nd.dense.buffer_frame:
+                _materialize(nd.dense)
+        if d.chunks:
+            stack.extend(d.chunks)
+        if d.matches:
+            stack.extend(d.matches)
+
+
+def _materialize(proto: 'jina_pb2.DenseNdArrayProto'):
+    proto.buffer = bytes(get_buffer(proto))
+    proto.ClearField('buffer_frame')
@@ -1,12 +1,13 @@
 import os
-from typing import Optional
+from typing import Optional, Sequence
 
 import numpy as np
 
 from . import BaseDenseNdArray
+from .frames import get_buffer
 from ....proto import jina_pb2
 
-__all__ = ['BaseDenseNdArray']
+__all__ = ['BaseDenseNdArray', 'stack_dense_protos']
 
 QUANTIZE = os.environ.get('JINA_ARRAY_QUANT')
 
@@ -53,13 +54,19 @@ class DenseNdArray(BaseDenseNdArray):
         :return: ndarray value
         """
         blob = self._pb_body
-        if blob.buffer:
-            x = np.frombuffer(blob.buffer, dtype=blob.dtype)
+        buffer = get_buffer(blob)
+        if buffer:
+            x = np.frombuffer(buffer, dtype=blob.dtype)
 
             if blob.quantization == jina_pb2.DenseNdArrayProto.FP16:
                 x = x.astype(blob.original_dtype)
             elif blob.quantization == jina_pb2.DenseNdArrayProto.UINT8:
                 x = x.astype(blob.original_dtype) * blob.scale + blob.min_val
+            elif blob.quantization == jina_pb2.DenseNdArrayProto.UINT8_SHARED:
+                raise ValueError(
+                    'the ndarray is quantized with a per-dimension scale and offset that are stored in the request, '
+                    'read it via `Request.docs` to dequantize it'
+                )
 
             return x.reshape(blob.shape)
         elif len(blob.shape) > 0:
@@ -85,12 +92,46 @@ class DenseNdArray(BaseDenseNdArray):
             blob.quantization = jina_pb2.DenseNdArrayProto.UINT8
             blob.max_val, blob.min_val = x.max(), x.min()
             blob.original_dtype = x.dtype.name
-            blob.scale = (blob.max_val - blob.min_val) / 256
-            x = ((x - blob.min_val) / blob.scale).astype(np.uint8)
+            blob.scale = (blob.max_val - blob.min_val) / 255 or 1
+            x = np.clip(np.rint((x - blob.min_val) / blob.scale), 0, 255).astype(
+                np.uint8
+            )
         else:
             blob.quantization = jina_pb2.DenseNdArrayProto.NONE
 
         blob.buffer = x.tobytes()
+        blob.ClearField('buffer_frame')
         blob.ClearField('shape')
         blob.shape.extend(list(x.shape))
         blob.dtype = x.dtype.str
+
+
+def stack_dense_protos(
+    protos: Sequence['jina_pb2.DenseNdArrayProto'],
+) -> 'np.ndarray':
+    """Stack the values of many dense ndarray protos as rows of a single ndarray in one vectorized step.
+
+    All protos must have the same shape, dtype and quantization mode, as given by the first one.
+
+    :param protos: the dense ndarray protos
+    :return: the stacked ndarray, dequantized if the protos are quantized
+    """
+    first = protos[0]
+    x = np.frombuffer(
+        b''.join(get_buffer(p) for p in protos), dtype=first.dtype
+    ).reshape((len(protos), *first.shape))
+    if first.quantization == jina_pb2.DenseNdArrayProto.FP16:
+        x = x.astype(first.original_dtype)
+    elif first.quantization == jina_pb2.DenseNdArrayProto.UINT8:
+        row_shape = (len(protos),) + (1,) * (x.ndim - 1)
+        scale = np.array([p.scale for p in protos]).reshape(row_shape)
+        min_val = np.array([p.min_val for p in protos]).reshape(row_shape)
+        x = (x.astype(first.original_dtype) * scale + min_val).astype(
+            first.original_dtype
+        )
+    elif first.quantization == jina_pb2.DenseNdArrayProto.UINT8_SHARED:
+        raise ValueError(
+            'the ndarrays are quantized with a per-dimension scale and offset that are stored in the request, '
+            'read them via `Request.docs` to dequantize them'
+        )
+    return x
@@ -1,9 +1,20 @@
-from typing import Union, Optional, TypeVar, Dict
+import itertools
+from contextlib import contextmanager
+from typing import Union, Optional, TypeVar, Dict, List, Tuple
 
 from google.protobuf import json_format
 
-from .mixin import DocsPropertyMixin, GroundtruthPropertyMixin
+from .mixin import (
+    DocsPropertyMixin,
+    GroundtruthPropertyMixin,
+    REQUEST_QUANTIZE,
+    _dequantize_body,
+    _iter_dense_protos,
+    _quantize_body,
+    _restore_body,
+)
 from ..mixin import ProtoTypeMixin
+from ..ndarray.dense.frames import get_buffer, materialize_frames, register_frames
 from ...enums import CompressAlgo, RequestType
 from ...excepts import BadRequestType
 from ...helper import random_identity, typename
@@ -23,6 +34,8 @@ _trigger_req_fields = set(
     jina_pb2.RequestProto.DESCRIPTOR.fields_by_name.keys()
 ).difference(_body_type)
 _trigger_fields = _trigger_req_fields.union(_trigger_body_fields)
+# the fields that can be read from a serialized request without parsing its Documents
+_lazy_fields = {'request_id'}
 
 __all__ = ['Request', 'Response']
 
@@ -58,6 +71,10 @@ class Request(ProtoTypeMixin, DocsPropertyMixin, GroundtruthPropertyMixin):
         copy: bool = False,
     ):
         self._buffer = None
+        self._lazy_pb = None
+        # the decompressed buffer read by `_lazy_proto`, so `proto` does not decompress it again
+        self._decompressed_buffer = None  # type: Optional[bytes]
+        self._tensor_frames = []  # type: List[bytes]
         self._pb_body = jina_pb2.RequestProto()  # type: 'jina_pb2.RequestProto'
         self._compression_algorithm = compression_algorithm
         try:
@@ -88,9 +105,32 @@ class Request(ProtoTypeMixin, DocsPropertyMixin, GroundtruthPropertyMixin):
         # https://docs.python.org/3/reference/datamodel.html#object.__getattr__
         if name in _trigger_body_fields:
             return getattr(self.body, name)
+        elif name in _lazy_fields:
+            return getattr(self._lazy_proto, name)
         else:
             return getattr(self.proto, name)
 
+    @property
+    def _lazy_proto(
+        self,
+    ) -> Union['jina_pb2.LazyRequestProto', 'jina_pb2.RequestProto']:
+        """Get the request for reading its meta info, i.e. without parsing the Documents if it is not decompressed yet.
+
+        Changes to the returned proto are lost if the request is not decompressed, so it must only be read.
+
+        :return: a :class:`jina_pb2.LazyRequestProto` if the request is not decompressed, otherwise the request proto
+        """
+        if self.is_decompressed:
+            return self._pb_body
+        if self._lazy_pb is None:
+            r = jina_pb2.LazyRequestProto()
+            self._decompressed_buffer = self._decompress(
+                self._buffer, self._compression_algorithm
+            )
+            r.ParseFromString(self._decompressed_buffer)
+            self._lazy_pb = r
+        return self._lazy_pb
+
     @property
     def is_decompressed(self):
         """Return a boolean indicating if the proto is decompressed
@@ -104,6 +144,9 @@ class Request(ProtoTypeMixin, DocsPropertyMixin, GroundtruthPropertyMixin):
         instance = cls(compression_algorithm=req._compression_algorithm)
         instance._pb_body = req._pb_body
         instance._buffer = req._buffer
+        instance._lazy_pb = req._lazy_pb
+        instance._decompressed_buffer = req._decompressed_buffer
+        instance._tensor_frames = req._tensor_frames
         return instance
 
     @property
@@ -120,7 +163,7 @@ class Request(ProtoTypeMixin, DocsPropertyMixin, GroundtruthPropertyMixin):
 
     @property
     def _request_type(self) -> str:
-        return self.proto.WhichOneof('body')
+        return self._lazy_proto.WhichOneof('body')
 
     @property
     def request_type(self) -> Optional[str]:
@@ -129,8 +172,11 @@ class Request(ProtoTypeMixin, DocsPropertyMixin, GroundtruthPropertyMixin):
 
         :return: request type
         """
-        if self._request_type:
-            return self.body.__class__.__name__
+        request_type = self._request_type
+        if request_type:
+            return jina_pb2.RequestProto.DESCRIPTOR.fields_by_name[
+                request_type
+            ].message_type.name
 
     def as_typed_request(self, request_type: str):
         """
@@ -170,9 +216,9 @@ class Request(ProtoTypeMixin, DocsPropertyMixin, GroundtruthPropertyMixin):
 
             data = lzma.decompress(data)
         elif algorithm == CompressAlgo.ZLIB:
-            import zlib
+            from ..message.compression import zlib_decompress
 
-            data = zlib.decompress(data)
+            data = zlib_decompress(data)
         elif algorithm == CompressAlgo.GZIP:
             import gzip
 
@@ -193,13 +239,23 @@ class Request(ProtoTypeMixin, DocsPropertyMixin, GroundtruthPropertyMixin):
             # if not then build one from buffer
 
             r = jina_pb2.RequestProto()
-            _buffer = self._decompress(
-                self._buffer,
-                self._compression_algorithm,
-            )
+            if self._decompressed_buffer is not None:
+                _buffer = self._decompressed_buffer
+            else:
+                _buffer = self._decompress(
+                    self._buffer,
+                    self._compression_algorithm,
+                )
             r.ParseFromString(_buffer)
+            if self._tensor_frames:
+                self._attach_tensor_frames(r)
+            if r.WhichOneof('body') == 'data':
+                # quantized embeddings never leave the request they are received with
+                _dequantize_body(r.data)
             self._pb_body = r
             self._buffer = None
+            self._lazy_pb = None
+            self._decompressed_buffer = None
             # # Though I can modify back the envelope, not sure if it is a good design:
             # # My intuition is: if the content is changed dramatically, e.g. from index to control request,
             # # then whatever writes on the envelope should be dropped
@@ -215,12 +271,91 @@ class Request(ProtoTypeMixin, DocsPropertyMixin, GroundtruthPropertyMixin):
 
         :return: serialized request
         """
-        if self.is_decompressed:
-            return self.proto.SerializePartialToString()
+        if self.is_decompressed or self._tensor_frames:
+            with self._prepare_for_send():
+                return self.proto.SerializePartialToString()
         else:
             # no touch, skip serialization, return original
             return self._buffer
 
+    def _attach_tensor_frames(self, r: 'jina_pb2.RequestProto'):
+        # the frames are not copied into the buffers, the dense ndarrays refer to them until they are serialized
+        if r.WhichOneof('body') == 'data':
+            keys = register_frames(r, self._tensor_frames)
+            for p in _iter_dense_protos(r.data):
+                if p.buffer_frame:
+                    p.buffer_frame = keys[p.buffer_frame - 1]
+        self._tensor_frames = []
+
+    def _materialize_tensor_frames(self):
+        if self._request_type == 'data':
+            body = self.body
+            for d in itertools.chain(body.docs, body.groundtruths):
+                materialize_frames(d)
+
+    def _serialize_with_tensor_frames(
+        self, min_bytes: Optional[int]
+    ) -> Tuple[bytes, List[bytes]]:
+        """Serialize the request, the dense buffers of at least ``min_bytes`` are taken out as separate frames.
+
+        The frames can be sent without copying, and the buffers are not copied again into the serialized
+        request. A request that is not touched keeps the frames it is received with, the buffers that already
+        refer to a frame are sent as frames again whatever their size.
+
+        :param min_bytes: the minimum size of a buffer to be taken out, None means no buffer is taken out
+        :return: the serialized request and the list of frames its dense buffers refer to
+        """
+        if not self.is_decompressed:
+            return self._buffer, self._tensor_frames
+        if min_bytes is None or self._request_type != 'data':
+            return self.SerializeToString(), []
+
+        protos, frames = [], []
+        with self._quantize_for_send():
+            for p in _iter_dense_protos(self.body):
+                if p.buffer_frame:
+                    frames.append(get_buffer(p))
+                elif p.ByteSize() >= min_bytes:
+                    frames.append(p.buffer)
+                    p.ClearField('buffer')
+                else:
+                    continue
+                p.buffer_frame = len(frames)
+                protos.append(p)
+            data = self.proto.SerializePartialToString()
+
+            # the request may still be used after it is sent, it refers to the frames instead of copying them back
+            for p, k in zip(protos, register_frames(self._pb_body, frames)):
+                p.buffer_frame = k
+        return data, frames
+
+    @contextmanager
+    def _prepare_for_send(self):
+        """Copy the frames into the dense buffers and quantize the embeddings while the request is serialized."""
+        self._materialize_tensor_frames()
+        with self._quantize_for_send():
+            yield
+
+    @contextmanager
+    def _quantize_for_send(self):
+        """Quantize the embeddings while the request is serialized if ``JINA_REQUEST_QUANT=uint8`` is set.
+
+        The original embeddings are put back afterwards, so the Documents of the request never hold embeddings
+        that can not be read without the scale and offset of the request.
+        """
+        if (
+            REQUEST_QUANTIZE == 'uint8'
+            and self.is_decompressed
+            and self._request_type == 'data'
+        ):
+            originals = _quantize_body(self.body)
+            try:
+                yield
+            finally:
+                _restore_body(self.body, originals)
+        else:
+            yield
+
     def as_response(self):
         """
         Return a weak reference of this object but as :class:`Response` object. It gives a more
@@ -236,8 +371,7 @@ class Request(ProtoTypeMixin, DocsPropertyMixin, GroundtruthPropertyMixin):
 
         :return: a Python dict view of the tags.
         """
-        # if u get this u need to have it decompressed
-        return StructView(self.proto.parameters).dict()
+        return StructView(self._lazy_proto.parameters).dict()
 
     @parameters.setter
     def parameters(self, value: Dict):
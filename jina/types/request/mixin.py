@@ -1,8 +1,66 @@
+import os
 from abc import abstractmethod
+from typing import Iterator, List, Tuple, Union
+
+import numpy as np
 
 from ..arrays import DocumentArray
+from ..ndarray.dense.frames import get_buffer
+from ..ndarray.dense.numpy import stack_dense_protos
 from ...proto import jina_pb2
 
+REQUEST_QUANTIZE = os.environ.get('JINA_REQUEST_QUANT')
+
+# the Documents whose embeddings are quantized together: the root Documents, their chunks and their matches
+_quantize_traversal_paths = ('r', 'c', 'm')
+
+
+def _get_dense_embeddings(
+    docs: 'DocumentArray', quantization: int
+) -> List['jina_pb2.DenseNdArrayProto']:
+    return [
+        d.embedding.dense
+        for d in docs.traverse_flat(_quantize_traversal_paths)._pb_body
+        if d.embedding.WhichOneof('content') == 'dense'
+        and (d.embedding.dense.buffer_frame or d.embedding.dense.buffer)
+        and d.embedding.dense.quantization == quantization
+    ]
+
+
+def _iter_dense_protos(
+    body: 'jina_pb2.RequestProto.DataRequestProto',
+) -> Iterator['jina_pb2.DenseNdArrayProto']:
+    """Iterate over the dense blobs and embeddings of all Documents in a data request, including chunks and matches.
+
+    :param body: the data request body
+    :yield: the dense ndarray protos
+    """
+    stack = list(body.docs) + list(body.groundtruths)
+    while stack:
+        d = stack.pop()
+        for nd in (d.blob, d.embedding):
+            if nd.WhichOneof('content') == 'dense':
+                yield nd.dense
+        if d.chunks:
+            stack.extend(d.chunks)
+        if d.matches:
+            stack.extend(d.matches)
+
+
+def _write_rows(protos: List['jina_pb2.DenseNdArrayProto'], x: 'np.ndarray'):
+    dtype = x.dtype.str
+    for p, row in zip(protos, x):
+        p.buffer = row.tobytes()
+        p.ClearField('buffer_frame')
+        p.dtype = dtype
+
+
+def _set_dense_value(proto: 'jina_pb2.DenseNdArrayProto', x: 'np.ndarray'):
+    proto.buffer = x.tobytes()
+    proto.ClearField('shape')
+    proto.shape.extend(x.shape)
+    proto.dtype = x.dtype.str
+
 
 class DocsPropertyMixin:
     """Mixin class of docs property."""
@@ -19,9 +77,122 @@ class DocsPropertyMixin:
     def docs(self) -> 'DocumentArray':
         """Get the :class: `DocumentArray` with sequence `body.docs` as content.
 
+        If the embeddings are quantized via :meth:`quantize_embeddings`, they are dequantized first.
+
         .. # noqa: DAR201"""
         self.is_used = True
-        return DocumentArray(self.body.docs)
+        body = self.body
+        if (
+            isinstance(body, jina_pb2.RequestProto.DataRequestProto)
+            and body.embedding_scale.buffer
+        ):
+            self.dequantize_embeddings()
+        return DocumentArray(body.docs)
+
+    def quantize_embeddings(self):
+        """Quantize the float embeddings of the Documents of this request to `uint8` in one vectorized step.
+
+        Unlike the per-array quantization set by ``JINA_ARRAY_QUANT``, the scale and offset are computed per
+        dimension over all embeddings and stored only once in the request, so the quantization error is lower
+        and every embedding costs exactly one byte per dimension. The root Documents, their chunks and their
+        matches are quantized, only the embeddings with the same shape and dtype as the first one are considered.
+
+        The embeddings are dequantized when the Documents are read via :attr:`docs`, and when a quantized
+        request is received. Setting the environment variable ``JINA_REQUEST_QUANT=uint8`` quantizes every
+        data request while it is serialized, the request itself keeps its embeddings.
+        """
+        _quantize_body(self.body)
+
+    def dequantize_embeddings(self):
+        """Dequantize the embeddings quantized by :meth:`quantize_embeddings` in one vectorized step."""
+        _dequantize_body(self.body)
+
+
+def _quantize_body(
+    body: 'jina_pb2.RequestProto.DataRequestProto',
+) -> List[Tuple['jina_pb2.DenseNdArrayProto', Union[bytes, int], str]]:
+    """Quantize the embeddings of a data request body in place.
+
+    :param body: the data request body
+    :return: the quantized protos with their original buffer or frame and dtype, used by :func:`_restore_body`
+    """
+    if body.embedding_scale.buffer:
+        return []
+
+    docs = DocumentArray(body.docs)
+    protos = _get_dense_embeddings(docs, jina_pb2.DenseNdArrayProto.NONE)
+    if not protos:
+        return []
+    first = protos[0]
+    dtype = np.dtype(first.dtype)
+    if dtype.kind != 'f':
+        return []
+    protos = [
+        p for p in protos if p.dtype == first.dtype and p.shape[:] == first.shape[:]
+    ]
+    originals = [(p, p.buffer_frame or p.buffer, p.dtype) for p in protos]
+
+    x = stack_dense_protos(protos)
+    offset = x.min(axis=0)
+    scale = (x.max(axis=0) - offset) / 255
+    scale[scale == 0] = 1
+    q = np.clip(np.rint((x - offset) / scale), 0, 255).astype(np.uint8)
+
+    _write_rows(protos, q)
+    for p in protos:
+        p.quantization = jina_pb2.DenseNdArrayProto.UINT8_SHARED
+        p.original_dtype = dtype.name
+    _set_dense_value(body.embedding_scale, scale.astype(dtype))
+    _set_dense_value(body.embedding_offset, offset.astype(dtype))
+    return originals
+
+
+def _restore_body(
+    body: 'jina_pb2.RequestProto.DataRequestProto',
+    originals: List[Tuple['jina_pb2.DenseNdArrayProto', Union[bytes, int], str]],
+):
+    """Undo :func:`_quantize_body` without loss by putting back the original buffers.
+
+    :param body: the data request body
+    :param originals: the protos with their original buffer or frame and dtype returned by :func:`_quantize_body`
+    """
+    if not originals:
+        return
+    for p, buffer, dtype in originals:
+        if isinstance(buffer, int):
+            p.buffer_frame = buffer
+            p.ClearField('buffer')
+        else:
+            p.buffer = buffer
+            p.ClearField('buffer_frame')
+        p.dtype = dtype
+        p.quantization = jina_pb2.DenseNdArrayProto.NONE
+        p.ClearField('original_dtype')
+    body.ClearField('embedding_scale')
+    body.ClearField('embedding_offset')
+
+
+def _dequantize_body(body: 'jina_pb2.RequestProto.DataRequestProto'):
+    """Dequantize the embeddings of a data request body quantized by :func:`_quantize_body` in place.
+
+    :param body: the data request body
+    """
+    if not body.embedding_scale.buffer:
+        return
+
+    docs = DocumentArray(body.docs)
+    protos = _get_dense_embeddings(docs, jina_pb2.DenseNdArrayProto.UINT8_SHARED)
+    if protos:
+        scale = stack_dense_protos([body.embedding_scale])[0]
+        offset = stack_dense_protos([body.embedding_offset])[0]
+        q = np.frombuffer(b''.join(get_buffer(p) for p in protos), dtype=np.uint8)
+        x = q.reshape((len(protos), *protos[0].shape)) * scale + offset
+        _write_rows(protos, x.astype(scale.dtype))
+        for p in protos:
+            p.quantization = jina_pb2.DenseNdArrayProto.NONE
+            p.ClearField('original_dtype')
+    body.ClearField('embedding_scale')
+    body.ClearField('embedding_offset')
 
 
 class GroundtruthPropertyMixin:
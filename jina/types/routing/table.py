@@ -1,5 +1,6 @@
 from collections import defaultdict
-from typing import List, Optional, Union
+from hashlib import blake2b
+from typing import Dict, List, Optional, Set, Union
 
 from google.protobuf import json_format
 
@@ -8,6 +9,10 @@ from ...excepts import BadRequestType
 from ...helper import typename
 from ...proto import jina_pb2
 
+_registered_tables = {}  # type: Dict[str, 'jina_pb2.RoutingTableProto']
+# the ids of the tables the Flow registers with every Pod it starts
+_shared_tables = set()  # type: Set[str]
+
 
 class TargetPod(ProtoTypeMixin):
     """
@@ -62,6 +67,14 @@ class TargetPod(ProtoTypeMixin):
         """
         return f'{self.host}:{self.port_out}'
 
+    @property
+    def external(self) -> bool:
+        """Return the `external` field of this TargetPod
+
+        :return: True if the Pod is not started by the Flow
+        """
+        return self.proto.external
+
     @property
     def expected_parts(self) -> int:
         """Return the `expected_parts` field of this TargetPod
@@ -114,9 +127,16 @@ class RoutingTable(ProtoTypeMixin):
         copy: bool = False,
     ) -> None:
         self._pb_body = jina_pb2.RoutingTableProto()
+        self._id = None
+        # the active Pod of a table that shares the proto of a registered table, which is never changed
+        self._active_pod = None
         try:
             if isinstance(graph, RoutingTable):
-                if copy:
+                self._id = graph._id
+                if graph._active_pod is not None:
+                    self._pb_body = graph._pb_body
+                    self._active_pod = graph._active_pod
+                elif copy:
                     self._pb_body.CopyFrom(graph._pb_body)
                 else:
                     self._pb_body = graph._pb_body
@@ -139,6 +159,126 @@ class RoutingTable(ProtoTypeMixin):
                 f'fail to construct a {self.__class__} object from {graph}'
             ) from ex
 
+    @classmethod
+    def from_envelope(cls, envelope: 'jina_pb2.EnvelopeProto') -> 'RoutingTable':
+        """Get the routing table of a message, either from the envelope or from the registered tables.
+
+        A full routing table in the envelope is registered, so that later messages only need to refer to it. A
+        table got from the registered tables shares their proto, only its active Pod is its own.
+
+        :param envelope: the envelope of the message
+        :return: the routing table with the active Pod of the message
+        """
+        ref = envelope.routing_table_ref
+        if not ref.id:
+            return cls(envelope.routing_table)
+
+        if envelope.HasField('routing_table'):
+            cls(envelope.routing_table).register(table_id=ref.id)
+        elif ref.id not in _registered_tables:
+            raise BadRequestType(
+                f'routing table {ref.id} is not registered with this Pea, '
+                f'the sender has to send it in full'
+            )
+        table = cls(_registered_tables[ref.id])
+        table._id = ref.id
+        table._active_pod = ref.active_pod
+        return table
+
+    @staticmethod
+    def is_missing(envelope: 'jina_pb2.EnvelopeProto') -> bool:
+        """Check if a message refers to a routing table that is neither registered nor sent with it.
+
+        :param envelope: the envelope of the message
+        :return: True if the routing table of the message can not be resolved
+        """
+        ref = envelope.routing_table_ref
+        return bool(
+            ref.id
+            and ref.id not in _registered_tables
+            and not envelope.HasField('routing_table')
+        )
+
+    @property
+    def id(self) -> str:
+        """
+        :return: the id of the routing table, it depends only on the Pods and their edges but not on the active Pod
+        """
+        if self._id is None:
+            pods = jina_pb2.RoutingTableProto()
+            pods.pods.MergeFrom(self._pb_body.pods)
+            self._id = blake2b(
+                pods.SerializeToString(deterministic=True), digest_size=8
+            ).hexdigest()
+        return self._id
+
+    @property
+    def proto(self) -> 'jina_pb2.RoutingTableProto':
+        """Return the protobuf object, a table that shares the proto of a registered table gets its own copy first.
+
+        :return: the protobuf object
+        """
+        self._own()
+        return self._pb_body
+
+    def _own(self):
+        if self._active_pod is not None:
+            table = jina_pb2.RoutingTableProto()
+            table.CopyFrom(self._pb_body)
+            table.active_pod = self._active_pod
+            self._pb_body = table
+            self._active_pod = None
+
+    def register(self, shared: bool = False, table_id: Optional[str] = None) -> str:
+        """Register the routing table with this process, so that messages can refer to it via :meth:`add_to_envelope`.
+
+        :param shared: if set, the table is registered with every Pod the Flow starts, as it is given to them by
+            ``--routing-table``
+        :param table_id: the id of the table if it is known already, e.g. as it is sent along
+        :return: the id of the routing table
+        """
+        if table_id is not None:
+            self._id = table_id
+        if self.id not in _registered_tables:
+            table = jina_pb2.RoutingTableProto()
+            table.CopyFrom(self._pb_body)
+            table.ClearField('active_pod')
+            _registered_tables[self.id] = table
+        if shared:
+            _shared_tables.add(self.id)
+        return self.id
+
+    @property
+    def is_registered_with_target(self) -> bool:
+        """
+        :return: True if the Flow registered this table with the active Pod when it started, so it does not need
+            the full table
+        """
+        return self.id in _shared_tables and not self.active_target_pod.external
+
+    def add_to_envelope(
+        self,
+        envelope: 'jina_pb2.EnvelopeProto',
+        compact: bool = False,
+        with_table: bool = True,
+    ) -> None:
+        """Set the routing table of a message.
+
+        :param envelope: the envelope of the message
+        :param compact: if set, the envelope refers to the registered routing table by its id and the active Pod
+        :param with_table: if set, the full routing table is also sent in compact mode, for a receiver that may
+            not know it yet
+        """
+        envelope.ClearField('routing_table')
+        envelope.ClearField('routing_table_ref')
+        if compact:
+            envelope.routing_table_ref.id = self.register()
+            envelope.routing_table_ref.active_pod = self.active_pod
+            if not with_table:
+                return
+        envelope.routing_table.CopyFrom(self._pb_body)
+        envelope.routing_table.active_pod = self.active_pod
+
     def add_edge(self, from_pod: str, to_pod: str, send_as_bind: bool = False) -> None:
         """Adds an edge to the graph.
 
@@ -146,11 +286,19 @@ class RoutingTable(ProtoTypeMixin):
         :param to_pod: Pod to which traffic is send
         :param send_as_bind: True, if the TailPea of the from_pod should send via its ROUTER_BIND socket.
         """
+        self._own()
         self._get_target_pod(from_pod).add_edge(to_pod, send_as_bind)
         self._get_target_pod(to_pod).expected_parts += 1
+        self._id = None
 
     def add_pod(
-        self, pod_name: str, head_host, head_port_in, tail_port_out, head_zmq_identity
+        self,
+        pod_name: str,
+        head_host,
+        head_port_in,
+        tail_port_out,
+        head_zmq_identity,
+        external: bool = False,
     ) -> None:
         """Adds a Pod vertex to the graph.
 
@@ -159,7 +307,9 @@ class RoutingTable(ProtoTypeMixin):
         :param head_port_in: port in of the head of the pod
         :param tail_port_out: port out of the tail of the pod
         :param head_zmq_identity: identity of the head - only relevant for zmq
+        :param external: True, if the Pod is not started by the Flow
         """
+        self._own()
         if pod_name in self.pods:
             raise ValueError(
                 f'Vertex with name {pod_name} already exists. Please check your configuration for unique Pod names.'
@@ -170,6 +320,8 @@ class RoutingTable(ProtoTypeMixin):
         target.port = head_port_in
         target.port_out = tail_port_out
         target.target_identity = head_zmq_identity
+        target.external = external
+        self._id = None
 
     def _get_target_pod(self, pod: str) -> TargetPod:
         return TargetPod(self.pods[pod])
@@ -179,7 +331,9 @@ class RoutingTable(ProtoTypeMixin):
         """
         :return: the active Pod name
         """
-        return self.proto.active_pod
+        if self._active_pod is not None:
+            return self._active_pod
+        return self._pb_body.active_pod
 
     @active_pod.setter
     def active_pod(self, pod_name: str) -> None:
@@ -187,7 +341,10 @@ class RoutingTable(ProtoTypeMixin):
 
         .. # noqa: DAR101
         """
-        self.proto.active_pod = pod_name
+        if self._active_pod is not None:
+            self._active_pod = pod_name
+        else:
+            self._pb_body.active_pod = pod_name
 
     def _get_out_edges(self, pod: str) -> List[str]:
         return self._get_target_pod(pod).out_edges
@@ -204,7 +361,7 @@ class RoutingTable(ProtoTypeMixin):
         """
         :return: all Pod/vertices of the graph.
         """
-        return self.proto.pods
+        return self._pb_body.pods
 
     def get_next_targets(self) -> List['RoutingTable']:
         """
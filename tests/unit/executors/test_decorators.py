@@ -1,6 +1,11 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
 import pytest
 
-from jina.executors.decorators import store_init_kwargs, requests
+from jina import Document, DocumentArray, Executor
+from jina.executors.decorators import memoize, store_init_kwargs, requests
 
 
 def test_store_init_kwargs():
@@ -33,3 +38,81 @@ def test_requests():
         pass
 
     assert hasattr(fn_2, 'fn')
+
+
+def test_requests_lock():
+    running = []
+    max_running = []
+
+    class MyExecutor(Executor):
+        @requests(lock=True)
+        def foo(self, **kwargs):
+            running.append(1)
+            max_running.append(len(running))
+            time.sleep(0.01)
+            running.pop()
+
+    executor = MyExecutor()
+    with ThreadPoolExecutor(4) as pool:
+        list(pool.map(lambda _: executor(req_endpoint='/'), range(8)))
+    assert max(max_running) == 1
+
+
+@pytest.mark.parametrize('returns', [False, True])
+def test_memoize(tmpdir, returns):
+    calls = []
+
+    class MyEncoder(Executor):
+        @requests
+        @memoize(fields=['embedding', 'tags'])
+        def encode(self, docs, parameters, **kwargs):
+            calls.append([d.text for d in docs])
+            if returns:
+                docs = DocumentArray([Document(d, copy=True) for d in docs])
+            for d in docs:
+                d.embedding = np.array([len(d.text) * parameters.get('scale', 1)])
+                d.tags['length'] = len(d.text)
+            if returns:
+                return docs
+
+    def encode(executor, texts, **parameters):
+        docs = DocumentArray([Document(text=t) for t in texts])
+        executor(req_endpoint='/', docs=docs, parameters=parameters)
+        assert [d.tags['length'] for d in docs] == [len(t) for t in texts]
+        return [int(d.embedding[0]) for d in docs]
+
+    executor = MyEncoder(metas={'workspace': str(tmpdir)})
+    assert encode(executor, ['a', 'bb']) == [1, 2]
+    # only the Documents not seen before are passed to the function, the outputs are merged back in order
+    assert encode(executor, ['ccc', 'bb', 'a', 'dddd']) == [3, 2, 1, 4]
+    assert calls == [['a', 'bb'], ['ccc', 'dddd']]
+    # other parameters give other outputs
+    assert encode(executor, ['a'], scale=10) == [10]
+    assert len(calls) == 3
+
+    # the outputs are stored in the workspace
+    del executor
+    executor = MyEncoder(metas={'workspace': str(tmpdir)})
+    assert encode(executor, ['dddd', 'a']) == [4, 1]
+    assert len(calls) == 3
+
+
+def test_memoize_chunks():
+    class MySegmenter(Executor):
+        @requests
+        @memoize(persist=False)
+        def segment(self, docs, **kwargs):
+            for d in docs:
+                d.chunks.append(Document(text=d.text[:2]))
+
+    executor = MySegmenter()
+    docs = DocumentArray([Document(text='hello')])
+    executor(req_endpoint='/', docs=docs)
+    cached = DocumentArray([Document(text='hello'), Document(text='hello')])
+    executor(req_endpoint='/', docs=cached)
+
+    # the chunks from the cache belong to the Documents they are written into
+    chunks = [d.chunks[0] for d in docs] + [d.chunks[0] for d in cached]
+    assert len({c.id for c in chunks}) == 3
+    assert [c.parent_id for c in chunks] == [d.id for d in [*docs, *cached]]
+    assert all(c.text == 'he' for c in chunks)
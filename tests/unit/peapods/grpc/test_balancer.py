@@ -0,0 +1,104 @@
+import asyncio
+import socket
+import threading
+from unittest import mock
+
+import grpc
+import pytest
+
+from jina.peapods.grpc.balancer import ReplicaBalancer
+
+REPLICAS = ['10.0.0.1:8081', '10.0.0.2:8081', '10.0.0.3:8081']
+ADDR_INFOS = [
+    (socket.AF_INET, socket.SOCK_STREAM, 6, '', (a.split(':')[0], 8081))
+    for a in REPLICAS
+]
+
+
+@pytest.fixture
+def balancer(mocker):
+    mocker.patch('socket.getaddrinfo', return_value=ADDR_INFOS)
+    return ReplicaBalancer(eject_ratio=3.0, eject_seconds=60)
+
+
+def _record(balancer, address, latency):
+    with mock.patch('time.perf_counter', side_effect=[0.0, latency]):
+        with balancer.track(address):
+            pass
+
+
+@pytest.mark.asyncio
+async def test_balancer_single_address():
+    balancer = ReplicaBalancer()
+    for target in ['0.0.0.0:8081', 'not-a-host.invalid:8081']:
+        await balancer.refresh(target)
+        assert balancer.choose(target) == target
+
+
+@pytest.mark.asyncio
+async def test_balancer_resolves_in_background(mocker):
+    resolving = threading.Event()
+
+    def _getaddrinfo(*args, **kwargs):
+        resolving.wait(5)
+        return ADDR_INFOS
+
+    mocker.patch('socket.getaddrinfo', side_effect=_getaddrinfo)
+    balancer = ReplicaBalancer()
+    # the target is used as it is while it is resolved, without blocking the event loop
+    assert balancer.choose('my-pod:8081') == 'my-pod:8081'
+    assert balancer.choose('my-pod:8081') == 'my-pod:8081'
+    resolving.set()
+    await asyncio.gather(*balancer._refresh_tasks.values())
+    assert balancer.get_replicas('my-pod:8081') == REPLICAS
+    assert socket.getaddrinfo.call_count == 1
+    balancer.close()
+
+
+@pytest.mark.asyncio
+async def test_balancer_prefers_idle_replica(balancer):
+    await balancer.refresh('my-pod:8081')
+    assert balancer.get_replicas('my-pod:8081') == REPLICAS
+    with balancer.track(REPLICAS[0]), balancer.track(REPLICAS[0]):
+        with balancer.track(REPLICAS[1]):
+            chosen = {balancer.choose('my-pod:8081') for _ in range(50)}
+    # of any two replicas, the one with fewer outstanding calls is chosen
+    assert REPLICAS[0] not in chosen
+    assert REPLICAS[2] in chosen
+
+
+@pytest.mark.asyncio
+async def test_balancer_prefers_short_queue(balancer):
+    await balancer.refresh('my-pod:8081')
+    balancer.report_queue_depth(REPLICAS[0], 5)
+    balancer.report_queue_depth(REPLICAS[1], 2)
+    chosen = {balancer.choose('my-pod:8081') for _ in range(50)}
+    # the replicas acknowledge right away, the queue depth they report tells their load
+    assert REPLICAS[0] not in chosen
+    assert REPLICAS[2] in chosen
+
+
+@pytest.mark.asyncio
+async def test_balancer_ejects_slow_replica(balancer):
+    await balancer.refresh('my-pod:8081')
+    _record(balancer, REPLICAS[0], 0.01)
+    _record(balancer, REPLICAS[1], 0.01)
+    _record(balancer, REPLICAS[2], 1.0)
+    chosen = {balancer.choose('my-pod:8081') for _ in range(50)}
+    assert chosen == {REPLICAS[0], REPLICAS[1]}
+
+
+@pytest.mark.asyncio
+async def test_balancer_ejects_failed_replica(balancer):
+    await balancer.refresh('my-pod:8081')
+    for address in REPLICAS[:2]:
+        with pytest.raises(grpc.RpcError):
+            with balancer.track(address):
+                raise grpc.RpcError()
+    assert {balancer.choose('my-pod:8081') for _ in range(10)} == {REPLICAS[2]}
+
+    # the last replica is never ejected
+    with pytest.raises(grpc.RpcError):
+        with balancer.track(REPLICAS[2]):
+            raise grpc.RpcError()
+    assert {balancer.choose('my-pod:8081') for _ in range(10)} == {REPLICAS[2]}
@@ -2,13 +2,15 @@ import asyncio
 import time
 
 import pytest
-from google.protobuf import json_format
+from google.protobuf import json_format, struct_pb2
 from grpc import RpcError
 
 from jina.parsers import set_pea_parser
-from jina.peapods.grpc import Grpclet
+from jina.peapods.grpc import Grpclet, _ROUTING_TABLE_MISS
+from jina.peapods.grpc.stream import MessageStream
 from jina.proto import jina_pb2
 from jina.types.message.common import ControlMessage
+from jina.types.routing.table import RoutingTable
 
 
 @pytest.mark.slow
@@ -94,6 +96,68 @@ async def test_send_static_ctrl_msg(mocker):
     await grpclet.close(None)
 
 
+@pytest.mark.slow
+@pytest.mark.asyncio
+@pytest.mark.timeout(5)
+async def test_send_channel_pool(mocker):
+    receive_cb = mocker.Mock()
+
+    async def mock_wrapper(msg):
+        receive_cb()
+
+    args = set_pea_parser().parse_args(['--grpc-channels', '3'])
+    grpclet = Grpclet(args=args, message_callback=mock_wrapper)
+    asyncio.get_event_loop().create_task(grpclet.start())
+
+    for _ in range(6):
+        await grpclet.send_message(_create_msg(args))
+    await asyncio.sleep(0.5)
+    assert receive_cb.call_count == 6
+
+    streams, _ = grpclet._streams[f'0.0.0.0:{args.port_in}']
+    assert len(streams) == 3
+    # the messages are spread round-robin over the channels
+    assert all(stream._call is not None for stream in streams)
+
+    await grpclet.close(None)
+
+
+@pytest.mark.asyncio
+@pytest.mark.timeout(5)
+async def test_send_stream_unavailable():
+    args = set_pea_parser().parse_args([])
+    stream = MessageStream(Grpclet._create_grpc_stub(f'0.0.0.0:{args.port_in}'))
+    with pytest.raises(RpcError):
+        await stream.send(_create_msg(args))
+    stream.close()
+
+
+def test_ctrl_channel_reused(mocker):
+    mocker.patch.object(Grpclet, '_ctrl_stubs', {})
+    create_channel = mocker.patch.object(Grpclet, '_create_grpc_channel')
+    channel = create_channel.return_value
+    stub = mocker.patch('jina.peapods.grpc.jina_pb2_grpc.JinaDataRequestRPCStub')
+    Grpclet.send_ctrl_msg('0.0.0.0:12345', 'STATUS')
+    Grpclet.send_ctrl_msg('0.0.0.0:12345', 'STATUS')
+    create_channel.assert_called_once()
+    stub.assert_called_once_with(channel)
+    assert stub.return_value.Call.call_count == 2
+
+    # the channel is dropped when the call fails, and the next control message opens a new one
+    stub.return_value.Call.side_effect = RpcError()
+    with pytest.raises(RpcError):
+        Grpclet.send_ctrl_msg('0.0.0.0:12345', 'STATUS')
+    channel.close.assert_called_once()
+    stub.return_value.Call.side_effect = None
+    Grpclet.send_ctrl_msg('0.0.0.0:12345', 'STATUS')
+    assert create_channel.call_count == 2
+
+    Grpclet.send_ctrl_msg('0.0.0.0:12346', 'STATUS')
+    Grpclet.close_ctrl_channels()
+    assert channel.close.call_count == 3
+    assert not Grpclet._ctrl_stubs
+
+
 def _create_msg(args):
     msg = ControlMessage('STATUS')
     routing_pb = jina_pb2.RoutingTableProto()
@@ -117,3 +181,59 @@ def _create_msg(args):
     json_format.ParseDict(routing_table, routing_pb)
     msg.envelope.routing_table.CopyFrom(routing_pb)
     return msg
+
+
+@pytest.mark.asyncio
+async def test_routing_table_miss_returned():
+    args = set_pea_parser().parse_args([])
+    grpclet = Grpclet(args=args, message_callback=None)
+    msg = _create_msg(args)
+    msg.envelope.ClearField('routing_table')
+    msg.envelope.routing_table_ref.id = 'not-registered'
+    ack = await grpclet.Call(msg)
+    assert ack.string_value == _ROUTING_TABLE_MISS
+    assert grpclet.msg_recv == 0
+
+
+@pytest.mark.asyncio
+async def test_ack_reports_queue_depth():
+    args = set_pea_parser().parse_args([])
+    processing = asyncio.Event()
+
+    async def callback(msg):
+        await processing.wait()
+
+    grpclet = Grpclet(args=args, message_callback=callback)
+    assert (await grpclet.Call(_create_msg(args))).number_value == 1
+    assert (await grpclet.Call(_create_msg(args))).number_value == 2
+    processing.set()
+    await asyncio.gather(*grpclet._pending_tasks)
+    assert (await grpclet.Call(_create_msg(args))).number_value == 1
+
+
+@pytest.mark.asyncio
+async def test_routing_table_sent_again_on_miss(mocker):
+    args = set_pea_parser().parse_args(['--compact-routing-table'])
+    grpclet = Grpclet(args=args, message_callback=None)
+    acks = [struct_pb2.Value(string_value=_ROUTING_TABLE_MISS), struct_pb2.Value()]
+    sent = []
+
+    async def send(stream, msg):
+        sent.append(msg)
+        return acks.pop(0)
+
+    mocker.patch.object(MessageStream, 'send', send)
+    msg = _create_msg(args)
+    table = RoutingTable(msg.envelope.routing_table)
+    # the sender believes the receiver knows the table, e.g. it is restarted since
+    receiver = (f'0.0.0.0:{args.port_in}', table.id)
+    grpclet._routing_table_receivers.add(receiver)
+
+    await grpclet.send_message(msg)
+    await asyncio.gather(*grpclet._pending_tasks)
+
+    assert len(sent) == 2
+    assert not sent[0].envelope.HasField('routing_table')
+    assert sent[1].envelope.HasField('routing_table')
+    assert sent[1].envelope.routing_table_ref.id == table.id
+    assert receiver in grpclet._routing_table_receivers
@@ -1,12 +1,18 @@
 import asyncio
+import time
 from asyncio import Future
 
 import pytest
 
 from jina.helper import ArgNamespace, random_identity
 from jina.parsers import set_gateway_parser
-from jina.peapods.runtimes.gateway.prefetch import PrefetchCaller
+from jina.peapods.runtimes.gateway.cache import ResponseCache
+from jina.peapods.runtimes.gateway.prefetch import (
+    AdaptivePrefetchWindow,
+    PrefetchCaller,
+)
 from jina.proto import jina_pb2
+from jina.types.request import Request
 
 
 def _generate_request():
@@ -47,3 +53,149 @@ async def test_concurrent_requests():
         assert r.proto == request
 
     await servicer.close()
+
+
+class DelayedZmqletMock:
+    """Respond to every request after a delay, which grows with the number of requests in flight."""
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.inflight = 0
+        self.responses = asyncio.Queue()
+
+    async def recv_message(self, **kwargs):
+        return await self.responses.get()
+
+    async def send_message(self, message):
+        self.inflight += 1
+        await asyncio.sleep(0.01 * max(self.inflight / self.capacity, 1))
+        self.inflight -= 1
+        await self.responses.put(message.response)
+
+
+@pytest.mark.asyncio
+async def test_adaptive_prefetch():
+    args = ArgNamespace.kwargs2namespace(
+        {'prefetch': 2, 'adaptive_prefetch': True}, set_gateway_parser()
+    )
+    servicer = PrefetchCaller(args, DelayedZmqletMock(capacity=8))
+
+    requests = [_generate_request() for _ in range(200)]
+    responses = [r.proto async for r in servicer.send(iter(requests))]
+
+    assert sorted(r.request_id for r in responses) == sorted(
+        r.request_id for r in requests
+    )
+    # the window grows from `prefetch` as long as the latency stays low, but not far beyond the capacity
+    assert 2 < servicer.window.size <= 24
+    assert servicer.window.stats['latency_ms'] > 0
+
+    await servicer.close()
+
+
+def test_adaptive_prefetch_window():
+    window = AdaptivePrefetchWindow(4, max_window=10)
+    for _ in range(100):
+        window.update(0.01)
+    assert window.size == 10
+
+    window._last_decrease = 0
+    window.update(1.0)
+    assert window.size == 7
+
+
+def _generate_search_request(text):
+    req = _generate_request()
+    req.header.exec_endpoint = '/search'
+    req.data.docs[0].text = text
+    return req
+
+
+@pytest.mark.asyncio
+async def test_response_cache():
+    args = ArgNamespace.kwargs2namespace(
+        {'response_cache': {'/search': {'ttl': 60}}}, set_gateway_parser()
+    )
+    zmqlet = DelayedZmqletMock(capacity=8)
+    sent = []
+    send_message = zmqlet.send_message
+
+    async def count_send(message):
+        sent.append(message)
+        await send_message(message)
+
+    zmqlet.send_message = count_send
+    servicer = PrefetchCaller(args, zmqlet)
+
+    for text in ['a', 'a', 'b', 'a']:
+        request = _generate_search_request(text)
+        responses = [r.proto async for r in servicer.send(iter([request]))]
+        assert responses[0].request_id == request.request_id
+        assert responses[0].data.docs[0].id == request.data.docs[0].id
+
+    # the repeated requests are answered from the cache
+    assert len(sent) == 2
+    assert servicer.cache.stats['hits'] == 2
+    assert servicer.cache.stats['misses'] == 2
+    assert servicer.cache.stats['entries'] == 2
+
+    # requests to other endpoints are not cached
+    for _ in range(2):
+        [r async for r in servicer.send(iter([_generate_request()]))]
+    assert len(sent) == 4
+
+    await servicer.close()
+
+
+def test_response_cache_eviction(mocker):
+    cache = ResponseCache({'/search': {'ttl': 10}}, max_bytes=100)
+    requests = [
+        Request(_generate_search_request(text * 40)) for text in ['a', 'b', 'c']
+    ]
+    keys = [cache.get_key(r) for r in requests]
+    assert len(set(keys)) == 3
+
+    cache.put(keys[0], requests[0], requests[0])
+    cache.put(keys[1], requests[1], requests[1])
+    # the least recently used response is evicted to stay within the bytes
+    assert cache.get(keys[0], requests[0]) is None
+    assert cache.get(keys[1], requests[1]) is not None
+    assert cache.stats['evictions'] == 1
+
+    # a response expires after its ttl
+    mocker.patch('time.monotonic', return_value=time.monotonic() + 11)
+    assert cache.get(keys[1], requests[1]) is None
+    assert cache.stats['entries'] == 0
+
+
+def _generate_search_request_with_ids(ids):
+    req = _generate_request()
+    req.header.exec_endpoint = '/search'
+    req.data.docs[0].id = ids[0]
+    req.data.docs[0].text = 'a'
+    doc = req.data.docs.add()
+    doc.id = ids[1]
+    doc.text = 'b'
+    return req
+
+
+def test_response_cache_maps_ids():
+    cache = ResponseCache({'/search': {'ttl': 10}}, max_bytes=1 << 20)
+    request = _generate_search_request_with_ids(['q1', 'q2'])
+    # the Flow reorders the Documents, drops one and adds chunks
+    response = jina_pb2.RequestProto()
+    response.CopyFrom(request)
+    del response.data.docs[:]
+    doc = response.data.docs.add()
+    doc.CopyFrom(request.data.docs[1])
+    chunk = doc.chunks.add()
+    chunk.id = 'chunk'
+    chunk.parent_id = 'q2'
+    cache.put(cache.get_key(request), Request(response), request)
+
+    new_request = _generate_search_request_with_ids(['p1', 'p2'])
+    cached = cache.get(cache.get_key(new_request), new_request).proto
+    assert cached.request_id == new_request.request_id
+    assert [d.id for d in cached.data.docs] == ['p2']
+    assert cached.data.docs[0].text == 'b'
+    assert cached.data.docs[0].chunks[0].parent_id == 'p2'
@@ -3,7 +3,7 @@ from threading import Event, Thread
 
 import pytest
 
-from jina import DocumentArray
+from jina import DocumentArray, Executor, Flow, requests
 from jina.clients.request import request_generator
 from jina.parsers import set_pea_parser
 from jina.peapods.grpc import Grpclet
@@ -56,3 +56,33 @@ def _create_test_data_message():
     )[0]
     msg = Message(None, req, 'test', '123')
     return msg
+
+
+class SlowExecutor(Executor):
+    @requests
+    def foo(self, docs, **kwargs):
+        # e.g. a model that releases the GIL
+        time.sleep(0.5)
+        for doc in docs:
+            doc.text = f'processed {doc.id}'
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize(
+    'threads, min_duration, max_duration', [(1, 4.0, 8.0), (4, 0, 2.5)]
+)
+def test_grpc_data_runtime_threads(threads, min_duration, max_duration):
+    docs = [Document(id=str(i)) for i in range(8)]
+    results = {}
+    with Flow(grpc_data_requests=True).add(uses=SlowExecutor, threads=threads) as f:
+        start = time.perf_counter()
+        f.post(
+            '/',
+            docs,
+            request_size=1,
+            on_done=lambda r: results.update({d.id: d.text for d in r.docs}),
+        )
+        duration = time.perf_counter() - start
+
+    assert results == {d.id: f'processed {d.id}' for d in docs}
+    assert min_duration <= duration < max_duration
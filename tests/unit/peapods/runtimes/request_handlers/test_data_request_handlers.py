@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 
 from jina import DocumentArray, Executor, requests, Document, DocumentArrayMemmap
@@ -7,6 +9,7 @@ from jina.types.message import Message
 from jina.peapods.runtimes.request_handlers.data_request_handler import (
     DataRequestHandler,
 )
+from jina.peapods.runtimes.request_handlers.dynamic_batching import DynamicBatcher
 from jina.clients.request import request_generator
 
 
@@ -31,6 +34,26 @@ class MergeChangeDocsExecutor(Executor):
         return docs
 
 
+class AsyncDocsExecutor(Executor):
+    @requests(on='/async')
+    async def foo(self, docs, **kwargs):
+        await asyncio.sleep(0)
+        return DocumentArray([Document(text='async document')])
+
+    @requests(on='/sync')
+    def bar(self, docs, **kwargs):
+        for doc in docs:
+            doc.text = 'sync document'
+
+
+class BatchSizeExecutor(Executor):
+    @requests
+    def foo(self, docs, **kwargs):
+        return DocumentArray(
+            [Document(text=d.text, tags={'batch_size': len(docs)}) for d in docs]
+        )
+
+
 @pytest.fixture()
 def logger():
     return JinaLogger('data request handler')
@@ -130,3 +153,188 @@ def test_data_request_handler_change_docs_from_partial_requests(logger):
     assert len(msg.request.docs) == 10 * NUM_PARTIAL_REQUESTS
     for doc in msg.request.docs:
         assert doc.text == 'changed document'
+
+
+class EndpointMismatchExecutor(Executor):
+    @requests(on='/foo')
+    def foo(self, docs, **kwargs):
+        return DocumentArray([Document(text='new document')])
+
+
+@pytest.mark.parametrize('lazy', [True, False])
+def test_data_request_handler_merge_partial_requests(logger, lazy):
+    NUM_PARTIAL_REQUESTS = 5
+    args = set_pea_parser().parse_args(['--uses', 'EndpointMismatchExecutor'])
+    handler = DataRequestHandler(args, logger)
+
+    msgs = []
+    for i in range(NUM_PARTIAL_REQUESTS):
+        req = list(
+            request_generator(
+                '/',
+                DocumentArray([Document(text=f'{i}-{j}') for j in range(10)]),
+            )
+        )[0]
+        req.groundtruths.append(Document(text=f'groundtruth {i}'))
+        msg = Message(None, req, 'test', '123')
+        if lazy:
+            msg = Message(*msg.dump()[-2:])
+        msgs.append(msg)
+    msg = msgs[-1]
+    request_id = msg.request.request_id
+
+    handler.handle(
+        msg=msg,
+        partial_requests=[m.request for m in msgs],
+        peapod_name='name',
+    )
+
+    # untouched partial requests are merged without parsing their Documents
+    assert msg.request.is_decompressed != lazy
+    assert msg.request.request_id == request_id
+    assert msg.request.docs.get_attributes('text') == [
+        f'{i}-{j}' for i in reversed(range(NUM_PARTIAL_REQUESTS)) for j in range(10)
+    ]
+    assert msg.request.groundtruths.get_attributes('text') == [
+        f'groundtruth {NUM_PARTIAL_REQUESTS - 1}'
+    ]
+
+
+class ViewDocsExecutor(Executor):
+    @requests(on='/same')
+    def same(self, docs, **kwargs):
+        return docs
+
+    @requests(on='/wrapped')
+    def wrapped(self, docs, **kwargs):
+        return DocumentArray(docs)
+
+    @requests(on='/sliced')
+    def sliced(self, docs, **kwargs):
+        return docs[:]
+
+    @requests(on='/reversed')
+    def reversed(self, docs, **kwargs):
+        return DocumentArray(list(docs)[::-1])
+
+    @requests(on='/traversed')
+    def traversed(self, docs, **kwargs):
+        for d in docs:
+            d.tags['visited'] = True
+        return docs.traverse_flat(['r'])
+
+    @requests(on='/traversed-chunks')
+    def traversed_chunks(self, docs, **kwargs):
+        return docs.traverse_flat(['r', 'c'])
+
+
+@pytest.mark.parametrize(
+    'endpoint, replaced',
+    [
+        ('/same', False),
+        ('/wrapped', False),
+        ('/sliced', False),
+        ('/reversed', True),
+        ('/traversed', False),
+        ('/traversed-chunks', False),
+    ],
+)
+def test_data_request_handler_view_of_docs(logger, mocker, endpoint, replaced):
+    args = set_pea_parser().parse_args(['--uses', 'ViewDocsExecutor'])
+    handler = DataRequestHandler(args, logger)
+    req = list(
+        request_generator(
+            endpoint, DocumentArray([Document(text=str(j)) for j in range(10)])
+        )
+    )[0]
+    msg = Message(None, req, 'test', '123')
+    spy = mocker.spy(DataRequestHandler, 'replace_docs')
+
+    handler.handle(
+        msg=msg,
+        partial_requests=None,
+        peapod_name='name',
+    )
+
+    assert spy.called == replaced
+    texts = [str(j) for j in range(10)]
+    assert msg.request.docs.get_attributes('text') == (
+        texts[::-1] if replaced else texts
+    )
+
+
+def test_data_request_handler_replace_docs_with_view():
+    docs = DocumentArray(
+        [
+            Document(id=f'r{i}', chunks=[Document(id=f'r{i}c{j}') for j in range(2)])
+            for i in range(3)
+        ]
+    )
+    msg = Message(None, list(request_generator('/', docs))[0], 'test', '123')
+
+    DataRequestHandler.replace_docs(msg, msg.request.docs.traverse_flat(['c', 'r']))
+
+    assert [d.id for d in msg.request.docs] == [
+        f'r{i}c{j}' for i in range(3) for j in range(2)
+    ] + [f'r{i}' for i in range(3)]
+    assert [len(d.chunks) for d in msg.request.docs][-3:] == [2, 2, 2]
+
+
+@pytest.mark.asyncio
+async def test_data_request_handler_async(logger):
+    args = set_pea_parser().parse_args(['--uses', 'AsyncDocsExecutor'])
+    handler = DataRequestHandler(args, logger)
+
+    def _create_message(endpoint):
+        req = list(
+            request_generator(
+                endpoint,
+                DocumentArray([Document(text='input document') for _ in range(10)]),
+            )
+        )[0]
+        return Message(None, req, 'test', '123')
+
+    msg = _create_message('/async')
+    assert handler.is_async(msg)
+    await handler.handle_async(msg=msg, partial_requests=None, peapod_name='name')
+    assert len(msg.request.docs) == 1
+    assert msg.request.docs[0].text == 'async document'
+
+    # sync endpoints can be handled by `handle_async` as well
+    msg = _create_message('/sync')
+    assert not handler.is_async(msg)
+    await handler.handle_async(msg=msg, partial_requests=None, peapod_name='name')
+    assert len(msg.request.docs) == 10
+    assert msg.request.docs[0].text == 'sync document'
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('max_batch_size, batch_sizes', [(5, [5, 5, 1]), (100, [11])])
+async def test_dynamic_batcher(logger, max_batch_size, batch_sizes):
+    args = set_pea_parser().parse_args(['--uses', 'BatchSizeExecutor'])
+    handler = DataRequestHandler(args, logger)
+    batcher = DynamicBatcher(
+        {'/': {'max_batch_size': max_batch_size, 'max_wait_ms': 100}}, handler, 'name'
+    )
+
+    msgs = []
+    for i, size in enumerate([2, 3, 4, 1, 1]):
+        req = list(
+            request_generator(
+                '/', DocumentArray([Document(text=f'{i}-{j}') for j in range(size)])
+            )
+        )[0]
+        msgs.append(Message(None, req, 'test', '123'))
+    assert all(batcher.is_batched(msg) for msg in msgs)
+    req = list(request_generator('/', Document(), target_peapod='other'))[0]
+    assert not batcher.is_batched(Message(None, req, 'test', '123'))
+
+    await asyncio.gather(*(batcher.handle(msg) for msg in msgs))
+
+    for i, msg in enumerate(msgs):
+        assert [d.text for d in msg.request.docs] == [
+            f'{i}-{j}' for j in range(len(msg.request.docs))
+        ]
+    assert [d.tags['batch_size'] for msg in msgs for d in msg.request.docs] == [
+        size for size in batch_sizes for _ in range(size)
+    ]
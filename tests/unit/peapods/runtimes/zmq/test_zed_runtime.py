@@ -1,4 +1,13 @@
+import asyncio
+import time
+
+import pytest
+
+from jina import Flow, Executor, requests, Document
+from jina.enums import OnErrorStrategy
 from jina.peapods.runtimes.zmq.zed import ZEDRuntime
+from jina.proto import jina_pb2
+from tests import validate_callback
 
 
 def test_zed_runtime_parse_params():
@@ -13,3 +22,163 @@ def test_zed_runtime_parse_params():
     assert parsed_params['traversal_path'] == 'c'
     assert parsed_params['param1'] == 5
     assert parsed_params['executor_name']['traversal_path'] == 'c'
+
+
+class SlowAsyncExecutor(Executor):
+    @requests
+    async def foo(self, docs, **kwargs):
+        # e.g. waiting for a remote model server
+        await asyncio.sleep(0.5)
+        for doc in docs:
+            doc.text = f'processed {doc.id}'
+
+
+@pytest.mark.parametrize('grpc_data_requests', [False, True])
+@pytest.mark.parametrize('max_inflight, max_duration', [(1, 4.0), (16, 2.0)])
+def test_async_endpoints_inflight(grpc_data_requests, max_inflight, max_duration):
+    docs = [Document(id=str(i)) for i in range(8)]
+    results = {}
+    with Flow(grpc_data_requests=grpc_data_requests).add(
+        uses=SlowAsyncExecutor, max_inflight=max_inflight
+    ) as f:
+        start = time.perf_counter()
+        f.post(
+            '/',
+            docs,
+            request_size=1,
+            on_done=lambda r: results.update({d.id: d.text for d in r.docs}),
+        )
+        duration = time.perf_counter() - start
+
+    assert results == {d.id: f'processed {d.id}' for d in docs}
+    if max_inflight == 1:
+        assert duration >= max_duration
+    else:
+        assert duration < max_duration
+
+
+class BatchSizeExecutor(Executor):
+    @requests(on='/encode')
+    def foo(self, docs, **kwargs):
+        time.sleep(0.1)
+        for doc in docs:
+            doc.text = f'processed {doc.id}'
+            doc.tags['batch_size'] = len(docs)
+
+
+@pytest.mark.parametrize('grpc_data_requests', [False, True])
+def test_dynamic_batching(grpc_data_requests):
+    docs = [Document(id=str(i)) for i in range(16)]
+    results = {}
+    with Flow(grpc_data_requests=grpc_data_requests).add(
+        uses=BatchSizeExecutor,
+        uses_dynamic_batching={'/encode': {'max_batch_size': 4, 'max_wait_ms': 50}},
+    ) as f:
+        f.post(
+            '/encode',
+            docs,
+            request_size=1,
+            on_done=lambda r: results.update(
+                {d.id: (d.text, d.tags['batch_size']) for d in r.docs}
+            ),
+        )
+
+    assert {k: v[0] for k, v in results.items()} == {
+        d.id: f'processed {d.id}' for d in docs
+    }
+    # each request holds one Document, but the executor gets them in batches
+    assert max(v[1] for v in results.values()) == 4
+
+
+class SlowSyncExecutor(Executor):
+    @requests(on='/shared')
+    def foo(self, docs, **kwargs):
+        # e.g. a model releasing the GIL
+        time.sleep(0.5)
+        for doc in docs:
+            doc.text = f'processed {doc.id}'
+
+    @requests(on='/locked', lock=True)
+    def bar(self, docs, **kwargs):
+        self.foo(docs)
+
+
+@pytest.mark.parametrize(
+    'threads, endpoint, min_duration, max_duration',
+    [(1, '/shared', 4.0, 8.0), (4, '/shared', 0, 2.5), (4, '/locked', 4.0, 8.0)],
+)
+def test_zed_runtime_threads(threads, endpoint, min_duration, max_duration):
+    docs = [Document(id=str(i)) for i in range(8)]
+    results = {}
+    with Flow().add(uses=SlowSyncExecutor, threads=threads) as f:
+        start = time.perf_counter()
+        f.post(
+            endpoint,
+            docs,
+            request_size=1,
+            on_done=lambda r: results.update({d.id: d.text for d in r.docs}),
+        )
+        duration = time.perf_counter() - start
+
+    assert results == {d.id: f'processed {d.id}' for d in docs}
+    assert min_duration <= duration < max_duration
+
+
+class SlowTextExecutor(Executor):
+    @requests
+    def foo(self, docs, **kwargs):
+        time.sleep(0.3)
+        for doc in docs:
+            doc.text += self.metas.name
+
+
+@pytest.mark.parametrize('grpc_data_requests', [False, True])
+def test_deadline_exceeded(grpc_data_requests):
+    results, errors = [], []
+    with Flow(grpc_data_requests=grpc_data_requests).add(
+        uses=SlowTextExecutor, uses_metas={'name': 'a'}
+    ).add(uses=SlowTextExecutor, uses_metas={'name': 'b'}) as f:
+        start = time.perf_counter()
+        f.post(
+            '/',
+            [Document() for _ in range(8)],
+            request_size=1,
+            timeout=0.5,
+            on_done=lambda r: results.extend(d.text for d in r.docs),
+            on_error=lambda r: errors.append(r.status.code),
+        )
+        duration = time.perf_counter() - start
+
+    # the requests that wait too long in the first Pod are not handled any further
+    assert results and set(results) == {'ab'}
+    assert errors and set(errors) == {jina_pb2.StatusProto.DEADLINE_EXCEEDED}
+    assert duration < 2.4
+
+
+class FailingExecutor(Executor):
+    @requests(on='/async')
+    async def foo(self, docs, **kwargs):
+        await asyncio.sleep(0)
+        raise ZeroDivisionError
+
+    @requests(on='/threaded')
+    def bar(self, docs, **kwargs):
+        raise ZeroDivisionError
+
+
+@pytest.mark.parametrize('endpoint, threads', [('/async', 1), ('/threaded', 2)])
+def test_async_endpoints_throw_early(mocker, endpoint, threads):
+    def validate(req):
+        assert req.status.code == jina_pb2.StatusProto.ERROR
+        assert req.routes[1].status.exception.name == 'ZeroDivisionError'
+
+    on_error_mock = mocker.Mock()
+    f = Flow(on_error_strategy=OnErrorStrategy.THROW_EARLY).add(
+        name='failing', uses=FailingExecutor, threads=threads
+    )
+    with f:
+        f.post(endpoint, [Document()], on_error=on_error_mock)
+        # the runtime of the failing Pea stops after sending the error on
+        assert f._pod_nodes['failing'].peas[0].is_shutdown.wait(5.0)
+
+    validate_callback(on_error_mock, validate)
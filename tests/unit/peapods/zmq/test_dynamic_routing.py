@@ -84,6 +84,57 @@ def test_simple_dynamic_routing_zmqlet():
         assert z2.msg_recv == 1
 
 
+@pytest.mark.parametrize('registered', [True, False])
+def test_compact_routing_table_zmqlet(registered):
+    args1 = get_args()
+    args2 = get_args()
+    args1.compact_routing_table = True
+
+    routing_table = RoutingTable(
+        {
+            'active_pod': 'pod1',
+            'pods': {
+                'pod1': {
+                    'host': '0.0.0.0',
+                    'port': args1.port_in,
+                    'expected_parts': 0,
+                    'out_edges': [{'pod': 'pod2'}],
+                },
+                'pod2': {
+                    'host': '0.0.0.0',
+                    'port': args2.port_in,
+                    'expected_parts': 1,
+                    'out_edges': [],
+                    # a Pod that is not started by the Flow does not know its routing table
+                    'external': not registered,
+                },
+            },
+        }
+    )
+    # the Flow hands its routing table to every Pod it starts
+    args1.routing_table = routing_table.json()
+
+    logger = JinaLogger('zmq-test')
+    with Zmqlet(args1, logger) as z1, Zmqlet(args2, logger) as z2:
+        received = []
+        for _ in range(2):
+            req = jina_pb2.RequestProto()
+            req.request_id = random_identity()
+            req.data.docs.add()
+            msg = Message(None, req, 'tmp', '')
+            msg.envelope.routing_table.CopyFrom(routing_table.proto)
+            z1.send_message(msg)
+            received.append(z2.recv_message(lambda m: m))
+
+        # zmq does not acknowledge messages, so a Pod the table is not registered with always gets it in full
+        for m in received:
+            assert m.envelope.HasField('routing_table') != registered
+            assert m.envelope.routing_table_ref.id == routing_table.id
+            assert m.envelope.routing_table_ref.active_pod == 'pod2'
+            table = RoutingTable.from_envelope(m.envelope)
+            assert table.active_target_pod.expected_parts == 1
+
+
 @pytest.mark.slow
 def test_double_dynamic_routing_zmqlet():
     args1 = get_args()
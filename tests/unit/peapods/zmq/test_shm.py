@@ -0,0 +1,128 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+import zmq
+
+from jina import Document
+from jina.clients.request import request_generator
+from jina.peapods.zmq import send_message, recv_message, shm
+from jina.types.message import Message
+
+pytestmark = pytest.mark.skipif(
+    not shm.is_available() or not sys.platform.startswith('linux'),
+    reason='shared memory segments are checked in /dev/shm',
+)
+
+
+def _segments():
+    return {f for f in os.listdir('/dev/shm') if f.startswith('jina-')}
+
+
+@pytest.fixture
+def pool():
+    before = _segments()
+    yield shm._get_pool()
+    shm._get_pool().close()
+    # all segments are unlinked when the sender exits
+    assert _segments() == before
+
+
+@pytest.mark.parametrize('shared_memory', [True, False])
+def test_send_recv_shared_memory(mocker, pool, shared_memory):
+    mocker.patch('jina.types.message.TENSOR_FRAME_MIN_BYTES', 1024)
+    mocker.patch.object(shm, 'SHM_MIN_BYTES', 4096)
+    spy = mocker.spy(shm, 'read_frames')
+    blobs = np.random.random((5, 32, 32)).astype(np.float32)
+    docs = [Document(blob=b, tags={'text': 'hello' * 1000}) for b in blobs]
+    msg = Message(None, next(request_generator('/', docs)), 'test', '123')
+
+    ctx = zmq.Context()
+    pull = ctx.socket(zmq.PULL)
+    port = pull.bind_to_random_port('tcp://127.0.0.1')
+    push = ctx.socket(zmq.PUSH)
+    push.connect(f'tcp://127.0.0.1:{port}')
+    try:
+        for _ in range(3):
+            send_message(push, msg, shared_memory=shared_memory)
+            # the descriptors are removed from the envelope of the sent message
+            assert not msg.envelope.shm_frames
+            received = recv_message(pull, timeout=5000)
+            assert not received.envelope.shm_frames
+            assert received.request.request_id == msg.request.request_id
+            np.testing.assert_equal(received.request.docs.blobs, blobs)
+            assert received.request.docs[0].tags['text'] == 'hello' * 1000
+    finally:
+        push.close()
+        pull.close()
+        ctx.term()
+
+    assert spy.call_count == (3 if shared_memory else 0)
+    # the request and the 5 blobs are moved to segments, which are reused for the later messages
+    assert len(pool._segments) == (6 if shared_memory else 0)
+
+
+def test_reuse_segments(pool):
+    frames = [b'', b'x' * 100, b'envelope', b'y' * 200]
+    assert shm.write_frames(frames, min_bytes=50) == [1, 3]
+    descriptors = frames[1], frames[3]
+    assert shm.read_frames(list(frames), [1, 3]) == [
+        b'',
+        b'x' * 100,
+        b'envelope',
+        b'y' * 200,
+    ]
+
+    # a segment is reused once it is read, the smallest one that fits is chosen
+    frames = [b'', b'z' * 100, b'envelope', b'z' * 200]
+    assert shm.write_frames(frames, min_bytes=50) == [1, 3]
+    assert frames[3].split(b':')[0] == descriptors[1].split(b':')[0]
+    assert frames[1].split(b':')[0] == descriptors[0].split(b':')[0]
+
+    # the segments are busy until they are read
+    busy = [b'', b'envelope', b'z' * 100]
+    shm.write_frames(busy, min_bytes=50)
+    assert len(pool._segments) == 3
+    assert shm.read_frames(frames, [1, 3])[1] == b'z' * 100
+
+
+def test_all_segments_busy(mocker, pool):
+    mocker.patch.object(shm, '_MAX_SEGMENTS', 1)
+    frames = [b'', b'x' * 100, b'envelope', b'y' * 100]
+    # the frame that does not get a segment is sent via the socket
+    assert shm.write_frames(frames, min_bytes=50) == [1]
+    assert frames[1] == b'x' * 100
+
+
+def test_release_segments_on_send_failure(mocker, pool):
+    mocker.patch.object(shm, 'SHM_MIN_BYTES', 4096)
+    docs = [Document(tags={'text': 'hello' * 1000})]
+    msg = Message(None, next(request_generator('/', docs)), 'test', '123')
+
+    ctx = zmq.Context()
+    # no receiver is connected, so the send times out
+    push = ctx.socket(zmq.PUSH)
+    push.bind('tcp://127.0.0.1:*')
+    try:
+        with pytest.raises(TimeoutError):
+            send_message(push, msg, timeout=100, shared_memory=True)
+    finally:
+        push.close()
+        ctx.term()
+
+    assert len(pool._segments) == 1
+    assert pool._segments[0].buf[0] == shm._FREE
+
+
+def test_unlink_stale_segments(mocker, pool):
+    mocker.patch.object(shm, '_MAX_SEGMENTS', 1)
+    frames = [b'', b'envelope', b'x' * 100]
+    assert shm.write_frames(frames, min_bytes=50) == [1]
+    assert shm.write_frames([b'', b'envelope', b'y' * 100], min_bytes=50) == []
+
+    # the receiver never reads the first frame
+    mocker.patch.object(shm, '_MAX_BUSY_SECONDS', 0)
+    assert shm.write_frames([b'', b'envelope', b'y' * 100], min_bytes=50) == [1]
+    assert len(pool._segments) == 1
+    assert not os.path.exists(f'/dev/shm/{frames[-1].split(b":")[0].decode()}')
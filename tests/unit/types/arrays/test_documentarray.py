@@ -164,7 +164,9 @@ def test_array_get_success(docarray, document_factory):
     assert docarray[doc_id].text == 'test 4'
     doc_0_id = docarray[0].id
     docarray[doc_0_id] = doc
-    assert docarray[doc_0_id].text == 'test 4'
+    assert docarray[0].text == 'test 4'
+    # the replaced Document is no longer found by its id
+    assert doc_0_id not in docarray
 
 
 def test_array_get_from_slice_success(docs, document_factory):
@@ -433,6 +435,65 @@ def test_cache_invalidation_sort_reverse(docarray_for_cache):
     assert docarray_for_cache[1].id == '1'
 
 
+def test_id_index_after_delete_by_int_and_slice():
+    da = DocumentArray([Document(id=str(j)) for j in range(10)])
+    del da[0]
+    assert '0' not in da
+    assert da['5'].id == '5'
+    del da[2:4]
+    assert '3' not in da and '4' not in da
+    assert da['9'].id == '9'
+    del da[-1]
+    assert '9' not in da
+    assert [d.id for d in da] == ['1', '2', '5', '6', '7', '8']
+    for d in da:
+        assert da[d.id].id == d.id
+
+
+def test_id_index_after_insert():
+    da = DocumentArray([Document(id=str(j)) for j in range(5)])
+    da.insert(1, Document(id='a'))
+    da.insert(-1, Document(id='b'))
+    assert [d.id for d in da] == ['0', 'a', '1', '2', '3', 'b', '4']
+    for d in da:
+        assert da[d.id].id == d.id
+    with pytest.raises(KeyError):
+        da['not_exist']
+
+
+def test_id_index_after_setitem_with_other_id():
+    da = DocumentArray([Document(id=str(j)) for j in range(3)])
+    da['1'] = Document(id='a')
+    assert '1' not in da
+    assert da['a'].id == 'a'
+    with pytest.raises(KeyError):
+        da['1']
+    da[0] = Document(id='b')
+    assert '0' not in da
+    assert [d.id for d in da] == ['b', 'a', '2']
+    for d in da:
+        assert da[d.id].id == d.id
+
+
+def test_id_index_lazy_compaction():
+    da = DocumentArray([Document(id=str(j)) for j in range(100)])
+    assert da['99'].id == '99'
+    for j in range(50, 100, 2):
+        del da[str(j)]
+    # deletions are logged instead of re-indexing the tail of the array
+    assert da._id_to_index_valid_upto == 50
+    assert len(da._id_to_index_log) == 25
+    for d in da:
+        assert da[d.id].id == d.id
+    assert '50' not in da
+
+    for j in range(1000):
+        da.insert(0, Document(id=f'new{j}'))
+    assert len(da._id_to_index_log) <= 33
+    assert da.index(da['99']) == len(da) - 1
+    assert da['new0'].id == 'new0'
+
+
 def test_sample():
     da = DocumentArray(random_docs(100))
     sampled = da.sample(1)
@@ -522,6 +583,19 @@ def test_da_get_embeddings_slice():
     )
 
 
+@pytest.mark.parametrize('quantize', ['fp16', 'uint8'])
+def test_da_get_quantized_embeddings(quantize):
+    from jina.types.ndarray.dense.numpy import DenseNdArray
+
+    emb = np.random.random((10, 32)).astype(np.float32)
+    da = DocumentArray([Document() for _ in range(10)])
+    for d, x in zip(da, emb):
+        DenseNdArray(d.proto.embedding.dense, quantize=quantize).value = x
+    assert da.embeddings.dtype == np.float32
+    np.testing.assert_allclose(da.embeddings, da.get_attributes('embedding'), rtol=1e-6)
+    np.testing.assert_allclose(da.embeddings, emb, atol=1 / 128)
+
+
 def test_embeddings_setter_da():
     emb = np.random.random((100, 128))
     da = DocumentArray([Document() for _ in range(100)])
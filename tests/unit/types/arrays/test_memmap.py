@@ -517,3 +517,36 @@ def test_blobs_setter_dma():
     np.testing.assert_almost_equal(da.blobs, blobs)
     for x, doc in zip(blobs, da):
         np.testing.assert_almost_equal(x, doc.blob)
+
+
+def test_content_hash_index(tmpdir):
+    dam = DocumentArrayMemmap(tmpdir)
+    dam.extend(Document(id=f'{i}', text=f'text {i % 5}') for i in range(10))
+    assert not dam.has_content_hash_index
+
+    dam.extend(
+        [Document(id='10', text='text 1'), Document(id='11', text='new')],
+        skip_duplicates=True,
+    )
+    assert dam.has_content_hash_index
+    assert len(dam) == 11
+    assert '10' not in dam
+
+    # the index is persisted and kept up to date on update and delete
+    dam['0'] = Document(id='0', text='other')
+    del dam['11']
+    dam = DocumentArrayMemmap(tmpdir)
+    assert dam.has_content_hash_index
+    assert [d.id for d in dam.dedup()] == ['0', '1', '2', '3', '4', '5']
+
+    dam.extend([Document(id='12', text='new')], skip_duplicates=True)
+    assert '12' in dam
+
+    dam.prune()
+    assert dam.has_content_hash_index
+    assert len(dam.dedup()) == 7
+
+    dam.drop_content_hash_index()
+    assert not dam.has_content_hash_index
+    assert not os.path.exists(os.path.join(tmpdir, 'content_hash.bin'))
+    assert len(dam.dedup()) == 7
@@ -415,3 +415,36 @@ def test_match_exclude_self(exclude_self, num_matches):
     da1.match(da2, exclude_self=exclude_self)
     for d in da1:
         assert len(d.matches) == num_matches
+
+
+@pytest.mark.parametrize('limit', [None, 3])
+@pytest.mark.parametrize('descending', [True, False])
+def test_merge_matches(limit, descending):
+    num_shards, num_docs, num_matches = 4, 5, 6
+    shards = []
+    for s in range(num_shards):
+        da = DocumentArray([Document(id=f'q{j}') for j in range(num_docs)])
+        for d in da:
+            for k in range(num_matches if s else 2):
+                d.matches.append(
+                    Document(id=f'{s}-{k}'),
+                    scores={'cosine': float(np.random.random())},
+                )
+        shards.append(da)
+
+    expected = []
+    for j in range(num_docs):
+        matches = [m for da in shards for m in da[j].matches]
+        matches.sort(key=lambda m: m.scores['cosine'].value, reverse=descending)
+        expected.append([m.id for m in matches][:limit])
+
+    shards[0].merge_matches(
+        shards[1:], metric_name='cosine', limit=limit, descending=descending
+    )
+    assert [d.matches.get_attributes('id') for d in shards[0]] == expected
+
+
+def test_merge_matches_mismatch_length():
+    da = DocumentArray([Document() for _ in range(3)])
+    with pytest.raises(ValueError):
+        da.merge_matches([DocumentArray([Document()])], metric_name='cosine')
@@ -0,0 +1,85 @@
+import numpy as np
+import pytest
+
+from jina import Document, DocumentArray
+from jina.types.arrays.memmap import DocumentArrayMemmap
+
+
+def _set_embedding(doc):
+    doc.embedding = np.array([len(doc.text)])
+
+
+def _text_length(doc):
+    return len(doc.text)
+
+
+def _new_doc(doc):
+    return Document(text=doc.text.upper())
+
+
+def _batch_size(da):
+    return len(da)
+
+
+def _upper_batch(da):
+    for d in da:
+        d.text = d.text.upper()
+    return da
+
+
+@pytest.fixture
+def docs():
+    return [Document(text='a' * j) for j in range(100)]
+
+
+@pytest.fixture
+def docarray(docs):
+    return DocumentArray(docs)
+
+
+@pytest.fixture
+def docarray_memmap(docs, tmpdir):
+    dam = DocumentArrayMemmap(tmpdir)
+    dam.extend(docs)
+    return dam
+
+
+@pytest.mark.parametrize('backend', ['thread', 'process'])
+@pytest.mark.parametrize('da_type', ['docarray', 'docarray_memmap'])
+def test_map_results_in_order(da_type, backend, request):
+    da = request.getfixturevalue(da_type)
+    assert list(da.map(_text_length, backend=backend, num_worker=2)) == list(range(100))
+
+
+@pytest.mark.parametrize('backend', ['thread', 'process'])
+def test_map_inplace(docarray, backend):
+    for r in docarray.map(_set_embedding, backend=backend, batch_size=7):
+        assert r is None
+    np.testing.assert_equal(docarray.embeddings, np.arange(100).reshape(-1, 1))
+
+
+@pytest.mark.parametrize('backend', ['thread', 'process'])
+def test_map_returns_documents(docarray, backend):
+    results = list(docarray.map(_new_doc, backend=backend))
+    assert all(isinstance(d, Document) for d in results)
+    assert [d.text for d in results] == [d.text.upper() for d in docarray]
+
+
+@pytest.mark.parametrize('backend', ['thread', 'process'])
+@pytest.mark.parametrize('da_type', ['docarray', 'docarray_memmap'])
+def test_map_batch(da_type, backend, request):
+    da = request.getfixturevalue(da_type)
+    assert list(da.map_batch(_batch_size, batch_size=30, backend=backend)) == [
+        30,
+        30,
+        30,
+        10,
+    ]
+
+
+@pytest.mark.parametrize('backend', ['thread', 'process'])
+def test_map_batch_inplace(docarray, backend):
+    results = list(docarray.map_batch(_upper_batch, batch_size=30, backend=backend))
+    assert [len(r) for r in results] == [30, 30, 30, 10]
+    assert all(d.text == d.text.upper() for d in docarray)
+    assert docarray[99].text == 'A' * 99
@@ -58,3 +58,168 @@ def test_multiple_regex(regexes, doc_array_creator, list_doc_examples, tmpdir):
 
     for d in filtered_doc_array:
         assert d.tags['city'].startswith('B') and 'Non' in d.tags['phone']
+
+
+@pytest.fixture
+def docs_with_tags():
+    cities = ['Barcelona', 'Berlin', 'Paris', 'Brussels', 'Bern']
+    return [
+        Document(
+            id=str(i),
+            tags={'city': cities[i % 5], 'price': i % 7, 'meta': {'k': 'abc'[i % 3]}},
+        )
+        for i in range(50)
+    ]
+
+
+def _ids(docs):
+    return [d.id for d in docs]
+
+
+@pytest.mark.parametrize(
+    'regexes',
+    [{'city': r'B.*'}, {'city': r'.*ssel'}, {'city': 'Ber', 'meta__k': 'a'}],
+)
+def test_find_with_tag_index(docs_with_tags, regexes):
+    da = DocumentArray(docs_with_tags)
+    indexed = DocumentArray(docs_with_tags)
+    indexed.build_tag_index('city', 'meta__k')
+    assert _ids(indexed.find(dict(regexes), operator='>=', threshold=1)) == _ids(
+        da.find(dict(regexes), operator='>=', threshold=1)
+    )
+
+
+def test_split_with_tag_index(docs_with_tags):
+    da = DocumentArray(docs_with_tags)
+    indexed = DocumentArray(docs_with_tags)
+    indexed.build_tag_index('city')
+    expected, result = da.split('city'), indexed.split('city')
+    assert list(expected.keys()) == list(result.keys())
+    for k in expected:
+        assert _ids(expected[k]) == _ids(result[k])
+
+
+@pytest.mark.parametrize(
+    'predicates',
+    [
+        {'city': 'Berlin'},
+        {'price': {'$gte': 2, '$lt': 4}},
+        {'city': {'$regex': 'er'}, 'price': {'$gt': 3}},
+        {'city': {'$contains': 'russ'}},
+        {'meta__k': {'$in': ['a', 'b']}, 'city': {'$neq': 'Paris'}},
+        {'price': {'$nin': [0, 1]}},
+    ],
+)
+@pytest.mark.parametrize('indexed', [True, False])
+def test_query(docs_with_tags, predicates, indexed):
+    da = DocumentArray(docs_with_tags)
+    if indexed:
+        da.build_tag_index('city', 'price', 'meta__k')
+    expected = [
+        d.id
+        for d in docs_with_tags
+        if all(
+            _check_predicate(d, tag, op, value)
+            for tag, pred in predicates.items()
+            for op, value in (
+                pred.items() if isinstance(pred, dict) else [('$eq', pred)]
+            )
+        )
+    ]
+    assert _ids(da.query(predicates)) == expected
+
+
+def _check_predicate(doc, tag, op, value):
+    if '__' in tag:
+        tag_value = doc.tags['meta']['k']
+    else:
+        tag_value = doc.tags[tag]
+    return {
+        '$eq': lambda: tag_value == value,
+        '$neq': lambda: tag_value != value,
+        '$gt': lambda: tag_value > value,
+        '$gte': lambda: tag_value >= value,
+        '$lt': lambda: tag_value < value,
+        '$in': lambda: tag_value in value,
+        '$nin': lambda: tag_value not in value,
+        '$regex': lambda: re.search(value, tag_value) is not None,
+        '$contains': lambda: value in tag_value,
+    }[op]()
+
+
+def test_tag_index_maintained_on_edit(docs_with_tags):
+    da = DocumentArray(docs_with_tags)
+    da.build_tag_index('city', 'price')
+    del da[0]
+    del da['1']
+    del da[10:20]
+    da.insert(0, Document(id='new', tags={'city': 'Berlin', 'price': 100}))
+    da[5] = Document(id='replaced', tags={'city': 'Madrid', 'price': 3})
+    da.append(Document(id='appended', tags={'city': 'Madrid'}))
+
+    assert _ids(da.query({'city': 'Madrid'})) == ['replaced', 'appended']
+    assert _ids(da.query({'price': {'$gte': 100}})) == ['new']
+    assert _ids(da.find({'city': 'Berl'}))[0] == 'new'
+    assert '0' not in _ids(da.split('city')['Barcelona'])
+
+    da.clear()
+    assert len(da.query({'city': 'Madrid'})) == 0
+
+
+@pytest.mark.parametrize('doc_array_creator', [docarray_type, docarray_memmap_type])
+def test_query_without_index(doc_array_creator, list_doc_examples, tmpdir):
+    doc_array = doc_array_creator(list_doc_examples, tmpdir)
+    result = doc_array.query({'city': {'$regex': '^B'}, 'phone': 'None'})
+    assert [d.tags['city'] for d in result] == ['Barcelona', 'Brussels']
+
+
+@pytest.mark.parametrize('da_cls', [DocumentArray, DocumentArrayMemmap])
+@pytest.mark.parametrize(
+    'keep, expected, expected_by_text',
+    [
+        ('first', ['a1', 'b1', 'c'], ['a1', 'b1']),
+        ('last', ['a2', 'c', 'b2'], ['c', 'b2']),
+    ],
+)
+def test_dedup(da_cls, keep, expected, expected_by_text, tmpdir):
+    docs = [
+        Document(id='a1', text='a', tags={'v': 1}),
+        Document(id='b1', text='b'),
+        Document(id='a2', text='a', tags={'v': 1}),
+        Document(id='c', text='a', tags={'v': 2}),
+        Document(id='b2', text='b'),
+    ]
+    da = da_cls(tmpdir) if da_cls is DocumentArrayMemmap else da_cls()
+    da.extend(docs)
+    dedup = da.dedup(keep=keep)
+    assert isinstance(dedup, DocumentArray)
+    assert [d.id for d in dedup] == expected
+    assert [d.id for d in da.dedup(fields=['text'], keep=keep)] == expected_by_text
+
+
+def test_dedup_invalid_arguments():
+    da = DocumentArray([Document(text='a')])
+    with pytest.raises(ValueError):
+        da.dedup(keep='middle')
+    with pytest.raises(ValueError):
+        da.dedup(fields=['not_a_field'])
+
+
+@pytest.mark.parametrize(
+    'predicates', [{'city': None}, {'city': {'$in': [None, 'Paris']}}]
+)
+@pytest.mark.parametrize('indexed', [True, False])
+def test_query_none(docs_with_tags, predicates, indexed):
+    docs = docs_with_tags + [Document(id='no-city', tags={'price': 1})]
+    da = DocumentArray(docs)
+    if indexed:
+        da.build_tag_index('city')
+    result = _ids(da.query(predicates))
+    assert 'no-city' in result
+    assert all(
+        'city' not in d.tags or d.tags['city'] == 'Paris' for d in da.query(predicates)
+    )
+    if isinstance(predicates['city'], dict):
+        assert len(result) == 11
+    else:
+        assert result == ['no-city']
@@ -226,3 +226,80 @@ def test_traverse_chunkarray():
     flat_docs = doc.chunks.traverse_flat(['r', 'm'])
     assert isinstance(flat_docs, DocumentArray)
     assert len(flat_docs) == 12
+
+
+def test_traverse_flat_is_view():
+    docs = DocumentArray(random_docs(3, 4))
+    flat = docs.traverse_flat(['c', 'r'])
+    assert len(flat) == 3 * 4 + 3
+    assert flat[0].id == docs[0].chunks[0].id
+    assert flat[-1].id == docs[-1].id
+    assert [d.id for d in flat[4:6]] == [docs[1].chunks[0].id, docs[1].chunks[1].id]
+    assert flat[docs[2].chunks[1].id].id == docs[2].chunks[1].id
+
+    flat[1].embedding = np.array([1, 2, 3])
+    np.testing.assert_equal(docs[0].chunks[1].embedding, np.array([1, 2, 3]))
+
+    flat.append(Document(id='new'))
+    del flat[0]
+    assert len(flat) == 3 * 4 + 3
+    assert len(docs[0].chunks) == 4
+    assert 'new' not in docs
+
+
+def test_traverse_flat_per_path_is_view():
+    docs = DocumentArray(random_docs(3, 4))
+    flat_c, flat_r = docs.traverse_flat_per_path(['c', 'r'])
+    assert isinstance(flat_c, DocumentArray)
+    assert len(flat_c) == 12
+    assert len(flat_r) == 3
+    for d in flat_c:
+        d.text = 'modified'
+    assert all(c.text == 'modified' for d in docs for c in d.chunks)
+
+
+def test_traverse_flat_empty_and_invalid_path():
+    docs = DocumentArray([Document(), Document()])
+    assert len(docs.traverse_flat(['c', 'm'])) == 0
+    with pytest.raises(ValueError):
+        docs.traverse_flat(['x'])
+
+
+def test_traverse_flat_root_is_view():
+    docs = DocumentArray(random_docs(3, 4))
+    flat = docs.traverse_flat(['r'])
+    assert flat is not docs
+    assert [d.id for d in flat] == [d.id for d in docs]
+    flat[0].text = 'modified'
+    assert docs[0].text == 'modified'
+    # changing the sequence of the view does not change the root
+    flat.append(Document(id='new'))
+    assert len(docs) == 3
+    assert 'new' not in docs
+
+
+def test_traverse_flat_follows_nested_changes():
+    docs = DocumentArray(random_docs(2, 2))
+    flat = docs.traverse_flat(['c'])
+    assert len(flat) == 4
+    docs[0].chunks.append(Document(id='new-chunk'))
+    docs[1].chunks.clear()
+    assert len(flat) == 3
+    assert [d.id for d in flat][-1] == 'new-chunk'
+    assert flat[-1].id == 'new-chunk'
+    with pytest.raises(IndexError):
+        flat[3]
+
+
+def test_traverse_flat_slice_and_index():
+    docs = DocumentArray(
+        [Document(chunks=[Document() for _ in range(j % 3)]) for j in range(10)]
+    )
+    chunks = [c.id for d in docs for c in d.chunks]
+    flat = docs.traverse_flat(['c'])
+    assert [flat[i].id for i in range(len(flat))] == chunks
+    assert [flat[-i].id for i in range(1, len(flat) + 1)] == chunks[::-1]
+    for start, stop in [(0, 3), (2, 7), (5, 100), (4, 4), (100, 200)]:
+        assert [d.id for d in flat[start:stop]] == chunks[start:stop]
+    assert [d.id for d in flat[1::2]] == chunks[1::2]
+    assert [d.id for d in flat[-3:]] == chunks[-3:]
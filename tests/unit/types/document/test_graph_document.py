@@ -566,3 +566,62 @@ def test_add_multiple_edges_from_string():
     )
 
     validate_graph(graph)
+
+
+def test_batch_edges():
+    docs = [Document(text=f'Document{i}') for i in range(4)]
+    graph = GraphDocument()
+    with graph.batch_edges():
+        graph.add_single_edge(
+            docs[0], docs[1], features={'text': 'I connect Doc0 and Doc1'}
+        )
+        graph.add_single_edge(
+            docs[0], docs[2], features={'text': 'I connect Doc0 and Doc2'}
+        )
+        graph.add_single_edge(
+            docs[2], docs[1], features={'text': 'I connect Doc2 and Doc1'}
+        )
+        assert graph._pb_body.graph.adjacency.ByteSize() == 0
+        graph.add_single_edge(
+            docs[1], docs[3], features={'text': 'I connect Doc1 and Doc3'}
+        )
+        graph.add_single_edge(
+            docs[2], docs[3], features={'text': 'I connect Doc2 and Doc3'}
+        )
+    validate_graph(graph)
+    validate_graph(GraphDocument(graph.proto))
+
+
+def test_batch_edges_read_inside_context(graph):
+    doc4 = Document(text='Document4')
+    with graph.batch_edges():
+        graph.add_single_edge(graph.nodes[3], doc4)
+        assert graph.num_edges == 6
+        graph.remove_single_node(graph.nodes[0])
+        graph.add_single_edge(graph.nodes[0], doc4)
+    assert graph.num_edges == 5
+    assert graph.get_in_degree(doc4) == 2
+    assert [d.text for d in graph.get_incoming_nodes(doc4)] == [
+        'Document3',
+        'Document1',
+    ]
+
+
+def test_degrees_follow_edge_changes(graph):
+    doc0, doc1, doc2, doc3 = graph.nodes
+    assert [graph.get_out_degree(d) for d in (doc0, doc1, doc2, doc3)] == [2, 1, 2, 0]
+    assert [graph.get_in_degree(d) for d in (doc0, doc1, doc2, doc3)] == [0, 2, 1, 2]
+    assert [d.id for d in graph.get_outgoing_nodes(doc2)] == [doc1.id, doc3.id]
+
+    graph.remove_single_edge(doc2, doc1)
+    assert graph.get_out_degree(doc2) == 1
+    assert graph.get_in_degree(doc1) == 1
+
+    graph.add_single_edge(doc3, doc0)
+    assert graph.get_out_degree(doc3) == 1
+    assert [d.id for d in graph.get_incoming_nodes(doc0)] == [doc3.id]
+
+    graph.remove_single_node(doc1)
+    assert graph.num_edges == 3
+    assert [graph.get_out_degree(d) for d in graph.nodes] == [1, 1, 1]
+    assert f'{doc0.id}-{doc1.id}' not in graph.edge_features
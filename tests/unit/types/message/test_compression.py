@@ -1,13 +1,28 @@
+import os
+
+import numpy as np
 import pytest
 
+from jina import Document
 from jina.clients.request import request_generator
 from jina.enums import CompressAlgo
 from jina.logging.profile import TimeContext
+from jina.proto import jina_pb2
+from jina.proto.serializer import MessageProto
 from jina.types.message import Message
+from jina.types.request import Request
+from jina.types.message.compression import (
+    AdaptiveCompressor,
+    _adaptive_compressors,
+    train_dictionary,
+)
 from tests import random_docs
 
 
-@pytest.mark.parametrize('compress_algo', list(CompressAlgo))
+# AUTO only compresses when it pays off, it is covered by the tests of the adaptive compression below
+@pytest.mark.parametrize(
+    'compress_algo', [a for a in CompressAlgo if a != CompressAlgo.AUTO]
+)
 @pytest.mark.parametrize('low_bytes', [True, False])
 @pytest.mark.parametrize('high_ratio', [False, False])
 def test_compression(compress_algo, low_bytes, high_ratio):
@@ -46,3 +61,148 @@ def test_compression(compress_algo, low_bytes, high_ratio):
     print(
         f'{str(compress_algo)}: size {sum(sizes) / len(sizes)} (ratio: {sum(no_comp_sizes) / sum(sizes):.2f}) with {tc.duration:.2f}s'
     )
+
+
+@pytest.fixture
+def dictionary(tmpdir, monkeypatch):
+    from jina.types.message.compression import get_dictionary
+
+    def _set(samples):
+        path = os.path.join(str(tmpdir), 'requests.dict')
+        with open(path, 'wb') as fp:
+            fp.write(train_dictionary(samples))
+        monkeypatch.setenv('JINA_COMPRESS_DICTIONARY', path)
+        get_dictionary.cache_clear()
+
+    yield _set
+    monkeypatch.delenv('JINA_COMPRESS_DICTIONARY', raising=False)
+    get_dictionary.cache_clear()
+
+
+def _small_request(i):
+    return list(
+        request_generator(
+            '/', [Document(text=f'hello world {i}', tags={'category': 'greeting'})]
+        )
+    )[0]
+
+
+def test_adaptive_compressor():
+    compressor = AdaptiveCompressor(min_ratio=1.1, sample_interval=4)
+    data = os.urandom(100000)
+    for _ in range(8):
+        c_data, algorithm = compressor.compress(data)
+        assert algorithm == CompressAlgo.NONE
+        assert c_data is data
+
+    data = b'hello world ' * 10000
+    for _ in range(8):
+        c_data, algorithm = compressor.compress(data)
+    assert algorithm != CompressAlgo.NONE
+    assert len(c_data) < len(data)
+
+
+@pytest.mark.parametrize('compress_algo', [CompressAlgo.ZLIB, CompressAlgo.AUTO])
+@pytest.mark.parametrize('tensor_frame_min_bytes', [None, 1 << 20])
+@pytest.mark.parametrize('grpc', [False, True])
+def test_compression_skips_dense_tensors(
+    mocker, compress_algo, tensor_frame_min_bytes, grpc
+):
+    # the dense tensors are sent as frames whenever the request is compressed
+    mocker.patch('jina.types.message.TENSOR_FRAME_MIN_BYTES', tensor_frame_min_bytes)
+    docs = [
+        Document(text='hello world ' * 1000, embedding=np.random.random(512))
+        for _ in range(10)
+    ]
+    r = list(request_generator('/', docs))[0]
+    m = Message(
+        None,
+        r,
+        identity='gateway',
+        pod_name='123',
+        compress=compress_algo,
+        compress_min_bytes=1024,
+        compress_min_ratio=1.1,
+    )
+    if grpc:
+        mp = jina_pb2.MessageProto()
+        mp.ParseFromString(m.SerializeToString())
+        assert not mp.HasField('request')
+        assert len(mp.tensor_frames) == len(docs)
+        assert len(mp.compressed_request) < sum(len(d.text) for d in docs)
+        m2 = MessageProto.FromString(mp.SerializeToString())
+    else:
+        frames = m.dump()
+        m2 = Message(frames[-2], frames[-1])
+        m2.set_tensor_frames(frames[1:-2])
+    assert m.envelope.compression.adaptive == (compress_algo == CompressAlgo.AUTO)
+    assert m.envelope.compression.algorithm != 'NONE'
+    assert m.envelope.num_tensor_frames == len(docs)
+
+    for d, d2 in zip(docs, m2.request.docs):
+        assert d2.text == d.text
+        np.testing.assert_equal(d2.embedding, d.embedding)
+
+
+def test_adaptive_compression_per_target():
+    r = list(request_generator('/', [Document(text='hello world ' * 1000)]))[0]
+    m = Message(
+        None,
+        r,
+        identity='gateway',
+        pod_name='123',
+        compress=CompressAlgo.AUTO,
+    )
+    m1 = m.for_target('0.0.0.0:1234')
+    assert m1 is m
+    m2 = m1.for_target('0.0.0.0:5678')
+    assert m2 is not m
+    assert m1.target_address == '0.0.0.0:1234'
+    assert m2.target_address == '0.0.0.0:5678'
+
+    m1.dump()
+    m2.dump()
+    assert ('0.0.0.0:1234', 1.0) in _adaptive_compressors
+    assert ('0.0.0.0:5678', 1.0) in _adaptive_compressors
+
+
+def test_dictionary_compression(dictionary):
+    dictionary(_small_request(i).SerializeToString() for i in range(100))
+
+    r = _small_request(100)
+    m = Message(
+        None,
+        r,
+        identity='gateway',
+        pod_name='123',
+        compress=CompressAlgo.LZ4,
+        compress_min_bytes=1024,
+        compress_min_ratio=1.1,
+    )
+    frames = m.dump()
+    assert m.envelope.compression.algorithm == 'ZLIB'
+    assert len(frames[-1]) < len(r.SerializeToString())
+
+    m2 = Message(frames[-2], frames[-1])
+    assert m2.request.docs[0].text == 'hello world 100'
+
+    # a receiver with another dictionary can not decompress it
+    dictionary([b'another dictionary' * 10] * 2)
+    with pytest.raises(ValueError):
+        Message(frames[-2], frames[-1]).request.docs
+
+
+def test_compress_untouched_request():
+    # e.g. the gateway receives the serialized request without compression
+    r = list(request_generator('/', [Document(text='hello world ' * 1000)]))[0]
+    m = Message(
+        None,
+        Request(r.SerializeToString()),
+        identity='gateway',
+        pod_name='123',
+        compress=CompressAlgo.ZLIB,
+    )
+    frames = m.dump()
+    assert m.envelope.compression.algorithm == 'ZLIB'
+    assert len(frames[-1]) < len(r.SerializeToString())
+    assert Message(frames[-2], frames[-1]).request.docs[0].text == r.docs[0].text
@@ -1,19 +1,26 @@
+import gc
 import sys
+import time
 
+import numpy as np
 import pytest
+import zmq
 
 from jina import Document
 from jina.clients.request import request_generator
 from jina.proto import jina_pb2
 from jina.types.message import Message
-from jina.types.request import _trigger_fields, Request
+from jina.types.request import _trigger_fields, _lazy_fields, Request
 from jina.enums import CompressAlgo
+from jina.peapods.zmq import _parse_from_frames
 from tests import random_docs
 
 
 @pytest.mark.parametrize(
     'field',
-    _trigger_fields.difference({'command', 'args', 'flush', 'propagate', 'targets'}),
+    _trigger_fields.difference(
+        {'command', 'args', 'flush', 'propagate', 'targets', 'parameters'}
+    ).difference(_lazy_fields),
 )
 @pytest.mark.parametrize(
     'algo',
@@ -143,7 +150,7 @@ def test_lazy_nested_clear_access(algo):
 
 
 def test_lazy_msg_access():
-    # this test does not make much sense, when `message` is instantiated without `envelope`, the `request` header is accessed and therefore decompressed
+    # when `message` is instantiated without `envelope`, only the meta info of the request is read
     messages = [
         Message(
             None,
@@ -156,24 +163,53 @@ def test_lazy_msg_access():
         for r in request_generator('/', random_docs(10))
     ]
     for m in messages:
-        assert m.request.is_decompressed
+        assert not m.request.is_decompressed
         assert m.envelope
         assert len(m.dump()) == 3
-        assert m.request.is_decompressed
+        assert not m.request.is_decompressed
 
     for m in messages:
-        assert m.request.is_decompressed
+        assert not m.request.is_decompressed
         assert m.request
         assert len(m.dump()) == 3
-        assert m.request.is_decompressed
+        assert not m.request.is_decompressed
 
     for m in messages:
-        assert m.request.is_decompressed
         assert m.request.data.docs
+        assert m.request.is_decompressed
         assert len(m.dump()) == 3
         assert m.request.is_decompressed
 
 
+@pytest.mark.parametrize(
+    'algo',
+    [None, CompressAlgo.NONE, CompressAlgo.ZLIB],
+)
+def test_lazy_meta_access(algo):
+    import zlib
+
+    for r in request_generator('/', random_docs(10)):
+        r.parameters = {'k': 'v'}
+        r.header.exec_endpoint = '/foo'
+        data = r.SerializeToString()
+        req = Request(zlib.compress(data) if algo == CompressAlgo.ZLIB else data, algo)
+
+        assert req.request_id == r.request_id
+        assert req.request_type == 'DataRequestProto'
+        assert req.parameters == {'k': 'v'}
+        msg = Message(None, req, 'test', '123')
+        assert msg.envelope.header.exec_endpoint == '/foo'
+        assert msg.envelope.request_id == r.request_id
+        assert msg.envelope.request_type == 'DataRequest'
+        assert not req.is_decompressed
+        assert msg.dump()[-1] == req._buffer
+
+        assert len(req.docs) == 10
+        assert req.is_decompressed
+        assert req.request_id == r.request_id
+        assert req.parameters == {'k': 'v'}
+
+
 def test_lazy_msg_access_with_envelope():
     envelope_proto = jina_pb2.EnvelopeProto()
     envelope_proto.compression.algorithm = 'NONE'
@@ -256,3 +292,131 @@ def test_add_doc_to_type(typ, pb_typ):
         r.groundtruths.append(Document())
     assert len(r.docs) == 10
     assert len(r.groundtruths) == 10
+
+
+@pytest.mark.parametrize(
+    'sock_type, prefix',
+    [
+        (zmq.PULL, []),
+        # sent by a dealer, the router prepends the dealer id
+        (zmq.ROUTER, [b'dealer-id']),
+        # sent by a router, the receiver id is replaced by the id of the sending router
+        (zmq.ROUTER, None),
+    ],
+)
+def test_tensor_frames(mocker, sock_type, prefix):
+    mocker.patch('jina.types.message.TENSOR_FRAME_MIN_BYTES', 1024)
+    blobs = np.random.random((5, 32, 32)).astype(np.float32)
+    docs = [Document(blob=b, embedding=np.array([1.0, 2.0])) for b in blobs]
+    for d in docs:
+        d.chunks.append(Document(blob=np.zeros(512)))
+    msg = Message(None, next(request_generator('/', docs)), 'test', '123')
+
+    frames = msg.dump()
+    # one frame per blob of the root Documents and of their chunks, the embeddings are too small
+    assert len(frames) == 3 + 10
+    assert all(len(f) >= 1024 for f in frames[1:-2])
+    # the request keeps its buffers after being sent
+    np.testing.assert_equal(msg.request.docs.blobs, blobs)
+
+    frames = prefix + frames if prefix is not None else [b'router-id'] + frames[1:]
+    received = _parse_from_frames(sock_type, list(frames))
+    assert not received.request.is_decompressed
+    # an untouched request is forwarded with the frames it is received with
+    assert received.dump()[1:-2] == frames[-12:-2]
+    assert not received.request.is_decompressed
+
+    r_docs = received.request.docs
+    np.testing.assert_equal(r_docs.blobs, blobs)
+    np.testing.assert_equal(r_docs.embeddings, [[1.0, 2.0]] * 5)
+    for d in r_docs:
+        np.testing.assert_equal(d.chunks[0].blob, np.zeros(512))
+
+    # the received frames are read without being copied into the request
+    blob = r_docs[0].blob
+    assert not blob.flags.writeable
+    assert any(
+        np.shares_memory(blob, np.frombuffer(f, dtype=np.uint8)) for f in frames[-12:-2]
+    )
+
+    # a Document copied out of the request gets its own buffers
+    copied = Document(r_docs[0], copy=True)
+    serialized = Document(r_docs[1].binary_str())
+    del received, r_docs
+    gc.collect()
+    np.testing.assert_equal(copied.blob, blobs[0])
+    np.testing.assert_equal(serialized.blob, blobs[1])
+    np.testing.assert_equal(blob, blobs[0])
+
+
+def test_tensor_frames_disabled():
+    blobs = np.random.random((5, 32, 32)).astype(np.float32)
+    msg = Message(
+        None,
+        next(request_generator('/', [Document(blob=b) for b in blobs])),
+        'test',
+        '123',
+    )
+    frames = msg.dump()
+    assert len(frames) == 3
+    np.testing.assert_equal(
+        _parse_from_frames(zmq.PULL, frames).request.docs.blobs, blobs
+    )
+
+
+@pytest.mark.parametrize('compress', [CompressAlgo.NONE, CompressAlgo.ZLIB])
+def test_fork_serializes_request_once(mocker, compress):
+    msg = Message(
+        None,
+        next(request_generator('/', random_docs(10))),
+        'test',
+        '123',
+        compress=compress,
+        compress_min_bytes=0,
+        compress_min_ratio=1.0,
+    )
+    spy = mocker.spy(msg.request, '_serialize_with_tensor_frames')
+    forks = []
+    for i in range(4):
+        envelope = jina_pb2.EnvelopeProto()
+        envelope.CopyFrom(msg.envelope)
+        envelope.receiver_id = str(i)
+        forks.append(msg.fork(envelope))
+
+    dumps = [m.dump() for m in forks]
+    assert spy.call_count == 1
+    assert len({d[-1] for d in dumps}) == 1
+    for i, (m, d) in enumerate(zip(forks, dumps)):
+        assert d[0] == str(i).encode()
+        assert m.envelope.compression.algorithm == str(compress)
+        received = _parse_from_frames(zmq.PULL, d)
+        assert len(received.request.docs) == 10
+
+
+def test_message_serialize_to_string():
+    msg = Message(None, next(request_generator('/', random_docs(10))), 'test', '123')
+    envelope = jina_pb2.EnvelopeProto()
+    envelope.CopyFrom(msg.envelope)
+    envelope.receiver_id = 'fork'
+    fork = msg.fork(envelope)
+
+    for m in (msg, fork):
+        mp = jina_pb2.MessageProto()
+        mp.ParseFromString(m.SerializeToString())
+        assert mp == m.proto
+    assert fork.proto.envelope.receiver_id == 'fork'
+
+
+@pytest.mark.parametrize('timeout, expired', [(None, False), (10, False), (1e-6, True)])
+def test_deadline_exceeded(timeout, expired):
+    req = list(request_generator('/', random_docs(1), timeout=timeout))[0]
+    msg = Message(None, req, 'test', '123')
+    msg.add_route('test', '123')
+    if expired:
+        time.sleep(0.001)
+    assert msg.is_deadline_exceeded == expired
+
+    msg.add_deadline_exceeded()
+    assert msg.envelope.status.code == jina_pb2.StatusProto.DEADLINE_EXCEEDED
+    assert msg.envelope.routes[-1].status.code == jina_pb2.StatusProto.DEADLINE_EXCEEDED
+    assert msg.is_error
@@ -1,11 +1,14 @@
 import pytest
 from google.protobuf.json_format import MessageToDict, MessageToJson
 
+from jina.enums import CompressAlgo
 from jina.excepts import BadRequestType
 from jina.helper import random_identity
 from jina.proto import jina_pb2
 from jina.types.arrays.document import DocumentArray
+from jina.types.message.compression import compress
 from jina.types.request import Request, Response
+from jina.types.request.data import DataRequest
 
 
 @pytest.fixture(scope='function')
@@ -90,3 +93,80 @@ def test_as_response(req):
     assert isinstance(response, Response)
     assert isinstance(response, Request)
     assert response._pb_body == request._pb_body
+
+
+def test_quantize_embeddings():
+    import numpy as np
+    from jina import Document
+
+    embeddings = np.random.random([10, 256]).astype(np.float32)
+    request = Request().as_typed_request('data')
+    for e in embeddings:
+        d = Document(embedding=e)
+        d.matches.append(Document(embedding=e * 2))
+        request.docs.append(d)
+    request.docs.append(Document(embedding=np.array([1, 2, 3])))
+    size = request.proto.ByteSize()
+
+    request.quantize_embeddings()
+    assert request.proto.ByteSize() < size / 2
+    assert (
+        request.proto.data.docs[0].embedding.dense.quantization
+        == jina_pb2.DenseNdArrayProto.UINT8_SHARED
+    )
+
+    received = DataRequest(request.SerializeToString())
+    docs = received.docs
+    assert not received.proto.data.HasField('embedding_scale')
+    assert docs[:10].embeddings.dtype == np.float32
+    np.testing.assert_allclose(docs[:10].embeddings, embeddings, atol=1 / 255)
+    np.testing.assert_allclose(
+        docs[0].matches[0].embedding, embeddings[0] * 2, atol=2 / 255
+    )
+    np.testing.assert_equal(docs[-1].embedding, np.array([1, 2, 3]))
+
+
+def test_quantize_embeddings_on_send(mocker):
+    import numpy as np
+    from jina import Document
+
+    mocker.patch('jina.types.request.REQUEST_QUANTIZE', 'uint8')
+    request = Request().as_typed_request('data')
+    request.docs.extend(Document(embedding=np.random.random(16)) for _ in range(4))
+    embeddings = request.docs.embeddings
+
+    data = request.SerializeToString()
+    # the request keeps its original embeddings after it is sent
+    np.testing.assert_equal(request.docs.embeddings, embeddings)
+    assert not request.proto.data.HasField('embedding_scale')
+
+    received = DataRequest(data)
+    assert not received.proto.data.HasField('embedding_scale')
+    np.testing.assert_allclose(received.docs.embeddings, embeddings, atol=1 / 255)
+
+
+def test_quantized_embeddings_detached(mocker):
+    import numpy as np
+    from jina import Document, DocumentArray
+
+    mocker.patch('jina.types.request.REQUEST_QUANTIZE', 'uint8')
+    request = Request().as_typed_request('data')
+    request.docs.extend(Document(embedding=np.random.random(16)) for _ in range(4))
+    embeddings = request.docs.embeddings
+
+    received = DataRequest(request.SerializeToString())
+    detached = DocumentArray(Document(d, copy=True) for d in received.proto.data.docs)
+    np.testing.assert_allclose(detached.embeddings, embeddings, atol=1 / 255)
+    np.testing.assert_allclose(detached[0].embedding, embeddings[0], atol=1 / 255)
+
+
+def test_lazy_request_decompressed_once(req, mocker):
+    data = compress(req.SerializePartialToString(), CompressAlgo.LZ4)
+    request = Request(data, compression_algorithm=CompressAlgo.LZ4)
+    spy = mocker.spy(Request, '_decompress')
+
+    assert request.request_id == req.request_id
+    assert not request.is_decompressed
+    assert len(request.proto.data.docs) == 1
+    assert request.is_decompressed
+    assert spy.call_count == 1
@@ -1,4 +1,8 @@
-from jina.types.routing.table import RoutingTable
+import pytest
+
+from jina.excepts import BadRequestType
+from jina.proto import jina_pb2
+from jina.types.routing.table import RoutingTable, _registered_tables
 
 
 def test_single_routing():
@@ -129,3 +133,112 @@ def test_no_cycle():
     graph.active_pod = 'pod0'
 
     assert graph.is_acyclic()
+
+
+def _get_graph(port=1230):
+    graph = RoutingTable()
+    graph.add_pod('pod0', '0.0.0.0', port, port + 10, '')
+    graph.add_pod('pod1', '0.0.0.0', port + 1, port + 11, '')
+    graph.add_edge('pod0', 'pod1')
+    graph.active_pod = 'pod0'
+    return graph
+
+
+def test_routing_table_id():
+    graph = _get_graph()
+    table_id = graph.id
+    assert table_id == _get_graph().id
+    assert table_id != _get_graph(port=2230).id
+
+    # the id does not depend on the active pod, but on the pods and their edges
+    graph.active_pod = 'pod1'
+    assert graph.id == table_id
+    graph.add_edge('pod1', 'pod0')
+    assert graph.id != table_id
+
+
+def test_compact_routing_table_envelope():
+    graph = _get_graph(port=3230)
+    envelope = jina_pb2.EnvelopeProto()
+    graph.add_to_envelope(envelope)
+    assert not envelope.routing_table_ref.id
+    assert RoutingTable.from_envelope(envelope).proto == graph.proto
+
+    for target, _ in graph.get_next_targets():
+        envelope = jina_pb2.EnvelopeProto()
+        target.add_to_envelope(envelope, compact=True, with_table=False)
+        assert not envelope.HasField('routing_table')
+        assert envelope.routing_table_ref.id == graph.id
+        assert envelope.routing_table_ref.active_pod == 'pod1'
+
+        received = RoutingTable.from_envelope(envelope)
+        assert received.active_pod == 'pod1'
+        assert received.active_target_pod.expected_parts == 1
+        assert received.proto == target.proto
+
+
+def test_compact_routing_table_not_registered():
+    graph = _get_graph(port=4230)
+    envelope = jina_pb2.EnvelopeProto()
+    graph.add_to_envelope(envelope, compact=True)
+    assert envelope.HasField('routing_table')
+
+    table_id = envelope.routing_table_ref.id
+    _registered_tables.pop(table_id)
+    ref_only = jina_pb2.EnvelopeProto()
+    ref_only.routing_table_ref.CopyFrom(envelope.routing_table_ref)
+    with pytest.raises(BadRequestType):
+        RoutingTable.from_envelope(ref_only)
+
+    # the full table registers it for later messages
+    assert RoutingTable.from_envelope(envelope).proto == graph.proto
+    assert table_id in _registered_tables
+    assert RoutingTable.from_envelope(ref_only).proto == graph.proto
+
+
+def test_compact_routing_table_shares_registered_table():
+    graph = _get_graph(port=5230)
+    envelope = jina_pb2.EnvelopeProto()
+    graph.add_to_envelope(envelope, compact=True, with_table=False)
+
+    received = RoutingTable.from_envelope(envelope)
+    # only the active pod is copied, the Pods are shared with the registered table
+    assert received._pb_body is _registered_tables[graph.id]
+    assert received.active_pod == 'pod0'
+    ((target, _),) = received.get_next_targets()
+    assert target._pb_body is received._pb_body
+    assert target.active_pod == 'pod1'
+    assert received.active_pod == 'pod0'
+
+    # changing a table gives it its own copy first
+    target.add_edge('pod1', 'pod0')
+    assert target._pb_body is not _registered_tables[graph.id]
+    assert target.proto.active_pod == 'pod1'
+    assert RoutingTable.from_envelope(envelope).proto == graph.proto
+
+
+def test_compact_routing_table_missing():
+    graph = _get_graph(port=6230)
+    envelope = jina_pb2.EnvelopeProto()
+    graph.add_to_envelope(envelope, compact=True)
+    ref_only = jina_pb2.EnvelopeProto()
+    ref_only.routing_table_ref.CopyFrom(envelope.routing_table_ref)
+    assert not RoutingTable.is_missing(ref_only)
+
+    _registered_tables.pop(graph.id)
+    assert RoutingTable.is_missing(ref_only)
+    assert not RoutingTable.is_missing(envelope)
+    assert not RoutingTable.is_missing(jina_pb2.EnvelopeProto())
+
+
+def test_compact_routing_table_registered_with_target():
+    graph = _get_graph(port=7230)
+    graph.add_pod('pod2', '0.0.0.0', 7232, 7242, '', external=True)
+    graph.add_edge('pod0', 'pod2')
+    targets = {t.active_pod: t for t, _ in graph.get_next_targets()}
+    assert not targets['pod1'].is_registered_with_target
+
+    # the Flow registers its table with every Pod it starts, but not with the external ones
+    graph.register(shared=True)
+    assert targets['pod1'].is_registered_with_target
+    assert not targets['pod2'].is_registered_with_target